@@ -0,0 +1,154 @@
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List
+
+
+""" example:
+    PYTHONPATH=. python3 bench/bench_json.py
+    PYTHONPATH=. python3 bench/bench_json.py --sizes 1000 5000 --env dev
+"""
+
+
+SIZES = [500, 5000]
+
+
+# #
+# fixture
+
+def fixture(size: int, seed: int = 42) -> List[dict]:
+    """Rows shaped like RepoMission.get_by_template_name (the GET /mission payload)."""
+    from bench.generate import EMOJIS, _at, _content, _id, _name
+
+    rng = random.Random(seed)
+    today = date.today()
+
+    # 셀마다 사람이 있고, 반응은 같은 셀 사람들이 하나씩 남긴다. (bench/generate.py 와 같다)
+    users_by_cell = {
+        f"{index}셀": [(_id(rng), _name(rng)) for _ in range(rng.randint(6, 14))]
+        for index in range(1, 51)
+    }
+    cells = list(users_by_cell)
+
+    rows = []
+    for _ in range(size):
+        cell = rng.choice(cells)
+        user_id, user_name = rng.choice(users_by_cell[cell])
+        created_at = _at(rng, today - timedelta(days=rng.randint(0, 59)))
+
+        interaction, updated_at = None, None
+        others = [id for id, _ in users_by_cell[cell] if id != user_id]
+        if rng.random() <= 0.4 and others:
+            reactors = rng.sample(others, min(len(others), rng.randint(1, 8)))
+            interaction = [{"icon": rng.choice(EMOJIS), "user_id": id} for id in reactors]
+            updated_at = created_at + timedelta(hours=rng.randint(1, 12))
+
+        rows.append({
+            "mission_id": _id(rng),
+            "template_name": "daily prayer",
+            "mission_content": _content(rng),
+            "mission_created_at": created_at,
+            "mission_updated_at": updated_at,
+            "user_id": user_id,
+            "user_cell": cell,
+            "user_name": user_name,
+            "mission_interaction": interaction,
+        })
+
+    return rows
+
+
+def payload(founds: List[dict], kst: Callable) -> dict:
+    # get_missions_by_name 의 응답 모양
+    return {
+        "missions": [
+            {
+                "id": found.get("mission_id", None),
+                "name": found.get("template_name", None),
+                "content": found.get("mission_content", None),
+                "content_created_at": kst(found.get("mission_created_at")),
+                "user_id": found.get("user_id", None),
+                "user_cell": found.get("user_cell", None),
+                "user_name": found.get("user_name", None),
+                "interaction": found.get("mission_interaction", None),
+            }
+            for found in founds
+        ],
+        "count": len(founds),
+    }
+
+
+# #
+# measure
+
+def measure(call: Callable[[], bytes], repeat: int) -> dict:
+    best = float("inf")
+    body = b""
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        body = call()
+        best = min(best, time.perf_counter() - started_at)
+
+    return {"time_ms": round(best * 1000, 2), "bytes": len(body)}
+
+
+def run_case(size: int, repeat: int) -> Dict[str, dict]:
+    from fastapi.responses import JSONResponse
+
+    from grapechallenge.endpoint.common.response import ORJSONResponse
+    from grapechallenge.usecase.common.kst import kst, kst_converter
+
+    founds = fixture(size)
+
+    # 이전: 값마다 kst() 로 문자열을 만들고 stdlib json 으로 쓴다.
+    def stdlib():
+        return JSONResponse(content=payload(founds, kst)).body
+
+    # 지금: 응답마다 변환기를 한 번 만들고 datetime 은 orjson 이 바로 쓴다.
+    def orjson():
+        return ORJSONResponse(content=payload(founds, kst_converter())).body
+
+    # 두 응답은 같은 JSON 이어야 한다.
+    assert json.loads(stdlib()) == json.loads(orjson())
+
+    return {
+        "stdlib": measure(stdlib, repeat),
+        "orjson": measure(orjson, repeat),
+    }
+
+
+# #
+# cli
+
+def get_arguments():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Missions per response")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case (best is kept)")
+    parser.add_argument("--env", type=str, default="prod", choices=["dev", "prod"], help="APP_ENV (prod converts to KST)")
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = get_arguments()
+    os.environ["APP_ENV"] = args.env
+
+    for size in args.sizes:
+        results = run_case(size, args.repeat)
+        speedup = results["stdlib"]["time_ms"] / max(results["orjson"]["time_ms"], 0.01)
+
+        print(f"[{size} missions, {args.env}]")
+        for case, found in results.items():
+            print(f"  {case:<8} {found}")
+        print(f"  speedup  x{speedup:.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
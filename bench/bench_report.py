@@ -0,0 +1,203 @@
+import json
+import os
+import random
+import resource
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+
+""" example:
+    PYTHONPATH=. python3 bench/bench_report.py --save-baseline bench/report_baseline.json
+    PYTHONPATH=. python3 bench/bench_report.py --baseline bench/report_baseline.json
+    PYTHONPATH=. python3 bench/bench_report.py --sizes 10 100 --backgrounds background1.jpg
+"""
+
+
+SIZES = [10, 100, 1000]
+BACKGROUNDS = ["background1.jpg", "background2.jpg", "background3.jpg", "background4.jpg"]
+STAGES = [
+    "prepare_text_blocks", "prepare_text_blocks_cached", "paginate",
+    "render_pages", "convert_pages_to_bytes", "render_pages_to_bytes",
+]
+
+
+# #
+# fixture
+
+def fixture(size: int, seed: int = 42) -> List[dict]:
+    from bench.generate import _content, _name
+
+    rng = random.Random(seed)
+    return [
+        {"user_name": _name(rng), "mission_content": _content(rng)}
+        for _ in range(size)
+    ]
+
+
+# #
+# measure
+
+def _max_rss_mb() -> float:
+    # linux 는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(call: Callable[[], object], repeat: int) -> Tuple[object, dict]:
+    """가장 빠른 실행 시간과, python 할당 최대치(tracemalloc) / 프로세스 RSS 증가량을 잰다."""
+    result = None
+    best = float("inf")
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - started_at)
+
+    rss_before = _max_rss_mb()
+    tracemalloc.start()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, {
+        "time_ms": round(best * 1000, 2),
+        "peak_mb": round(peak / 1024 / 1024, 2),
+        "rss_growth_mb": round(_max_rss_mb() - rss_before, 2),
+    }
+
+
+def run_case(size: int, background: str, repeat: int) -> Dict[str, dict]:
+    from grapechallenge.usecase import write_daily_mission_report_helper as helper
+
+    base_dir = os.path.dirname(os.path.abspath(helper.__file__))
+    base_dir = os.path.dirname(base_dir)
+
+    # generate_report_images 와 같은 준비 과정
+    helper.CONFIG["background"] = background
+    helper.CONFIG["text_area"] = helper.BACKGROUND_CONFIGS[background]
+    text_area = helper.CONFIG["text_area"]
+
+    original_image = helper.load_prepared_background(base_dir, background, text_area)
+    assert original_image is not None, f"background not found: {background}"
+
+    width, height = original_image.size
+
+    content_font = helper.load_font(base_dir, helper.CONFIG["font_size"])
+    author_font = helper.load_font(base_dir, helper.CONFIG["author_font_size"])
+    founds = fixture(size)
+
+    stages: Dict[str, dict] = {}
+
+    def prepare_text_blocks():
+        return helper.prepare_text_blocks(
+            founds=founds,
+            content_font=content_font,
+            author_font=author_font,
+            max_width=text_area["width"],
+        )
+
+    def prepare_text_blocks_cold():
+        helper.layout_cache.clear()
+        return prepare_text_blocks()
+
+    # 레이아웃 캐시가 비어 있을 때와 채워져 있을 때를 따로 잰다.
+    text_blocks, stages["prepare_text_blocks"] = measure(prepare_text_blocks_cold, repeat)
+    text_blocks, stages["prepare_text_blocks_cached"] = measure(prepare_text_blocks, repeat)
+
+    _, stages["paginate"] = measure(lambda: helper.paginate(text_blocks), repeat)  # type: ignore
+
+    pages, stages["render_pages"] = measure(lambda: helper.render_pages(
+        text_blocks=text_blocks,  # type: ignore
+        original_image=original_image,
+        canvas_size=(width, height),
+        content_font=content_font,
+        author_font=author_font,
+    ), repeat)
+
+    _, stages["convert_pages_to_bytes"] = measure(lambda: helper.convert_pages_to_bytes(pages), repeat)  # type: ignore
+
+    # generate_report_images 가 쓰는 경로: 페이지마다 그리기와 인코딩을 한 작업으로 처리한다.
+    _, stages["render_pages_to_bytes"] = measure(lambda: helper.render_pages_to_bytes(
+        text_blocks=text_blocks,  # type: ignore
+        original_image=original_image,
+        canvas_size=(width, height),
+        content_font=content_font,
+        author_font=author_font,
+    ), repeat)
+
+    stages["render_pages"]["pages"] = len(pages)  # type: ignore
+    return stages
+
+
+# #
+# baseline
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    regressions = []
+
+    for case, stages in results.items():
+        for stage, found in stages.items():
+            before = baseline.get(case, {}).get(stage)
+            if not before:
+                continue
+
+            for key in ("time_ms", "peak_mb"):
+                # 아주 작은 값은 잡음이 커서 비교하지 않는다.
+                if before[key] >= 1 and found[key] > before[key] * (1 + threshold):
+                    regressions.append(f"{case} {stage} {key}: {before[key]} -> {found[key]}")
+
+    return regressions
+
+
+# #
+# cli
+
+def get_arguments():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Entries per report")
+    parser.add_argument("--backgrounds", type=str, nargs="+", default=BACKGROUNDS, help="Background images")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best is kept)")
+    parser.add_argument("--baseline", type=str, default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", type=str, default=None, help="Write results as a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed regression ratio")
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = get_arguments()
+
+    results: Dict[str, dict] = {}
+    for background in args.backgrounds:
+        for size in args.sizes:
+            case = f"{background}/{size}"
+            results[case] = run_case(size, background, args.repeat)
+
+            print(f"[{case}]")
+            for stage in STAGES:
+                print(f"  {stage:<28} {results[case][stage]}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Baseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+        if regressions:
+            print("\n✗ Regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+
+        print("\n✓ No regression against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
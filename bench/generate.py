@@ -0,0 +1,328 @@
+import asyncio
+import json
+import os
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+""" example:
+    PYTHONPATH=. python3 bench/generate.py --scale 3 --db
+    PYTHONPATH=. python3 bench/generate.py --scale 0.1 --out bench/data
+"""
+
+
+BATCH_SIZE = 5000
+
+# FK 순서
+TABLES = ["users", "fruit_templates", "mission_templates", "fruits", "missions"]
+
+STATUSES = [
+    "FIRST_STATUS", "SECOND_STATUS", "THIRD_STATUS", "FOURTH_STATUS",
+    "FIFTH_STATUS", "SIXTH_STATUS", "SEVENTH_STATUS",
+]
+
+EMOJIS = ["😆", "😮", "💪", "🙏", "👏"]
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서지현우진수영하윤도준예은성연채원주호유나경태희승아동"
+
+MISSION_TEMPLATES = [
+    ("bible_reading", "오늘의 말씀을 읽고 묵상을 남겨보세요", "NORMAL"),
+    ("prayer", "오늘 드린 기도를 나눠보세요", "NORMAL"),
+    ("gratitude", "오늘 감사한 일을 적어보세요", "NORMAL"),
+    ("christmas_letter", "성탄을 맞아 셀원에게 편지를 남겨보세요", "EVENT"),
+]
+
+FRUIT_TEMPLATES = [
+    ("포도", "NORMAL"),
+    ("성탄 포도", "EVENT"),
+]
+
+SENTENCES = [
+    "오늘 말씀을 읽으면서 마음이 따뜻해졌습니다.",
+    "바쁜 하루였지만 잠깐이라도 기도할 수 있어서 감사했어요.",
+    "셀 모임에서 나눈 이야기가 계속 생각이 나서 다시 묵상했습니다.",
+    "출근길에 말씀 한 구절을 붙잡고 하루를 시작했습니다.",
+    "가족과 함께 저녁을 먹으며 서로의 하루를 나눌 수 있어 감사합니다.",
+    "요즘 마음이 조급했는데 기다림에 대해 다시 생각해 보게 되었어요.",
+    "시험 기간이라 지치지만 끝까지 성실하게 준비하고 싶습니다.",
+    "친구에게 먼저 연락해서 안부를 물었는데 오히려 제가 위로를 받았어요.",
+    "작은 일에도 감사하는 연습을 하루 종일 해 보았습니다.",
+    "말씀 속 인물의 순종이 어떻게 가능했는지 오래 생각했습니다.",
+    "아픈 동생을 위해 기도했고 오늘은 조금 나아졌다고 해서 감사해요.",
+    "내일은 오늘보다 조금 더 너그러운 사람이 되고 싶습니다.",
+]
+
+
+@dataclass(frozen=True)
+class Scale:
+    users: int
+    cells: int
+    days: int
+    event_days: int
+
+    @classmethod
+    def of(cls, factor: float, days: int = 60) -> "Scale":
+        users = max(1, int(1000 * factor))
+        return cls(
+            users=users,
+            cells=max(1, users // 20),
+            days=days,
+            event_days=min(days, 10),
+        )
+
+
+def _id(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def _at(rng: random.Random, day: date) -> datetime:
+    # 대부분 저녁 시간대에 기록한다.
+    hour = min(23, max(6, int(rng.gauss(21, 2.5))))
+    return datetime.combine(day, time(hour, rng.randint(0, 59), rng.randint(0, 59)))
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + "".join(rng.choice(GIVEN) for _ in range(2))
+
+
+def _content(rng: random.Random) -> str:
+    # 한두 문장부터 긴 묵상까지, 1000자 제한 안에서
+    count = min(12, max(1, int(rng.expovariate(1 / 3)) + 1))
+    return " ".join(rng.choice(SENTENCES) for _ in range(count))[:1000]
+
+
+# #
+# rows
+
+def generate(
+    scale: float = 1.0,
+    seed: int = 42,
+    days: int = 60,
+    until: Optional[date] = None
+) -> Dict[str, List[dict]]:
+    rng = random.Random(seed)
+    size = Scale.of(scale, days=days)
+    until = until or datetime.now().date()
+    first_day = until - timedelta(days=size.days - 1)
+    created_at = datetime.combine(first_day - timedelta(days=1), time(9))
+
+    fruit_templates = [
+        {
+            "id": _id(rng), "name": name, "type": type,
+            **{
+                f"{order}_status": f"/images/fruit/{type.lower()}/{index + 1}.png"
+                for index, order in enumerate(["first", "second", "third", "fourth", "fifth", "sixth", "seventh"])
+            },
+            "created_at": created_at,
+        }
+        for name, type in FRUIT_TEMPLATES
+    ]
+    normal_fruit_template = fruit_templates[0]
+
+    mission_templates = [
+        {"id": _id(rng), "name": name, "content": content, "type": type, "created_at": created_at}
+        for name, content, type in MISSION_TEMPLATES
+    ]
+    normal_templates = [template for template in mission_templates if template["type"] == "NORMAL"]
+    event_templates = [template for template in mission_templates if template["type"] == "EVENT"]
+
+    # cells / users (셀 안에서 이름은 겹치지 않는다)
+    cell_names = []
+    for _ in range(size.cells):
+        leader = _name(rng)
+        while f"{leader}셀" in cell_names:
+            leader = _name(rng)
+        cell_names.append(f"{leader}셀")
+
+    users: List[dict] = []
+    names_by_cell: Dict[str, set] = {cell: set() for cell in cell_names}
+    for index in range(size.users):
+        cell = cell_names[index % size.cells]
+        name = _name(rng)
+        while name in names_by_cell[cell]:
+            name = _name(rng)
+        names_by_cell[cell].add(name)
+        users.append({
+            "id": _id(rng), "cell": cell, "name": name,
+            "participated_at": None, "created_at": created_at,
+        })
+
+    users_by_cell: Dict[str, List[str]] = {}
+    for user in users:
+        users_by_cell.setdefault(user["cell"], []).append(user["id"])
+
+    # fruit lifecycle: 미션 하나마다 한 단계씩 자라고, SEVENTH 이후 수확한다.
+    fruits: List[dict] = []
+    missions: List[dict] = []
+
+    for user in users:
+        engagement = rng.betavariate(2, 2)
+        fruit: Optional[dict] = None
+        grown = 0
+
+        for offset in range(size.days):
+            day = first_day + timedelta(days=offset)
+            if rng.random() > engagement:
+                continue
+
+            if fruit and grown >= len(STATUSES) - 1:
+                fruit["status"] = "COMPLETED"
+                fruit["updated_at"] = _at(rng, day)
+                fruit = None
+
+            if fruit is None:
+                fruit = {
+                    "id": _id(rng), "user_id": user["id"], "template_id": normal_fruit_template["id"],
+                    "status": STATUSES[0], "created_at": _at(rng, day), "updated_at": None,
+                }
+                fruits.append(fruit)
+                grown = 0
+
+                # 열매만 만들고 그날은 미션을 하지 않는 경우도 있다.
+                if rng.random() < 0.15:
+                    continue
+
+            templates = rng.sample(normal_templates, rng.randint(1, len(normal_templates)))
+            if offset >= size.days - size.event_days and rng.random() < 0.5:
+                templates += event_templates
+
+            for template in templates:
+                is_event = template["type"] == "EVENT"
+                mission_at = max(_at(rng, day), fruit["created_at"])
+                missions.append({
+                    "id": _id(rng),
+                    "user_id": user["id"],
+                    "template_id": template["id"],
+                    "fruit_id": None if is_event else fruit["id"],
+                    "content": _content(rng) if rng.random() < 0.9 else None,
+                    "interaction": None,
+                    "created_at": mission_at,
+                    "updated_at": None,
+                })
+
+                if not is_event and grown < len(STATUSES) - 1:
+                    grown += 1
+                    fruit["status"] = STATUSES[grown]
+                    fruit["updated_at"] = mission_at
+
+                if user["participated_at"] is None or mission_at < user["participated_at"]:
+                    user["participated_at"] = mission_at
+
+    # reactions: 같은 셀 사람들이 남긴다. (한 사람당 하나)
+    cell_by_user = {user["id"]: user["cell"] for user in users}
+    for mission in missions:
+        if rng.random() > 0.4:
+            continue
+
+        others = [id for id in users_by_cell[cell_by_user[mission["user_id"]]] if id != mission["user_id"]]
+        if not others:
+            continue
+
+        reactors = rng.sample(others, min(len(others), rng.randint(1, 8)))
+        mission["interaction"] = [{"icon": rng.choice(EMOJIS), "user_id": id} for id in reactors]
+        mission["updated_at"] = mission["created_at"] + timedelta(hours=rng.randint(1, 12))
+
+    return {
+        "users": users,
+        "fruit_templates": fruit_templates,
+        "mission_templates": mission_templates,
+        "fruits": fruits,
+        "missions": missions,
+    }
+
+
+# #
+# output
+
+def write_files(rows: Dict[str, List[dict]], directory: str):
+    os.makedirs(directory, exist_ok=True)
+
+    for table in TABLES:
+        path = os.path.join(directory, f"{table}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows[table]:
+                f.write(json.dumps(row, ensure_ascii=False, default=lambda value: value.isoformat()) + "\n")
+        print(f"✓ Wrote {table}: {len(rows[table])} -> {path}")
+
+
+async def write_db(rows: Dict[str, List[dict]]):
+    from unittest.mock import MagicMock
+    from sqlalchemy import insert
+    from grapechallenge.database.database import transactional_session_helper
+    from grapechallenge.domain.user.repo_user import UserModel
+    from grapechallenge.domain.fruit_template.repo_fruit_template import FruitTemplateModel
+    from grapechallenge.domain.mission_template.repo_mission_template import MissionTemplateModel
+    from grapechallenge.domain.fruit.repo_fruit import FruitModel
+    from grapechallenge.domain.mission.repo_mission import MissionModel
+    from grapechallenge.usecase import (
+        RebuildUserStatsInput, rebuild_user_stats,
+        ReconcileUserCountInput, reconcile_user_count,
+    )
+
+    models = {
+        "users": UserModel,
+        "fruit_templates": FruitTemplateModel,
+        "mission_templates": MissionTemplateModel,
+        "fruits": FruitModel,
+        "missions": MissionModel,
+    }
+
+    for table in TABLES:
+        data_list = rows[table]
+        for start in range(0, len(data_list), BATCH_SIZE):
+            async with transactional_session_helper() as session:
+                await session.execute(insert(models[table].__table__), data_list[start:start + BATCH_SIZE])
+        print(f"✓ Inserted {table}: {len(data_list)}")
+
+    # 유지되는 집계(user_stats, counters)를 맞춘다.
+    async with transactional_session_helper() as session:
+        await rebuild_user_stats(session=session, request=MagicMock(), input=RebuildUserStatsInput())
+        await reconcile_user_count(session=session, request=MagicMock(), input=ReconcileUserCountInput())
+    print("✓ Rebuilt user_stats and counters")
+
+
+# #
+# cli
+
+def get_arguments():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0, help="1.0 = 1000 users over 50 cells")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--days", type=int, default=60, help="Days of history")
+    parser.add_argument("--until", type=str, default=None, help="Last day of history (YYYY-MM-DD, default: today)")
+    parser.add_argument("--db", action="store_true", help="Bulk insert into the configured database")
+    parser.add_argument("--out", type=str, default=None, help="Directory to write <table>.jsonl files to")
+
+    return parser.parse_args()
+
+
+async def main():
+    args = get_arguments()
+
+    rows = generate(
+        scale=args.scale,
+        seed=args.seed,
+        days=args.days,
+        until=date.fromisoformat(args.until) if args.until else None
+    )
+    print({table: len(rows[table]) for table in TABLES})
+
+    if args.out:
+        write_files(rows, args.out)
+
+    if args.db:
+        await write_db(rows)
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    os.environ.setdefault("APP_ENV", "dev")
+    asyncio.run(main())
@@ -0,0 +1,262 @@
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+
+""" example:
+    PYTHONPATH=. python3 bench/load.py --seed --base-url http://localhost:8000
+    PYTHONPATH=. python3 bench/load.py --baseline bench/baseline.json
+    PYTHONPATH=. python3 bench/load.py --save-baseline bench/baseline.json
+"""
+
+
+@dataclass
+class Client:
+    http: httpx.AsyncClient
+    cell: str
+    name: str
+    fruit_id: Optional[str] = None
+
+
+@dataclass
+class Scenario:
+    name: str
+    requests: int
+    call: Callable[[Client], Awaitable[httpx.Response]]
+
+
+@dataclass
+class Result:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> dict:
+        return {
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "p99_ms": round(self.percentile(99) * 1000, 2),
+            "throughput_rps": round(len(self.latencies) / self.elapsed, 2) if self.elapsed else 0.0,
+        }
+
+
+# #
+# scenario
+
+def scenarios(requests: int, mission_name: str) -> List[Scenario]:
+    today = datetime.now().date()
+
+    async def fruit_in_progress(client: Client) -> httpx.Response:
+        return await client.http.get("/fruit/in-progress")
+
+    async def mission_complete(client: Client) -> httpx.Response:
+        return await client.http.post("/mission/complete", json={
+            "fruit_id": client.fruit_id,
+            "name": mission_name,
+            "content": "벤치마크로 남기는 묵상입니다.",
+        })
+
+    async def mission(client: Client) -> httpx.Response:
+        return await client.http.get("/mission", params={"name": mission_name, "date": "today"})
+
+    async def fruits_cell(client: Client) -> httpx.Response:
+        return await client.http.post("/fruits/cell", json={"cell": client.cell, "status": "COMPLETED"})
+
+    async def grove_separate(client: Client) -> httpx.Response:
+        # 과수원 페이지가 /grove/bootstrap 이전에 보내던 요청들 (브라우저처럼 동시에)
+        responses = await asyncio.gather(
+            client.http.get("/fruit/in-progress"),
+            client.http.get("/fruits/mine", params={"status": "COMPLETED"}),
+            client.http.get("/cells"),
+            client.http.post("/fruits/cell", json={"cell": client.cell, "status": "COMPLETED"}),
+        )
+        return max(responses, key=lambda response: response.status_code)
+
+    async def grove_bootstrap(client: Client) -> httpx.Response:
+        return await client.http.get("/grove/bootstrap", params={"cell": client.cell})
+
+    async def mission_report_daily(client: Client) -> httpx.Response:
+        return await client.http.get("/mission/report/daily", params={
+            "mission_name": mission_name,
+            "start_date": (today - timedelta(days=1)).isoformat(),
+            "end_date": today.isoformat(),
+        })
+
+    return [
+        Scenario("GET /fruit/in-progress", requests, fruit_in_progress),
+        Scenario("POST /mission/complete", requests, mission_complete),
+        Scenario("GET /mission", requests, mission),
+        Scenario("POST /fruits/cell", requests, fruits_cell),
+        # 같은 데이터를 4번의 요청으로 받을 때와 한 번에 받을 때
+        Scenario("GROVE x4 requests", requests, grove_separate),
+        Scenario("GET /grove/bootstrap", requests, grove_bootstrap),
+        # 리포트는 이미지를 만들기 때문에 요청 수를 줄인다.
+        Scenario("GET /mission/report/daily", max(1, requests // 20), mission_report_daily),
+    ]
+
+
+async def run_scenario(scenario: Scenario, clients: List[Client], concurrency: int) -> Result:
+    result = Result(name=scenario.name)
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(scenario.requests):
+        queue.put_nowait(clients[index % len(clients)])
+
+    async def worker():
+        while True:
+            try:
+                client = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            started_at = time.perf_counter()
+            try:
+                response = await scenario.call(client)
+                if response.status_code >= 400:
+                    result.errors += 1
+            except httpx.HTTPError:
+                result.errors += 1
+            result.latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    result.elapsed = time.perf_counter() - started_at
+
+    return result
+
+
+# #
+# client
+
+async def login_clients(base_url: str, users: List[dict], count: int, timeout: float) -> List[Client]:
+    clients = []
+
+    for user in users[:count]:
+        http = httpx.AsyncClient(base_url=base_url, timeout=timeout)
+        response = await http.post("/login", json={"cell": user["cell"], "name": user["name"]})
+        if response.status_code != 200:
+            await http.aclose()
+            continue
+
+        client = Client(http=http, cell=user["cell"], name=user["name"])
+        found = (await http.get("/fruit/in-progress")).json().get("fruit")
+        client.fruit_id = found.get("fruit_id") if found else None
+        clients.append(client)
+
+    return clients
+
+
+# #
+# baseline
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    regressions = []
+
+    for name, summary in results.items():
+        found = baseline.get(name)
+        if not found:
+            continue
+
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if found[key] and summary[key] > found[key] * (1 + tolerance):
+                regressions.append(f"{name} {key}: {found[key]} -> {summary[key]}")
+
+        if found["throughput_rps"] and summary["throughput_rps"] < found["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name} throughput_rps: {found['throughput_rps']} -> {summary['throughput_rps']}")
+
+    return regressions
+
+
+# #
+# cli
+
+def get_arguments():
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", type=str, default="http://localhost:8000", help="Server to drive")
+    parser.add_argument("--seed", action="store_true", help="Seed the local database before running")
+    parser.add_argument("--scale", type=float, default=3.0, help="Data scale factor (see bench/generate.py)")
+    parser.add_argument("--data-seed", type=int, default=42, help="Data generator seed")
+    parser.add_argument("--clients", type=int, default=50, help="Logged-in clients")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent requests per scenario")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--mission-name", type=str, default="bible_reading", help="Mission template name")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument("--baseline", type=str, default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", type=str, default=None, help="Write results as a new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression ratio")
+
+    return parser.parse_args()
+
+
+async def main() -> int:
+    from bench.generate import generate, write_db
+
+    args = get_arguments()
+
+    # 같은 seed 면 같은 사용자 목록이 나오므로 시드 없이 실행해도 로그인할 수 있다.
+    rows = generate(scale=args.scale, seed=args.data_seed)
+    if args.seed:
+        await write_db(rows)
+
+    users = random.Random(0).sample(rows["users"], min(args.clients, len(rows["users"])))
+    clients = await login_clients(args.base_url, users, args.clients, args.timeout)
+    if not clients:
+        print("✗ No client could log in (did you run with --seed?)")
+        return 1
+    print(f"✓ Logged in {len(clients)} clients\n")
+
+    results: Dict[str, dict] = {}
+    try:
+        for scenario in scenarios(args.requests, args.mission_name):
+            result = await run_scenario(scenario, clients, args.concurrency)
+            results[scenario.name] = result.summary()
+            print(f"[{scenario.name}] {results[scenario.name]}")
+    finally:
+        for client in clients:
+            await client.http.aclose()
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Baseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+        if regressions:
+            print("\n✗ Regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+
+        print("\n✓ No regression against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    os.environ.setdefault("APP_ENV", "dev")
+    raise SystemExit(asyncio.run(main()))
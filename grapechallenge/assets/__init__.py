@@ -0,0 +1,11 @@
+# bundle
+from .bundle import build, load_manifest, static_url, minify_js, minify_css, DIST_PATH, MANIFEST
+
+# serve
+from .static import PrecompressedStaticFiles, IMMUTABLE
+
+# image
+from .image import derivative, image_url, image_srcset, build_images
+
+# page
+from .page import Shell, ShellCache, create_environment, compile_templates
@@ -0,0 +1,14 @@
+from grapechallenge.assets.bundle import main
+from grapechallenge.assets.image import build_images, CACHE_PATH
+from grapechallenge.assets.page import compile_templates, create_environment, BYTECODE_PATH
+
+
+if __name__ == "__main__":
+    main()
+
+    count = build_images()
+    print(f"✓ Built {count} image derivatives -> {CACHE_PATH}")
+
+    # 번들을 만든 뒤에 컴파일해야 static_url 이 해시된 경로를 가리킨다.
+    count = compile_templates(create_environment())
+    print(f"✓ Compiled {count} templates -> {BYTECODE_PATH}")
@@ -0,0 +1,302 @@
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 .gz 만 만든다.
+    brotli = None
+
+
+""" example:
+    PYTHONPATH=. python3 -m grapechallenge.assets
+"""
+
+
+TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "template"
+DIST_PATH = TEMPLATE_PATH / "dist"
+MANIFEST = "manifest.json"
+
+# 빌드/실행 중에 만들어지는 캐시 (build() 가 dist 를 지워도 남고, template 밖이라 mount 되지 않는다)
+CACHE_ROOT = TEMPLATE_PATH.parent / "cache"
+
+# 번들로 만들 디렉토리 (components 는 js 와 서로 import 한다)
+SOURCES = ["js", "components", "css"]
+
+# 서버에 mount 된 경로 -> template 기준 경로
+MOUNTS = {"/static/": "", "/js/": "js/", "/components/": "components/", "/css/": "css/"}
+
+IMPORT_PATTERN = re.compile(r"""(\bfrom\s*|\bimport\s*\(?\s*)(['"])([^'"\n]+\.js)\2""")
+
+# 이 문자 뒤의 / 는 나눗셈이 아니라 정규식의 시작이다.
+REGEX_PREFIX = set("(,=:[!&|?{};+-*%<>~^")
+
+
+# #
+# minify
+
+def minify_js(source: str) -> str:
+    """Strip comments, indentation and blank lines.
+
+    Strings, template literals and regex literals are copied as-is, and line
+    breaks are kept so automatic semicolon insertion behaves the same.
+    """
+    out: List[str] = []
+    # template literal 안의 ${ } 깊이
+    braces: List[int] = []
+    index, length = 0, len(source)
+    line_start = True
+    last = ""
+
+    def emit_newline():
+        nonlocal line_start
+        while out and out[-1] in (" ", "\t"):
+            out.pop()
+        if out and out[-1] != "\n":
+            out.append("\n")
+        line_start = True
+
+    def copy_template(index: int) -> int:
+        # 여는 ` 다음부터 닫는 ` 또는 ${ 까지 그대로 옮긴다.
+        while index < length:
+            char = source[index]
+            out.append(char)
+            if char == "\\":
+                out.append(source[index + 1])
+                index += 2
+                continue
+            if char == "`":
+                return index + 1
+            if char == "$" and source[index + 1:index + 2] == "{":
+                out.append("{")
+                braces.append(0)
+                return index + 2
+            index += 1
+        return index
+
+    while index < length:
+        char = source[index]
+        pair = source[index:index + 2]
+
+        if char == "\n":
+            emit_newline()
+            index += 1
+            continue
+
+        if char in " \t\r":
+            if not line_start and out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            index += 1
+            continue
+
+        if pair == "//":
+            end = source.find("\n", index)
+            index = length if end == -1 else end
+            continue
+
+        if pair == "/*":
+            end = source.find("*/", index + 2)
+            end = length if end == -1 else end + 2
+            if "\n" in source[index:end]:
+                emit_newline()
+            index = end
+            continue
+
+        line_start = False
+
+        if char in ("'", '"'):
+            end = index + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == "\\" else 1
+            out.append(source[index:end + 1])
+            index = end + 1
+            last = char
+            continue
+
+        if char == "`":
+            out.append(char)
+            index = copy_template(index + 1)
+            last = char
+            continue
+
+        if char == "/" and (not last or last in REGEX_PREFIX or re.search(r"\b(return|typeof|case|in|of)$", "".join(out[-8:]).rstrip())):
+            end = index + 1
+            in_class = False
+            while end < length and (in_class or source[end] != "/"):
+                if source[end] == "\\":
+                    end += 1
+                elif source[end] == "[":
+                    in_class = True
+                elif source[end] == "]":
+                    in_class = False
+                end += 1
+            end += 1
+            while end < length and source[end].isalpha():
+                end += 1
+            out.append(source[index:end])
+            index = end
+            last = "/"
+            continue
+
+        if braces:
+            if char == "{":
+                braces[-1] += 1
+            elif char == "}":
+                if braces[-1] == 0:
+                    braces.pop()
+                    out.append(char)
+                    index = copy_template(index + 1)
+                    last = "`"
+                    continue
+                braces[-1] -= 1
+
+        out.append(char)
+        index += 1
+        last = char
+
+    emit_newline()
+    return "".join(out).lstrip("\n")
+
+
+def minify_css(source: str) -> str:
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    lines = [line.strip() for line in source.splitlines()]
+    return "\n".join(line for line in lines if line) + "\n"
+
+
+# #
+# build
+
+def _resolve(importer: str, specifier: str) -> Optional[str]:
+    for prefix, base in MOUNTS.items():
+        if specifier.startswith(prefix):
+            return base + specifier[len(prefix):]
+
+    if specifier.startswith("."):
+        return posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))
+
+    return None
+
+
+def _hashed(path: str, content: bytes) -> str:
+    digest = hashlib.sha256(content).hexdigest()[:10]
+    stem, ext = posixpath.splitext(path)
+    return f"{stem}.{digest}{ext}"
+
+
+def _write(path: Path, content: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    with open(f"{path}.gz", "wb") as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(f"{path}.br", "wb") as f:
+            f.write(brotli.compress(content, quality=11))
+
+
+def build(template_path: Path = TEMPLATE_PATH, dist_path: Path = DIST_PATH) -> Dict[str, str]:
+    """Write minified, content-hashed and pre-compressed copies of the js/css sources.
+
+    Imports are rewritten to the hashed file names, so a dependency is emitted
+    (and hashed) before the modules that import it.
+    """
+    sources: Dict[str, str] = {}
+    for directory in SOURCES:
+        for path in sorted((template_path / directory).rglob("*")):
+            if path.suffix in (".js", ".css"):
+                sources[path.relative_to(template_path).as_posix()] = path.read_text(encoding="utf-8")
+
+    if dist_path.exists():
+        shutil.rmtree(dist_path)
+
+    manifest: Dict[str, str] = {}
+    visiting: List[str] = []
+
+    def emit(path: str) -> str:
+        if path in manifest:
+            return manifest[path]
+        if path in visiting:
+            raise ValueError(f"Circular import: {' -> '.join(visiting + [path])}")
+        if path not in sources:
+            raise ValueError(f"Unknown import: {path} (from {visiting[-1] if visiting else '-'})")
+
+        visiting.append(path)
+
+        if path.endswith(".css"):
+            content = minify_css(sources[path])
+        else:
+            def rewrite(match: re.Match) -> str:
+                target = _resolve(path, match.group(3))
+                if target is None:
+                    return match.group(0)
+
+                relative = posixpath.relpath(emit(target), posixpath.dirname(path))
+                if not relative.startswith("."):
+                    relative = f"./{relative}"
+                return f"{match.group(1)}{match.group(2)}{relative}{match.group(2)}"
+
+            content = IMPORT_PATTERN.sub(rewrite, minify_js(sources[path]))
+
+        visiting.pop()
+
+        data = content.encode("utf-8")
+        manifest[path] = _hashed(path, data)
+        _write(dist_path / manifest[path], data)
+
+        return manifest[path]
+
+    for path in sources:
+        emit(path)
+
+    (dist_path / MANIFEST).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    load_manifest.cache_clear()
+
+    return manifest
+
+
+# #
+# url
+
+@lru_cache(maxsize=1)
+def load_manifest() -> Dict[str, str]:
+    path = DIST_PATH / MANIFEST
+    if not path.exists():
+        return {}
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def static_url(path: str) -> str:
+    """Hashed bundle URL when assets were built, the source file otherwise."""
+    path = path.lstrip("/")
+
+    found = load_manifest().get(path)
+    if found is None:
+        return f"/static/{path}"
+
+    return f"/dist/{found}"
+
+
+# #
+# cli
+
+def main():
+    manifest = build()
+
+    before = sum((TEMPLATE_PATH / path).stat().st_size for path in manifest)
+    after = sum((DIST_PATH / path).stat().st_size for path in manifest.values())
+    compressed = sum(os.path.getsize(f"{DIST_PATH / path}.gz") for path in manifest.values())
+
+    print(f"✓ Built {len(manifest)} assets -> {DIST_PATH}")
+    print(f"  source {before} bytes, minified {after} bytes, gzip {compressed} bytes")
+    if brotli is None:
+        print("  (brotli is not installed: .br files were skipped)")
+
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, features
+
+from grapechallenge.assets.bundle import CACHE_ROOT, TEMPLATE_PATH
+
+
+IMAGES_PATH = TEMPLATE_PATH / "images"
+CACHE_PATH = CACHE_ROOT / "images"
+
+# 휴대폰 화면 폭 기준 (srcset 후보)
+WIDTHS = (480, 768, 1080, 1440)
+
+# Accept 헤더에 있으면 이 순서대로 고른다.
+FORMATS = [
+    ("image/avif", "avif", "AVIF"),
+    ("image/webp", "webp", "WEBP"),
+]
+
+# 어떤 형식도 받지 않는 브라우저용 (webp 원본은 투명도를 위해 png 로)
+FALLBACK = {
+    ".jpg": ("image/jpeg", "jpg", "JPEG"),
+    ".jpeg": ("image/jpeg", "jpg", "JPEG"),
+    ".png": ("image/png", "png", "PNG"),
+    ".webp": ("image/png", "png", "PNG"),
+}
+
+SAVE_OPTIONS: Dict[str, dict] = {
+    "AVIF": {"quality": 55},
+    "WEBP": {"quality": 78, "method": 4},
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+}
+
+_locks: Dict[str, Lock] = {}
+_locks_lock = Lock()
+
+
+# #
+# source
+
+def source_path(name: str) -> Optional[Path]:
+    """The original under template/images, or None for unknown/unsafe names."""
+    if os.path.basename(name) != name or Path(name).suffix.lower() not in FALLBACK:
+        return None
+
+    path = IMAGES_PATH / name
+    if not path.is_file():
+        return None
+
+    return path
+
+
+@lru_cache(maxsize=64)
+def _version(path: Path, mtime: float) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:8]
+
+
+def version(path: Path) -> str:
+    # 원본이 바뀌면 mtime 이 바뀌어 다시 계산한다.
+    return _version(path, path.stat().st_mtime)
+
+
+@lru_cache(maxsize=64)
+def _size(path: Path, mtime: float) -> Tuple[int, int]:
+    with Image.open(path) as image:
+        return image.size
+
+
+def widths(path: Path) -> List[int]:
+    """Derivative widths for an image (never wider than the original)."""
+    width, _ = _size(path, path.stat().st_mtime)
+    candidates = [candidate for candidate in WIDTHS if candidate < width]
+
+    # 원본이 가장 큰 후보보다 작으면 원본 폭이 마지막 후보다.
+    if len(candidates) < len(WIDTHS):
+        candidates.append(width)
+
+    return candidates
+
+
+def snap_width(path: Path, width: Optional[int]) -> int:
+    # 임의의 폭마다 파일이 생기지 않도록 가까운 후보로 올린다.
+    candidates = widths(path)
+    if width is None:
+        return candidates[-1]
+
+    for candidate in candidates:
+        if candidate >= width:
+            return candidate
+
+    return candidates[-1]
+
+
+def negotiate(path: Path, accept: str) -> Tuple[str, str, str]:
+    """(media type, extension, Pillow format) for the best format the client accepts."""
+    for media_type, ext, format in FORMATS:
+        if media_type in accept and features.check(ext):
+            return media_type, ext, format
+
+    return FALLBACK[path.suffix.lower()]
+
+
+# #
+# derivative
+
+def _render(image: Image.Image, width: int, format: str, target: Path):
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+    if format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # 다른 요청이 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 옮긴다.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, format=format, **SAVE_OPTIONS[format])
+        os.replace(temp, target)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def cache_path(path: Path, width: int, ext: str) -> Path:
+    return CACHE_PATH / f"{path.stem}-{width}-{version(path)}.{ext}"
+
+
+def derivative(name: str, width: Optional[int], accept: str) -> Optional[Tuple[Path, str]]:
+    """Path and media type of the resized/re-encoded image, generated on first use."""
+    path = source_path(name)
+    if path is None:
+        return None
+
+    width = snap_width(path, width)
+    media_type, ext, format = negotiate(path, accept)
+    target = cache_path(path, width, ext)
+
+    if target.exists():
+        return target, media_type
+
+    with _locks_lock:
+        lock = _locks.setdefault(str(target), Lock())
+
+    with lock:
+        if not target.exists():
+            with Image.open(path) as image:
+                image.load()
+                _render(image, width, format, target)
+
+    return target, media_type
+
+
+def build_images() -> int:
+    """Pre-generate every derivative (all widths x formats) for the deploy build."""
+    count = 0
+
+    for path in sorted(IMAGES_PATH.iterdir()):
+        if source_path(path.name) is None:
+            continue
+
+        formats = [(ext, format) for _, ext, format in FORMATS if features.check(ext)]
+        formats.append(FALLBACK[path.suffix.lower()][1:])
+
+        # 큰 원본은 한 번만 읽는다.
+        with Image.open(path) as image:
+            image.load()
+            for width in widths(path):
+                for ext, format in formats:
+                    target = cache_path(path, width, ext)
+                    if not target.exists():
+                        _render(image, width, format, target)
+                    count += 1
+
+    return count
+
+
+# #
+# url
+
+def image_url(name: str, width: Optional[int] = None) -> str:
+    path = source_path(name)
+    if path is None:
+        return f"/images/{name}"
+
+    width = snap_width(path, width)
+    return f"/img/{name}?w={width}&v={version(path)}"
+
+
+def image_srcset(name: str) -> str:
+    path = source_path(name)
+    if path is None:
+        return ""
+
+    return ", ".join(f"{image_url(name, width)} {width}w" for width in widths(path))
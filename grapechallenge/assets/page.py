@@ -0,0 +1,90 @@
+import hashlib
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Tuple
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from grapechallenge.assets.bundle import CACHE_ROOT, TEMPLATE_PATH, static_url
+from grapechallenge.assets.image import image_srcset, image_url
+
+
+# 컴파일된 템플릿 (프로세스가 다시 떠도 파싱/컴파일을 건너뛴다)
+BYTECODE_PATH = CACHE_ROOT / "jinja"
+
+# 로그인 사용자와 무관한 페이지 골격 (사용자 정보는 쿠키/API 로 클라이언트가 채운다)
+PAGES = [
+    "login.html", "login_christmas.html",
+    "home.html", "home_christmas.html",
+    "grove.html", "diary.html", "diary_christmas.html",
+    "report.html", "admin.html",
+]
+
+
+def create_environment() -> Environment:
+    BYTECODE_PATH.mkdir(parents=True, exist_ok=True)
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_PATH)),
+        autoescape=select_autoescape(),
+        bytecode_cache=FileSystemBytecodeCache(str(BYTECODE_PATH)),
+    )
+    env.globals["static_url"] = static_url
+    env.globals["image_url"] = image_url
+    env.globals["image_srcset"] = image_srcset
+
+    return env
+
+
+def compile_templates(env: Environment) -> int:
+    """Load every page once so its bytecode is written to the cache."""
+    for name in PAGES:
+        env.get_template(name)
+
+    return len(PAGES)
+
+
+# #
+# shell
+
+@dataclass(frozen=True)
+class Shell:
+    body: bytes
+    etag: str
+    template: Template
+
+
+class ShellCache:
+    """Rendered pages keyed by template and context (e.g. app_env).
+
+    A shell is re-rendered only when its template file changes (one stat per hit).
+    """
+
+    def __init__(self, env: Environment):
+        self.env = env
+        self._shells: Dict[Tuple, Shell] = {}
+        self._lock = Lock()
+
+    def get(self, name: str, **context: str) -> Shell:
+        key = (name, *sorted(context.items()))
+
+        found = self._shells.get(key)
+        if found is not None and found.template.is_up_to_date:
+            return found
+
+        template = self.env.get_template(name)
+        body = template.render(**context).encode("utf-8")
+        shell = Shell(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()[:16]}"',
+            template=template,
+        )
+
+        with self._lock:
+            self._shells[key] = shell
+
+        return shell
+
+    def clear(self):
+        with self._lock:
+            self._shells.clear()
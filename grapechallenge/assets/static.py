@@ -0,0 +1,49 @@
+import stat
+from mimetypes import guess_type
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+
+# 파일 이름에 내용 해시가 들어가므로 한 번 받은 파일은 바뀌지 않는다.
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Serve built bundles, preferring the .br/.gz file written next to each one."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = request_headers.get("accept-encoding", "")
+
+        if scope["method"] in ("GET", "HEAD"):
+            for encoding, suffix in ENCODINGS:
+                if encoding not in accepted:
+                    continue
+
+                try:
+                    full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+                except (OSError, ValueError):
+                    break
+
+                if stat_result and stat.S_ISREG(stat_result.st_mode):
+                    response = FileResponse(
+                        full_path,
+                        stat_result=stat_result,
+                        media_type=guess_type(path)[0] or "application/octet-stream",
+                        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding", "Cache-Control": IMMUTABLE},
+                    )
+                    if self.is_not_modified(response.headers, request_headers):
+                        return NotModifiedResponse(response.headers)
+                    return response
+
+        response = await super().get_response(path, scope)
+        response.headers["Cache-Control"] = IMMUTABLE
+        response.headers["Vary"] = "Accept-Encoding"
+
+        return response
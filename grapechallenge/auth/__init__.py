@@ -0,0 +1,5 @@
+# store
+from .session import SessionStore, InMemorySessionStore, get_session_store, set_session_store
+
+# token
+from .session import SessionToken, unsign_session, create_session, resolve_session, remember_session, destroy_session, SESSION_COOKIE, SESSION_MAX_AGE
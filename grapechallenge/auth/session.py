@@ -0,0 +1,150 @@
+import hashlib
+import hmac
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from grapechallenge.config import get_session_secret
+
+
+SESSION_COOKIE = "session"
+SESSION_MAX_AGE = 30 * 24 * 60 * 60
+# 서버 간 시계 차이로 막 발급된 토큰이 거절되지 않도록 허용하는 범위 (초)
+CLOCK_SKEW = 60
+
+
+###################################
+## Session Store
+###################################
+
+class SessionStore(ABC):
+    @abstractmethod
+    def get(self, sid: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def set(self, sid: str, user: dict) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, sid: str) -> None:
+        pass
+
+
+class InMemorySessionStore(SessionStore):
+    def __init__(self, max_size: int = 10000, ttl: int = SESSION_MAX_AGE):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._items: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+    def get(self, sid: str) -> Optional[dict]:
+        item = self._items.get(sid)
+        if item is None:
+            return None
+
+        expires_at, user = item
+        if expires_at < time.monotonic():
+            del self._items[sid]
+            return None
+
+        self._items.move_to_end(sid)
+        return user
+
+    def set(self, sid: str, user: dict) -> None:
+        self._items[sid] = (time.monotonic() + self._ttl, user)
+        self._items.move_to_end(sid)
+
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, sid: str) -> None:
+        self._items.pop(sid, None)
+
+
+_store: SessionStore = InMemorySessionStore()
+
+
+def get_session_store() -> SessionStore:
+    return _store
+
+
+def set_session_store(store: SessionStore) -> None:
+    global _store
+    _store = store
+
+
+###################################
+## Session Token
+###################################
+
+# token: "{sid}:{user_id}:{issued_at}.{signature}"
+# *발급 시각(unix 초)이 서명 안에 있으므로 SESSION_MAX_AGE 가 지난 토큰은 쿠키가 남아 있어도 거절된다.
+
+
+@dataclass(frozen=True)
+class SessionToken:
+    sid: str
+    user_id: str
+    issued_at: int
+
+    @property
+    def expires_at(self) -> datetime:
+        return datetime.fromtimestamp(self.issued_at + SESSION_MAX_AGE)
+
+
+def _sign(payload: str) -> str:
+    return hmac.new(
+        get_session_secret().encode(), payload.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def unsign_session(token: Optional[str]) -> Optional[SessionToken]:
+    """The signed, unexpired token contents, or None."""
+    if not token:
+        return None
+
+    payload, _, signature = token.rpartition(".")
+    if not payload or not hmac.compare_digest(_sign(payload), signature):
+        return None
+
+    sid, _, rest = payload.partition(":")
+    user_id, _, issued_at = rest.partition(":")
+    if not sid or not user_id or not issued_at.isdigit():
+        return None
+
+    age = time.time() - int(issued_at)
+    if age < -CLOCK_SKEW or age > SESSION_MAX_AGE:
+        return None
+
+    return SessionToken(sid=sid, user_id=user_id, issued_at=int(issued_at))
+
+
+def create_session(user: dict) -> str:
+    sid = secrets.token_urlsafe(16)
+    get_session_store().set(sid, user)
+
+    payload = f"{sid}:{user['user_id']}:{int(time.time())}"
+    return f"{payload}.{_sign(payload)}"
+
+
+def resolve_session(token: Optional[str]) -> tuple[Optional[SessionToken], Optional[dict]]:
+    """Return (token contents, cached user) for a signed token; user is None on a store miss."""
+    unsigned = unsign_session(token)
+    if unsigned is None:
+        return None, None
+
+    return unsigned, get_session_store().get(unsigned.sid)
+
+
+def remember_session(unsigned: SessionToken, user: dict) -> None:
+    get_session_store().set(unsigned.sid, user)
+
+
+def destroy_session(token: Optional[str]) -> None:
+    unsigned = unsign_session(token)
+    if unsigned is not None:
+        get_session_store().delete(unsigned.sid)
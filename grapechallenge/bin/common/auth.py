@@ -0,0 +1,50 @@
+from typing import Optional
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from grapechallenge.auth import SESSION_COOKIE, SessionToken, resolve_session, remember_session
+
+
+class AuthMiddleware:
+    """Resolve the signed session cookie into `request.state.user` once per request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        token = HTTPConnection(scope).cookies.get(SESSION_COOKIE)
+        unsigned, user = resolve_session(token)
+
+        # 서명은 유효하지만 저장소에 없는 경우 (재시작, 다른 worker 등) 한 번만 DB 에서 복구한다.
+        # *로그아웃한 세션은 복구하지 않는다.
+        if unsigned is not None and user is None:
+            user = await self._load_user(unsigned)
+            if user is not None:
+                remember_session(unsigned, user)
+
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
+
+    async def _load_user(self, unsigned: SessionToken) -> Optional[dict]:
+        from grapechallenge.database.database import transactional_session_helper
+        from grapechallenge.domain.revoked_session import RepoRevokedSession
+        from grapechallenge.domain.user import RepoUser
+
+        async with transactional_session_helper() as session:
+            if await RepoRevokedSession.is_revoked(session=session, sid=unsigned.sid):
+                return None
+
+            found = await RepoUser.get_by_id(session=session, id=unsigned.user_id)
+
+        if found is None:
+            return None
+
+        return {
+            "user_id": found.id,
+            "user_cell": found.user.cell.to_str(),
+            "user_name": found.user.name.to_str(),
+        }
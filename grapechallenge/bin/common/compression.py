@@ -0,0 +1,54 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 쓴다.
+    brotli = None
+
+
+class BrotliResponder(GZipResponder):
+    # *비공개 훅(_compress_body)을 덮어쓰므로 starlette 버전은 requirements.txt 에서 고정한다.
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 5, **kwargs):
+        super().__init__(app, minimum_size, **kwargs)
+
+        self.quality = quality
+        self._brotli = None
+
+    def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+        if self._brotli is None:
+            self._brotli = brotli.Compressor(quality=self.quality)
+
+        if more_body:
+            return self._brotli.process(body) + self._brotli.flush()
+        return self._brotli.process(body) + self._brotli.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress responses with brotli when the client accepts it, gzip otherwise.
+
+    Small bodies, already-encoded responses (pre-compressed static bundles)
+    and binary media (images, event streams) are passed through untouched.
+    Large bodies are compressed off the event loop.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6, quality: int = 5):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.quality = quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and brotli is not None and "br" in Headers(scope=scope).get("accept-encoding", ""):
+            responder = BrotliResponder(
+                self.app,
+                self.minimum_size,
+                quality=self.quality,
+                thread_minimum_size=self.thread_minimum_size,
+                exclude_content_types=self.exclude_content_types,
+            )
+            await responder(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
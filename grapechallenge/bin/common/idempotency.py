@@ -0,0 +1,190 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from grapechallenge.endpoint.common.response import ORJSONResponse
+
+
+HEADER = "idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+
+@dataclass
+class StoredResponse:
+    fingerprint: str
+    expires_at: float
+    # 실행이 끝나기 전에는 False (같은 키의 동시 요청은 409)
+    done: bool = False
+    status: int = 0
+    headers: List[Tuple[bytes, bytes]] = field(default_factory=list)
+    body: bytes = b""
+
+
+class IdempotencyStore:
+    """Recent command responses keyed by (user, path, Idempotency-Key).
+
+    Bounded by age (`ttl` seconds) and count (`max_entries`, oldest dropped
+    first). Entries live in this process only.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[tuple, StoredResponse]" = OrderedDict()
+
+    def begin(self, key: tuple, fingerprint: str) -> Optional[StoredResponse]:
+        """The stored (or in-flight) entry for `key`, or None after reserving it."""
+        now = time.monotonic()
+        self._evict(now)
+
+        found = self._entries.get(key)
+        if found is not None:
+            return found
+
+        self._entries[key] = StoredResponse(fingerprint=fingerprint, expires_at=now + self._ttl)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+        return None
+
+    def finish(self, key: tuple, status: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        found = self._entries.get(key)
+        if found is None:
+            return
+
+        found.done = True
+        found.status = status
+        found.headers = headers
+        found.body = body
+        found.expires_at = time.monotonic() + self._ttl
+        self._entries.move_to_end(key)
+
+    def release(self, key: tuple):
+        # 실패한 요청은 다시 실행할 수 있게 키를 놓는다.
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float):
+        # 만료 시각 순서로 들어 있으니 앞에서부터 지운다.
+        while self._entries:
+            key, found = next(iter(self._entries.items()))
+            if found.expires_at >= now:
+                break
+            self._entries.pop(key)
+
+
+class IdempotencyMiddleware:
+    """Replay the stored response when a command is retried with the same Idempotency-Key.
+
+    Only POST requests to `paths` from a signed-in user are handled; the key is
+    scoped to the user and path. Reusing a key with a different body is 422, a
+    retry while the first request is still running is 409. 5xx responses are
+    not stored (the transaction was rolled back, so a retry may run again).
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str], store: IdempotencyStore):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        key = Headers(scope=scope).get(HEADER)
+        user = scope.get("state", {}).get("user") or {}
+
+        # 키가 없거나 로그인 전이면 (usecase 가 401) 그대로 실행한다.
+        if key is None or not user.get("user_id"):
+            await self.app(scope, receive, send)
+            return
+
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await self._respond(scope, receive, send, 400, "Invalid Idempotency-Key")
+            return
+
+        body, receive = await self._read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        store_key = (user["user_id"], scope["path"], key)
+
+        found = self.store.begin(store_key, fingerprint)
+        if found is not None:
+            if found.fingerprint != fingerprint:
+                await self._respond(scope, receive, send, 422, "Idempotency-Key was used with a different request")
+            elif not found.done:
+                await self._respond(scope, receive, send, 409, "A request with this Idempotency-Key is in progress", {"Retry-After": "1"})
+            else:
+                await self._replay(found, send)
+            return
+
+        status = 0
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        complete = False
+
+        async def send_and_store(message: Message):
+            nonlocal status, headers, complete
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_store)
+        except BaseException:
+            self.store.release(store_key)
+            raise
+
+        if complete and status < 500:
+            self.store.finish(store_key, status, headers, b"".join(chunks))
+        else:
+            self.store.release(store_key)
+
+    async def _read_body(self, receive: Receive) -> Tuple[bytes, Receive]:
+        # 본문을 미리 읽어 지문을 만들고, 앱에는 같은 본문을 다시 넘긴다.
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        body = b"".join(chunks)
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay
+
+    async def _replay(self, found: StoredResponse, send: Send):
+        await send({
+            "type": "http.response.start",
+            "status": found.status,
+            "headers": [*found.headers, (REPLAYED_HEADER, b"true")],
+        })
+        await send({"type": "http.response.body", "body": found.body})
+
+    async def _respond(self, scope: Scope, receive: Receive, send: Send, status: int, message: str, headers: Optional[dict] = None):
+        response = ORJSONResponse(content={"message": message}, status_code=status, headers=headers)
+        await response(scope, receive, send)
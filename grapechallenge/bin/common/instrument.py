@@ -0,0 +1,50 @@
+import logging
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from grapechallenge.config import get_settings, get_query_count_warning
+from grapechallenge.database.instrument import query_stats, route_query_stats
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """Record the SQL statements issued while serving each request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.dev = get_settings().is_dev
+        self.warning = get_query_count_warning()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with query_stats() as stats:
+
+            async def send_with_headers(message: Message):
+                # dev 에서는 응답 헤더로 노출한다.
+                if self.dev and message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (b"x-db-query-count", str(stats.count).encode()),
+                        (b"x-db-query-time-ms", f"{stats.total * 1000:.3f}".encode()),
+                        (b"x-db-slowest-query-ms", f"{stats.slowest * 1000:.3f}".encode()),
+                    ]
+                    message = {**message, "headers": headers}
+
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        # 매칭된 라우트 경로로만 집계한다. (raw URL 은 라벨이 무한히 늘어난다)
+        route = scope.get("route")
+        if route is None:
+            return
+
+        label = f"{scope['method']} {route.path}"
+        route_query_stats.record(label, stats)
+
+        if self.dev and stats.count > self.warning:
+            logger.warning("[QUERY-STATS] %s issued %d statements (%.1fms)", label, stats.count, stats.total * 1000)
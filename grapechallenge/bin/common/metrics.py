@@ -0,0 +1,54 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from grapechallenge.metrics import (
+    http_requests_total,
+    http_request_duration_seconds,
+    http_requests_in_progress,
+)
+
+
+class MetricsMiddleware:
+    """Record per-route latency, in-flight requests and status codes."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started_at = time.perf_counter()
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_progress.dec(method=method)
+
+            label = self._route_label(scope)
+            http_request_duration_seconds.observe(time.perf_counter() - started_at, method=method, route=label)
+            http_requests_total.inc(method=method, route=label, status=str(status))
+
+    def _route_label(self, scope: Scope) -> str:
+        # 라벨은 Router 에 등록된 경로를 쓴다. (raw URL 은 라벨이 무한히 늘어난다)
+        route = scope.get("route")
+        if route is not None:
+            return route.path
+
+        # 정적 파일 mount 는 prefix 로 묶는다.
+        if "app_root_path" in scope:
+            prefix = scope.get("root_path", "")[len(scope["app_root_path"] or ""):]
+            if prefix:
+                return f"{prefix}/*"
+
+        return "unmatched"
@@ -1,6 +1,8 @@
 from fastapi import FastAPI, APIRouter
 from typing import Any, Callable, List
 
+from grapechallenge.endpoint.common.response import ORJSONResponse
+
 
 class Router:
     def __init__(
@@ -16,5 +18,6 @@ class Router:
             path=self._path,
             methods=self._methods,
             endpoint=self._endpoint,
+            response_class=ORJSONResponse,
         )
         app.include_router(router)
\ No newline at end of file
@@ -1,19 +1,66 @@
 # pip
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from pathlib import Path
 # local
 from grapechallenge.bin.common.router import Router
+from grapechallenge.bin.common.auth import AuthMiddleware
+from grapechallenge.bin.common.instrument import QueryStatsMiddleware
+from grapechallenge.bin.common.metrics import MetricsMiddleware
+from grapechallenge.bin.common.compression import CompressionMiddleware
+from grapechallenge.bin.common.idempotency import IdempotencyMiddleware, IdempotencyStore
+from grapechallenge.assets import PrecompressedStaticFiles, DIST_PATH, MANIFEST
+from grapechallenge.config import (
+    get_compression_minimum_size,
+    get_idempotency_max_entries,
+    get_idempotency_ttl,
+    get_session_secret,
+    get_settings,
+)
+from grapechallenge.database.database import DatabaseClient
+from grapechallenge.realtime import get_broker
 from grapechallenge.endpoint import (
-    user, fruit, fruit_template, mission, mission_template, template, bible
+    user, fruit, fruit_template, mission, mission_template, template, bible, stats, metrics, image, grove, admin
 )
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Grape Challenge")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 환경 설정을 한 번 읽어 검증한다. (잘못된 APP_ENV 는 첫 요청이 아니라 시작할 때 실패한다.)
+    get_settings()
+    # prod 에서 SESSION_SECRET 이 없으면 첫 로그인이 아니라 시작할 때 실패한다.
+    get_session_secret()
+    # 페이지 템플릿을 미리 컴파일해 첫 요청에서 파싱하지 않게 한다.
+    template.warm_templates()
+    # 다른 worker 의 이벤트를 받으려면 (REALTIME_BROKER=postgres) LISTEN 을 시작한다.
+    await get_broker().start()
+    yield
+    await get_broker().stop()
+    # 프로세스 단위로 재사용한 커넥션 풀을 정리한다.
+    await DatabaseClient.close_shared()
+
+
+app = FastAPI(title="Grape Challenge", lifespan=lifespan)
+
+# 재시도해도 한 번만 실행되어야 하는 명령 (Idempotency-Key)
+IDEMPOTENT_PATHS = ["/mission/complete", "/fruit", "/fruit/harvest", "/mission/event/complete"]
+
+# Middleware
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths=IDEMPOTENT_PATHS,
+    store=IdempotencyStore(ttl=get_idempotency_ttl(), max_entries=get_idempotency_max_entries()),
+)
+app.add_middleware(CompressionMiddleware, minimum_size=get_compression_minimum_size())
+app.add_middleware(AuthMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 # Mount static files
 BASE_PATH = Path(__file__).resolve().parent.parent
@@ -24,6 +71,10 @@ app.mount("/css", StaticFiles(directory=str(BASE_PATH / "template" / "css")), na
 app.mount("/images", StaticFiles(directory=str(BASE_PATH / "template" / "images")), name="images")
 app.mount("/favicon", StaticFiles(directory=str(BASE_PATH / "template" / "favicon")), name="favicon")
 
+# Built bundles (python3 -m grapechallenge.assets)
+if (DIST_PATH / MANIFEST).exists():
+    app.mount("/dist", PrecompressedStaticFiles(directory=str(DIST_PATH)), name="dist")
+
 
 # #
 # Routers
@@ -79,6 +130,10 @@ Router(
     "/fruit/harvest", ["POST"], fruit.post_harvest_fruit
 ).register(app)
 
+Router(
+    "/fruits/cell", ["GET"], fruit.get_fruits_by_cell
+).register(app)
+
 Router(
     "/fruits/cell", ["POST"], fruit.get_fruits_by_cell_with_template
 ).register(app)
@@ -96,11 +151,20 @@ Router(
     "/fruit-template", ["GET"], fruit_template.get_fruit_template
 ).register(app)
 
+# Grove
+Router(
+    "/grove/bootstrap", ["GET"], grove.get_grove_bootstrap
+).register(app)
+
 # Mission
 Router(
     "/mission", ["GET"], mission.get_missions
 ).register(app)
 
+Router(
+    "/mission/events", ["GET"], mission.get_mission_events
+).register(app)
+
 Router(
     "/mission/complete", ["POST"], mission.post_mission
 ).register(app)
@@ -147,6 +211,30 @@ Router(
     "/bible/today", ["GET"], bible.get_today_verse
 ).register(app)
 
+# Stats
+Router(
+    "/stats/leaderboard", ["GET"], stats.get_leaderboard
+).register(app)
+
+# Admin
+Router(
+    "/admin/dashboard", ["GET"], admin.get_admin_dashboard
+).register(app)
+
+# Metrics
+Router(
+    "/metrics", ["GET"], metrics.get_metrics
+).register(app)
+
+Router(
+    "/metrics/queries", ["GET"], metrics.get_query_metrics
+).register(app)
+
+# Image
+Router(
+    "/img/{name}", ["GET"], image.get_image
+).register(app)
+
 # Template
 Router(
     "/login", ["GET"], template.login_page
@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Optional
 import os
+import secrets
 
 
 #########################
@@ -20,6 +25,123 @@ def get_app_env() -> str:
     return APP_ENV
 
 
+###################################
+## Session
+###################################
+
+# dev 에서 SESSION_SECRET 이 없으면 프로세스마다 임의의 키를 쓴다. (재시작 시 재로그인 필요)
+# *prod 에서는 배포/worker 마다 키가 달라지면 쿠키를 검증할 수 없으므로 반드시 설정한다.
+_FALLBACK_SESSION_SECRET = secrets.token_hex(32)
+
+def get_session_secret() -> str:
+    SESSION_SECRET = os.getenv("SESSION_SECRET", "")
+
+    if SESSION_SECRET == "":
+        if get_app_env() != "dev":
+            raise Exception("SESSION_SECRET is not set")
+
+        return _FALLBACK_SESSION_SECRET
+
+    return SESSION_SECRET
+
+
+###################################
+## Instrumentation
+###################################
+
+# 한 요청이 이 수보다 많은 SQL 문을 실행하면 dev 에서 경고한다. (N+1 감지)
+def get_query_count_warning() -> int:
+    QUERY_COUNT_WARNING = os.getenv("QUERY_COUNT_WARNING", "10")
+
+    return int(QUERY_COUNT_WARNING)
+
+
+###################################
+## Compression
+###################################
+
+# 이 크기(bytes)보다 작은 응답은 압축하지 않는다.
+def get_compression_minimum_size() -> int:
+    COMPRESSION_MINIMUM_SIZE = os.getenv("COMPRESSION_MINIMUM_SIZE", "1024")
+
+    return int(COMPRESSION_MINIMUM_SIZE)
+
+
+###################################
+## Cache
+###################################
+
+# 관리자 대시보드 통계를 이 시간(초) 동안 재사용한다. (쓰기 usecase 가 commit 되면 바로 비운다.)
+def get_dashboard_cache_ttl() -> float:
+    DASHBOARD_CACHE_TTL = os.getenv("DASHBOARD_CACHE_TTL", "30")
+
+    return float(DASHBOARD_CACHE_TTL)
+
+
+# 셀 목록을 이 시간(초) 동안 재사용한다. (다른 프로세스에서 추가된 사용자도 이 안에 반영된다.)
+def get_cells_cache_ttl() -> float:
+    CELLS_CACHE_TTL = os.getenv("CELLS_CACHE_TTL", "300")
+
+    return float(CELLS_CACHE_TTL)
+
+
+###################################
+## Idempotency
+###################################
+
+# Idempotency-Key 로 받은 명령의 응답을 이 시간(초) 동안 보관한다. (그 안의 재시도는 다시 실행하지 않는다.)
+def get_idempotency_ttl() -> float:
+    IDEMPOTENCY_TTL = os.getenv("IDEMPOTENCY_TTL", "3600")
+
+    return float(IDEMPOTENCY_TTL)
+
+
+# 보관할 응답 수 (넘치면 오래된 것부터 버린다.)
+def get_idempotency_max_entries() -> int:
+    IDEMPOTENCY_MAX_ENTRIES = os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000")
+
+    return int(IDEMPOTENCY_MAX_ENTRIES)
+
+
+###################################
+## Realtime
+###################################
+
+# SSE 이벤트 전달 방식 (local: 프로세스 하나, postgres: LISTEN/NOTIFY 로 여러 worker)
+def get_realtime_broker() -> str:
+    REALTIME_BROKER = os.getenv("REALTIME_BROKER", "local")
+
+    return REALTIME_BROKER
+
+
+###################################
+## Database Pool
+###################################
+
+# 프로세스(이벤트 루프)마다 유지할 커넥션 수와, 몰릴 때 더 열 수 있는 수
+def get_database_pool_size() -> int:
+    DATABASE_POOL_SIZE = os.getenv("DATABASE_POOL_SIZE", "5")
+
+    return int(DATABASE_POOL_SIZE)
+
+
+def get_database_max_overflow() -> int:
+    DATABASE_MAX_OVERFLOW = os.getenv("DATABASE_MAX_OVERFLOW", "10")
+
+    return int(DATABASE_MAX_OVERFLOW)
+
+
+###################################
+## Transaction
+###################################
+
+# 쓰기 트랜잭션이 commit 까지 쓸 수 있는 최대 시간 (초). 넘으면 되돌린다. (since 커서가 이만큼 겹쳐 읽는다.)
+def get_write_transaction_timeout() -> float:
+    WRITE_TRANSACTION_TIMEOUT = os.getenv("WRITE_TRANSACTION_TIMEOUT", "10")
+
+    return float(WRITE_TRANSACTION_TIMEOUT)
+
+
 ###################################
 ## Database Configuration
 ###################################
@@ -107,3 +229,68 @@ def get_database_config() -> DatabaseConfig:
         return ProdDatabaseConfig()
     else:
         raise NotImplementedError(f"Unknown environment: {APP_ENV}")
+
+
+###################################
+## Settings
+###################################
+
+@dataclass(frozen=True)
+class Settings:
+    """Environment resolved once per process (see get_settings).
+
+    Hot paths (timestamp formatting, date filters, sessions) read this object
+    instead of calling os.getenv for every row or request.
+    """
+    app_env: str
+    database_url: str
+    pool_size: int
+    max_overflow: int
+    write_transaction_timeout: float
+    # 날짜 경계와 응답 시각의 기준 시간대
+    tz: tzinfo
+    tz_name: str
+    utc_offset: timedelta
+    # DB 의 naive 시각이 UTC 라서 tz 로 옮겨 보여야 하는지 (prod)
+    convert_timestamps: bool
+
+    @property
+    def is_dev(self) -> bool:
+        return self.app_env == "dev"
+
+    def today(self) -> date:
+        return datetime.now(self.tz).date()
+
+    def localize(self, dt: Optional[datetime]) -> Optional[datetime]:
+        # 저장된 시각 -> 응답 시각 (prod 는 +09:00, dev 는 그대로)
+        if not dt:
+            return None
+
+        if self.convert_timestamps:
+            return (dt + self.utc_offset).replace(tzinfo=self.tz)
+
+        return dt
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    APP_ENV = get_app_env()
+
+    if APP_ENV == "prod":
+        utc_offset = timedelta(hours=9)
+        tz, tz_name, convert_timestamps = timezone(utc_offset), "Asia/Seoul", True
+    else:
+        utc_offset = timedelta(0)
+        tz, tz_name, convert_timestamps = timezone.utc, "UTC", False
+
+    return Settings(
+        app_env=APP_ENV,
+        database_url=get_database_config().database_url(),
+        pool_size=get_database_pool_size(),
+        max_overflow=get_database_max_overflow(),
+        write_transaction_timeout=get_write_transaction_timeout(),
+        tz=tz,
+        tz_name=tz_name,
+        utc_offset=utc_offset,
+        convert_timestamps=convert_timestamps,
+    )
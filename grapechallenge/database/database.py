@@ -1,9 +1,14 @@
 # pip
+import asyncio
+import logging
 from contextlib import asynccontextmanager
+from typing import Dict, List
+from weakref import WeakKeyDictionary
 from sqlalchemy import (
     inspect, 
     text
 )
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,36 +17,42 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.ext.declarative import declarative_base
 # local
-from grapechallenge.config import (
-    get_app_env,
-    get_database_config
-)
+from grapechallenge.config import get_settings
+from grapechallenge.database.instrument import instrument
+from grapechallenge.database.unit_of_work import unit_of_work
+from grapechallenge.domain.common.error import NotEditedError, TransactionTimeoutError
 
 Base = declarative_base()
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseClient:
     _tables_created = False
     _tables_patched = False
+    # *엔진(커넥션 풀)은 이벤트 루프마다 하나를 만들어 재사용한다.
+    _shared: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, DatabaseClient]]" = WeakKeyDictionary()
 
     def __init__(self, database_url: str):
+        settings = get_settings()
+
         self.database_url = database_url
         self.engine: AsyncEngine = create_async_engine(
             url=self.database_url,
-            echo=self._activate_echo()
+            echo=settings.is_dev,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow
         )
         self.async_session = async_sessionmaker(
             bind=self.engine,
             expire_on_commit=False,
             class_=AsyncSession
         )
-
-    def _activate_echo(self):
-        APP_ENV = get_app_env()
-        return APP_ENV == "dev"
+        instrument(self.engine)
 
     def _patch_schema(self, conn):
         inspector = inspect(conn)
+        dev = get_settings().is_dev
 
         for table_name, table in Base.metadata.tables.items():
             if not inspector.has_table(table_name):
@@ -57,11 +68,20 @@ class DatabaseClient:
                 nullable = "NULL" if col.nullable else "NOT NULL"
                 sql = f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type} {nullable}"
 
-                if get_app_env() == "dev":
+                if dev:
                     print(f"[AUTO-MIGRATION] {sql}")
 
                 conn.execute(text(sql))
 
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table_name)}
+            missing_indexes = [index for index in table.indexes if index.name not in existing_indexes]
+
+            for index in missing_indexes:
+                if dev:
+                    print(f"[AUTO-MIGRATION] CREATE INDEX {index.name} ON {table_name}")
+
+                index.create(conn)
+
     async def create_tables_once_in_process(self):
         if not DatabaseClient._tables_created:
             async with self.engine.begin() as conn:
@@ -87,20 +107,61 @@ class DatabaseClient:
     async def close(self):
         await self.engine.dispose()
 
+    # #
+    # shared
+
+    @classmethod
+    async def shared(cls, database_url: str) -> "DatabaseClient":
+        clients = cls._shared.setdefault(asyncio.get_running_loop(), {})
+
+        client = clients.get(database_url)
+        if client is None:
+            client = clients[database_url] = cls(database_url)
+
+        await client.create_tables_once_in_process()
+        await client.patch_tables_once_in_process()
+
+        return client
+
+    @classmethod
+    def shared_clients(cls) -> List["DatabaseClient"]:
+        return [client for clients in list(cls._shared.values()) for client in clients.values()]
+
+    @classmethod
+    async def close_shared(cls):
+        clients = cls._shared.pop(asyncio.get_running_loop(), {})
+
+        for client in clients.values():
+            await client.close()
+
 
 @asynccontextmanager
 async def transactional_session(async_session_factory):
     async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception as e:
-            await session.rollback()
-            raise e
+        with unit_of_work(session) as uow:
+            try:
+                yield session
+
+                # 늦게 commit 되는 쓰기는 되돌린다. (찍어 둔 시각이 since 커서의 겹침보다 늦게 보이지 않도록)
+                limit = get_settings().write_transaction_timeout
+                if uow.wrote(session) and uow.elapsed() > limit:
+                    raise TransactionTimeoutError(elapsed=uow.elapsed(), limit=limit)
+
+                try:
+                    await session.commit()
+                except (IntegrityError, DataError) as e:
+                    # 미뤄 둔 Repo.edit 의 flush 는 commit 에서 실패한다. (insert 는 이미 flush 됐다.)
+                    raise NotEditedError(target="unit of work", exception=e)
+            except Exception as e:
+                await session.rollback()
+                raise e
+
+            logger.debug("[UNIT-OF-WORK] flushes=%d", uow.flushes)
 
 
 @asynccontextmanager
 async def transactional_session_helper():
-    async with DatabaseClient(get_database_config().database_url()) as db_client:
-        async with transactional_session(db_client.async_session) as session:
-            yield session
+    db_client = await DatabaseClient.shared(get_settings().database_url)
+
+    async with transactional_session(db_client.async_session) as session:
+        yield session
@@ -0,0 +1,131 @@
+# pip
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """요청 하나 동안 실행된 SQL 문의 수, 총 시간, 가장 느린 문."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    # #
+    # helper
+
+    @classmethod
+    def current(cls) -> Optional["QueryStats"]:
+        return _current.get()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+
+        if elapsed >= self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "slowest_ms": round(self.slowest * 1000, 3),
+            "slowest_statement": self.slowest_statement,
+        }
+
+
+class RouteQueryStats:
+    """라우트별 누적 통계. (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._routes: Dict[str, dict] = {}
+
+    def record(self, route: str, stats: QueryStats):
+        with self._lock:
+            found = self._routes.setdefault(route, {
+                "requests": 0,
+                "queries": 0,
+                "total_ms": 0.0,
+                "max_queries": 0,
+                "slowest_ms": 0.0,
+                "slowest_statement": None,
+            })
+
+            found["requests"] += 1
+            found["queries"] += stats.count
+            found["total_ms"] += stats.total * 1000
+            found["max_queries"] = max(found["max_queries"], stats.count)
+
+            if stats.slowest * 1000 >= found["slowest_ms"]:
+                found["slowest_ms"] = stats.slowest * 1000
+                found["slowest_statement"] = stats.slowest_statement
+
+    def summary(self, statements: bool = True) -> dict:
+        # statements=False 면 SQL 본문은 빼고 수치만 돌려준다.
+        with self._lock:
+            return {
+                route: {
+                    "requests": found["requests"],
+                    "queries": found["queries"],
+                    "avg_queries": round(found["queries"] / found["requests"], 2),
+                    "max_queries": found["max_queries"],
+                    "avg_ms": round(found["total_ms"] / found["requests"], 3),
+                    "slowest_ms": round(found["slowest_ms"], 3),
+                    "slowest_statement": found["slowest_statement"] if statements else None,
+                }
+                for route, found in sorted(self._routes.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+route_query_stats = RouteQueryStats()
+
+
+# #
+# engine event
+
+# *시작 시각은 실행 컨텍스트에 둔다. (실패한 문이 남기는 값이 없도록)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+
+    stats = _current.get()
+    if stats:
+        stats.record(statement, time.perf_counter() - started_at)
+
+
+def instrument(engine: AsyncEngine):
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def query_stats():
+    stats = QueryStats()
+    token = _current.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
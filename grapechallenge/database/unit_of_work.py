@@ -0,0 +1,63 @@
+# pip
+import time
+from contextlib import contextmanager
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """
+    요청 하나가 하나의 세션을 공유하는 동안의 작업 단위.
+
+    - 읽어 온 aggregate 는 세션의 identity map 이 추적한다. (Repo.find/edit 는 session.get 을 쓴다.)
+    - Repo.edit 는 flush 하지 않고, commit 시점에 한 번에 flush 된다.
+      그때의 제약 조건/데이터 오류는 transactional_session 이 NotEditedError 로 바꿔 올린다.
+    - Repo.insert 는 바로 flush 한다. (제약 조건 오류가 NotInsertedError 로 올라오도록)
+    - flush 횟수를 센다. (SQL 문 수는 database.instrument 의 QueryStats 가 센다.)
+    - 시작한 뒤 걸린 시간을 잰다. (쓰기 트랜잭션의 commit 제한 시간)
+    """
+
+    KEY = "unit_of_work"
+
+    def __init__(self):
+        self.flushes = 0
+        self.started_at = time.monotonic()
+
+    # #
+    # helper
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> Optional["UnitOfWork"]:
+        return session.info.get(cls.KEY)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def wrote(self, session: AsyncSession) -> bool:
+        # ORM 으로 쓴 것이 있는지 (flush 된 insert, commit 때 flush 될 수정/삭제)
+        return bool(self.flushes or session.new or session.dirty or session.deleted)
+
+    def summary(self) -> dict:
+        return {
+            "flushes": self.flushes,
+        }
+
+    # #
+    # event
+
+    def _on_flush(self, session, flush_context):
+        self.flushes += 1
+
+
+@contextmanager
+def unit_of_work(session: AsyncSession):
+    uow = UnitOfWork()
+    session.info[UnitOfWork.KEY] = uow
+    event.listen(session.sync_session, "after_flush", uow._on_flush)
+
+    try:
+        yield uow
+    finally:
+        event.remove(session.sync_session, "after_flush", uow._on_flush)
+        session.info.pop(UnitOfWork.KEY, None)
@@ -4,6 +4,7 @@ from sqlalchemy import Column, String, DateTime, Date, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
 
+from grapechallenge.config import get_settings
 from grapechallenge.database.database import Base
 from grapechallenge.domain.common.repo import Repo, kst
 from grapechallenge.domain.bible import Bible
@@ -149,23 +150,10 @@ class RepoBible(Repo):
         cls,
         session: AsyncSession
     ) -> Optional["RepoBible"]:
-        from datetime import datetime, timezone, timedelta
-        from grapechallenge.config import get_app_env
-
-        app_env = get_app_env()
-
-        if app_env == "dev":
-            today = datetime.now(timezone.utc).date()
-        elif app_env == "prod":
-            kst = timezone(timedelta(hours=9))
-            today = datetime.now(kst).date()
-        else:
-            return None
-
         founds = await cls.find_filtered_by_fields(
             session=session,
             model_class=BibleModel,
-            date=today
+            date=get_settings().today()
         )
 
         if not founds:
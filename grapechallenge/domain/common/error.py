@@ -81,3 +81,7 @@ class NotEditedError(DatabaseError):
 class NotFoundError(DatabaseError):
     def __init__(self, target: str, exception: Optional[Exception]) -> None:
         super().__init__(f"{target} 조회에 실패했습니다. Details: {exception}", code=404)
+
+class TransactionTimeoutError(DatabaseError):
+    def __init__(self, elapsed: float, limit: float) -> None:
+        super().__init__(f"쓰기 트랜잭션이 {elapsed:.1f}초 걸려 되돌렸습니다. 제한({limit}초)", code=503)
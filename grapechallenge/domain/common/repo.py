@@ -1,8 +1,11 @@
-from sqlalchemy import select
+from sqlalchemy import Date, cast, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from grapechallenge.config import get_settings
+
+from grapechallenge.database.unit_of_work import UnitOfWork
 from grapechallenge.domain.common.error import (
     NotInsertedError,
     NotEditedError,
@@ -17,18 +20,32 @@ def kst(dt: Optional[datetime]) -> Optional[str]:
     if isinstance(dt, str):
         return dt
 
-    from grapechallenge.config import get_app_env
-    app_env = get_app_env()
+    return get_settings().localize(dt).isoformat() # type:ignore
+
+
+def local_date(column):
+    # 기준 시간대의 날짜 (prod 는 UTC 로 저장된 시각을 Asia/Seoul 로 옮겨 자른다.)
+    settings = get_settings()
+
+    if settings.convert_timestamps:
+        return cast(func.timezone(settings.tz_name, func.timezone('UTC', column)), Date)
+
+    return cast(column, Date)
 
-    if app_env == "dev":
-        return dt.isoformat()
-    
-    if app_env == "prod":
-        kst_tz = timezone(timedelta(hours=9))
-        return dt.replace(tzinfo=timezone.utc).astimezone(kst_tz).isoformat()
 
 class Repo:
 
+    # #
+    # helper
+
+    @classmethod
+    async def flush(cls, session: AsyncSession):
+        # *unit of work 안에서는 수정의 flush 를 commit 시점으로 미룬다.
+        if UnitOfWork.of(session):
+            return
+
+        await session.flush()
+
     # #
     # CRUD
 
@@ -37,6 +54,7 @@ class Repo:
         try:
             instance = model_class(**data)
             session.add(instance)
+            # *insert 는 바로 flush 한다. (제약 조건 오류를 여기서 NotInsertedError 로 돌려준다.)
             await session.flush()
             return instance
         except Exception as e:
@@ -55,10 +73,7 @@ class Repo:
     @classmethod
     async def edit(cls, session: AsyncSession, model_class, data: dict, id: str | int):
         try:
-            result = await session.execute(
-                select(model_class).where(model_class.id == id)
-            )
-            instance = result.scalar_one_or_none()
+            instance = await session.get(model_class, id)
 
             if not instance:
                 raise NotFoundError(target=f"{model_class.__tablename__}(id={id})", exception=None)
@@ -69,7 +84,7 @@ class Repo:
                     setattr(instance, key, value)
 
             instance.updated_at = datetime.now()
-            await session.flush()
+            await cls.flush(session)
 
             return instance
         except Exception as e:
@@ -78,10 +93,8 @@ class Repo:
     @classmethod
     async def find(cls, session: AsyncSession, model_class, id: str | int):
         try:
-            result = await session.execute(
-                select(model_class).where(model_class.id == id)
-            )
-            instance = result.scalar_one_or_none()
+            # *identity map 에 이미 있으면 SELECT 없이 반환된다.
+            instance = await session.get(model_class, id)
 
             return instance
         except Exception as e:
@@ -100,4 +113,29 @@ class Repo:
 
             return instances
         except Exception as e:
-            raise NotFoundError(target=f"{model_class.__tablename__}({kwargs})", exception=e)
\ No newline at end of file
+            raise NotFoundError(target=f"{model_class.__tablename__}({kwargs})", exception=e)
+
+    @classmethod
+    async def find_version(cls, session: AsyncSession, model_class, *conditions, joins: tuple = ()) -> Tuple[int, Optional[datetime]]:
+        # 행 수와 마지막 변경 시각만 센다. (조건부 GET 의 검증값, 행은 읽지 않는다.)
+        # *join 한 테이블의 변경 시각도 함께 본다. (응답에 템플릿/사용자 값이 들어간다.)
+        try:
+            changed_at = [
+                func.coalesce(model.updated_at, model.created_at)
+                for model in (model_class, *(target for target, _ in joins))
+            ]
+            query = select(
+                func.count(model_class.id),
+                func.max(func.greatest(*changed_at) if len(changed_at) > 1 else changed_at[0])
+            )
+            for target, onclause in joins:
+                query = query.join(target, onclause)
+            if conditions:
+                query = query.where(*conditions)
+
+            result = await session.execute(query)
+            count, changed_at = result.one()
+
+            return count, changed_at
+        except Exception as e:
+            raise NotFoundError(target=f"{model_class.__tablename__}(version)", exception=e)
\ No newline at end of file
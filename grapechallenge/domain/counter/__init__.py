@@ -0,0 +1,9 @@
+# value object
+from .name import Name
+from .value import Value
+
+# entity
+from .counter import Counter
+
+# repo
+from .repo_counter import RepoCounter, CounterModel
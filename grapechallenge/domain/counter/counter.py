@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from pydantic import ValidationError
+
+from grapechallenge.domain.common.error import InvalidTypeError
+from grapechallenge.domain.counter.name import Name
+from grapechallenge.domain.counter.value import Value
+
+
+@dataclass(frozen=True)
+class Counter:
+    name: Name
+    value: Value
+
+    # #
+    # factory
+
+    @classmethod
+    def new(cls, *, name: Name, value: Value) -> "Counter":
+        try:
+            return cls(
+                name=name,
+                value=value,
+            )
+        except ValidationError as e:
+            raise InvalidTypeError.from_pydantic(e)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Counter":
+        return cls.new(
+            name=Name.from_str(
+                data.get("name", None)
+            ),
+            value=Value.from_int(
+                data.get("value", None)
+            ),
+        )
+
+    # #
+    # query
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name.to_str(),
+            "value": self.value.to_int(),
+        }
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+from grapechallenge.domain.common.error import (
+    InvalidTypeError,
+    EmptyValueError,
+    DisallowedValueError,
+)
+
+
+@dataclass(frozen=True)
+class Name:
+    _value: str
+    _allowed_list = ["PARTICIPATED_USERS"]
+
+    # #
+    # factory
+
+    @classmethod
+    def from_str(cls, value) -> "Name":
+        if not isinstance(value, str):
+            raise InvalidTypeError(target=cls.__name__, valid_type=str)
+
+        if value == "":
+            raise EmptyValueError(target=cls.__name__)
+
+        if value not in cls._allowed_list:
+            raise DisallowedValueError(target=cls.__name__, allowed_list=cls._allowed_list)
+
+        return cls(_value=value)
+
+    # #
+    # query
+
+    def to_str(self) -> str:
+        return self._value
@@ -0,0 +1,155 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+
+from grapechallenge.database.database import Base
+from grapechallenge.domain.common.error import NotEditedError
+from grapechallenge.domain.common.repo import Repo, kst
+from grapechallenge.domain.counter import Counter, Name
+
+
+class CounterModel(Base):
+    __tablename__ = "counters"
+
+    id = Column(String(36), primary_key=True)
+    name = Column(String(50), nullable=False, unique=True)
+    value = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(DateTime, default=None, nullable=True)
+
+
+class RepoCounter(Repo):
+    __table__: str = "counters"
+
+    def __init__(
+        self,
+        id: str,
+        counter: Counter,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ):
+        self.id = id
+        self.counter = counter
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    # #
+    # helper
+
+    @classmethod
+    def _from_row(cls, row) -> "RepoCounter":
+        return cls(
+            id=row["id"],
+            counter=Counter.from_dict({
+                "name": row["name"],
+                "value": row["value"],
+            }),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "created_at": kst(self.created_at),
+            "updated_at": kst(self.updated_at),
+        }
+
+    # #
+    # command
+
+    # *카운터는 이름 기준 upsert 로만 변경한다.
+
+    @classmethod
+    async def increase(
+        cls,
+        session: AsyncSession,
+        name: Name,
+        by: int = 1
+    ) -> "RepoCounter":
+        now = datetime.now()
+        table = CounterModel.__table__
+
+        query = pg_insert(table).values(
+            id=str(uuid4()),
+            name=name.to_str(),
+            value=by,
+            created_at=now,
+        ).on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={
+                "value": table.c.value + by,
+                "updated_at": now,
+            }
+        ).returning(*table.c)
+
+        try:
+            result = await session.execute(query)
+            row = result.mappings().one()
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+        return cls._from_row(row)
+
+    @classmethod
+    async def set_value(
+        cls,
+        session: AsyncSession,
+        counter: Counter
+    ) -> "RepoCounter":
+        now = datetime.now()
+        table = CounterModel.__table__
+
+        query = pg_insert(table).values(
+            id=str(uuid4()),
+            **(counter.to_dict()),
+            created_at=now,
+        ).on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={
+                "value": counter.value.to_int(),
+                "updated_at": now,
+            }
+        ).returning(*table.c)
+
+        try:
+            result = await session.execute(query)
+            row = result.mappings().one()
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+        return cls._from_row(row)
+
+    # #
+    # query
+
+    @classmethod
+    async def get_by_name(
+        cls,
+        session: AsyncSession,
+        name: Name
+    ) -> Optional["RepoCounter"]:
+
+        founds = await cls.find_filtered_by_fields(
+            session=session,
+            model_class=CounterModel,
+            name=name.to_str()
+        )
+
+        if not founds:
+            return None
+
+        found = founds[0]
+
+        return cls(
+            id=found.id,
+            counter=Counter.from_dict({
+                "name": found.name,
+                "value": found.value,
+            }),
+            created_at=found.created_at,
+            updated_at=found.updated_at,
+        )
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from grapechallenge.domain.common.error import (
+    InvalidTypeError,
+    DisallowedValueError,
+)
+
+
+@dataclass(frozen=True)
+class Value:
+    _value: int
+
+    # #
+    # factory
+
+    @classmethod
+    def from_int(cls, value) -> "Value":
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise InvalidTypeError(target=cls.__name__, valid_type=int)
+
+        if value < 0:
+            raise DisallowedValueError(target=cls.__name__, allowed_list=["0 이상의 정수"])
+
+        return cls(_value=value)
+
+    # #
+    # query
+
+    def to_int(self) -> int:
+        return self._value
@@ -0,0 +1,2 @@
+# repo
+from .repo_dashboard import RepoDashboard
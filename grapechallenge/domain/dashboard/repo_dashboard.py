@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import select, func, case
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.domain.common.repo import Repo
+
+
+class RepoDashboard(Repo):
+    __table__: str = "dashboard"
+
+    # #
+    # joined
+
+    # *joined query는 dict를 반환한다.
+
+    @classmethod
+    async def get(
+        cls,
+        session: AsyncSession
+    ) -> Optional[dict]:
+        from grapechallenge.domain.counter import CounterModel
+        from grapechallenge.domain.fruit.repo_fruit import FruitModel
+        from grapechallenge.domain.fruit_template import FruitTemplateModel
+        from grapechallenge.domain.mission_template.repo_mission_template import MissionTemplateModel
+
+        async def find_dashboard(
+            session: AsyncSession
+        ):
+            user_count = select(
+                CounterModel.value
+            ).where(
+                CounterModel.name == "PARTICIPATED_USERS"
+            ).scalar_subquery()
+
+            stats = select(
+                FruitTemplateModel.id,
+                FruitTemplateModel.name,
+                FruitTemplateModel.type,
+                FruitTemplateModel.seventh_status,
+                func.count(FruitModel.id).label("total"),
+                func.coalesce(func.sum(
+                    case((FruitModel.status != "COMPLETED", 1), else_=0)
+                ), 0).label("in_progress"),
+                func.coalesce(func.sum(
+                    case((FruitModel.status == "COMPLETED", 1), else_=0)
+                ), 0).label("completed")
+            ).outerjoin(
+                FruitModel,
+                FruitTemplateModel.id == FruitModel.template_id
+            ).group_by(
+                FruitTemplateModel.id,
+                FruitTemplateModel.name,
+                FruitTemplateModel.type,
+                FruitTemplateModel.seventh_status
+            ).subquery()
+
+            fruit_stats = select(
+                func.json_agg(aggregate_order_by(
+                    func.json_build_object(
+                        "template_id", stats.c.id,
+                        "name", stats.c.name,
+                        "type", stats.c.type,
+                        "seventh_status", stats.c.seventh_status,
+                        "total", stats.c.total,
+                        "in_progress", stats.c.in_progress,
+                        "completed", stats.c.completed,
+                    ),
+                    stats.c.name
+                ), type_=JSON)
+            ).scalar_subquery()
+
+            mission_templates = select(
+                func.json_agg(aggregate_order_by(
+                    func.json_build_object(
+                        "id", MissionTemplateModel.id,
+                        "name", MissionTemplateModel.name,
+                        "content", MissionTemplateModel.content,
+                        "type", MissionTemplateModel.type,
+                        "created_at", MissionTemplateModel.created_at,
+                        "updated_at", MissionTemplateModel.updated_at,
+                    ),
+                    MissionTemplateModel.created_at
+                ), type_=JSON)
+            ).scalar_subquery()
+
+            # 세 결과를 한 문장으로 가져온다. (DB 왕복 1회)
+            query = select(
+                user_count.label("user_count"),
+                fruit_stats.label("stats"),
+                mission_templates.label("mission_templates")
+            )
+            result = await session.execute(query)
+            return result.one()
+
+        found = await find_dashboard(session)
+
+        stats = found.stats or []
+        mission_templates = found.mission_templates or []
+
+        # 열매는 반드시 템플릿을 가지므로 (FK) 템플릿별 합이 전체 합이다.
+        fruit_count = {
+            "total": sum(stat["total"] for stat in stats),
+            "in_progress": sum(stat["in_progress"] for stat in stats),
+            "completed": sum(stat["completed"] for stat in stats),
+        }
+
+        return {
+            "user_count": found.user_count,
+            "fruit_count": fruit_count,
+            "stats": stats,
+            "mission_templates": [
+                {
+                    **mission_template,
+                    "created_at": _parse(mission_template["created_at"]),
+                    "updated_at": _parse(mission_template["updated_at"]),
+                }
+                for mission_template in mission_templates
+            ],
+        }
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    # json_build_object 는 timestamp 를 ISO 문자열로 돌려준다.
+    if not value:
+        return None
+
+    return datetime.fromisoformat(value)
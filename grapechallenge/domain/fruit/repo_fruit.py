@@ -1,6 +1,6 @@
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import Column, String, DateTime, ForeignKey, select
+from typing import Optional, List, Tuple
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
 
@@ -11,6 +11,9 @@ from grapechallenge.domain.fruit import Fruit
 
 class FruitModel(Base):
     __tablename__ = "fruits"
+    __table_args__ = (
+        Index("ix_fruits_user_id_status_created_at", "user_id", "status", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True)
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -23,6 +26,11 @@ class FruitModel(Base):
 class RepoFruit(Repo):
     __table__: str = "fruits"
 
+    ORDERS = {
+        "created": FruitModel.created_at,
+        "updated": FruitModel.updated_at,
+    }
+
     def __init__(
         self,
         id: str,
@@ -54,6 +62,36 @@ class RepoFruit(Repo):
             "updated_at": updated_at,
         }
 
+    @classmethod
+    def _filter_with_template(
+        cls,
+        query,
+        *,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+        order: str = "created",
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ):
+        from grapechallenge.domain.fruit_template import FruitTemplateModel
+
+        if status:
+            query = query.where(FruitModel.status == status)
+
+        if type:
+            query = query.where(FruitTemplateModel.type == type)
+
+        order_column = cls.ORDERS[order]
+        query = query.order_by(
+            order_column.desc().nulls_last() if descending else order_column.asc().nulls_last(),
+            FruitModel.id
+        )
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query
+
     def summary(self) -> dict:
         return {
             "id": self.id,
@@ -266,6 +304,7 @@ class RepoFruit(Repo):
         return {
             "fruit_id": found[0].id,
             "status": found[0].status,
+            "template_id": found[1].id,
             "name": found[1].name,
             "type": found[1].type,
             "first_status": found[1].first_status,
@@ -283,7 +322,12 @@ class RepoFruit(Repo):
     async def get_by_user_id_with_template(
         cls,
         session: AsyncSession,
-        user_id: str
+        user_id: str,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+        order: str = "created",
+        descending: bool = False,
+        limit: Optional[int] = None
     ) -> Optional[List[dict]]:
         
         async def find_by_user_id_with_template(
@@ -301,6 +345,9 @@ class RepoFruit(Repo):
             ).where(
                 model_class.user_id == user_id
             )
+            query = cls._filter_with_template(
+                query, status=status, type=type, order=order, descending=descending, limit=limit
+            )
             result = await session.execute(query)
             return result.all()
 
@@ -313,6 +360,7 @@ class RepoFruit(Repo):
             {
                 "fruit_id": found[0].id,
                 "status": found[0].status,
+                "template_id": found[1].id,
                 "name": found[1].name,
                 "type": found[1].type,
                 "first_status": found[1].first_status,
@@ -332,7 +380,12 @@ class RepoFruit(Repo):
     async def get_by_cell_with_template(
         cls,
         session: AsyncSession,
-        cell: str
+        cell: str,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+        order: str = "created",
+        descending: bool = False,
+        limit: Optional[int] = None
     ) -> Optional[List[dict]]:
         from grapechallenge.domain.fruit_template import FruitTemplateModel
         from grapechallenge.domain.user.repo_user import UserModel
@@ -354,6 +407,9 @@ class RepoFruit(Repo):
             ).where(
                 UserModel.cell == cell
             )
+            query = cls._filter_with_template(
+                query, status=status, type=type, order=order, descending=descending, limit=limit
+            )
             result = await session.execute(query)
             return result.all()
 
@@ -368,6 +424,7 @@ class RepoFruit(Repo):
                 "user_id": found[2].id,
                 "user_name": found[2].name,
                 "status": found[0].status,
+                "template_id": found[1].id,
                 "name": found[1].name,
                 "type": found[1].type,
                 "first_status": found[1].first_status,
@@ -437,4 +494,41 @@ class RepoFruit(Repo):
                 "completed": found.completed or 0,
             }
             for found in founds
-        ]
\ No newline at end of file
+        ]
+
+    # #
+    # version
+
+    @classmethod
+    async def get_version_by_user_id(
+        cls,
+        session: AsyncSession,
+        user_id: str
+    ) -> Tuple[int, Optional[datetime]]:
+        from grapechallenge.domain.fruit_template import FruitTemplateModel
+
+        return await cls.find_version(
+            session,
+            FruitModel,
+            FruitModel.user_id == user_id,
+            joins=((FruitTemplateModel, FruitModel.template_id == FruitTemplateModel.id),)
+        )
+
+    @classmethod
+    async def get_version_by_cell(
+        cls,
+        session: AsyncSession,
+        cell: str
+    ) -> Tuple[int, Optional[datetime]]:
+        from grapechallenge.domain.fruit_template import FruitTemplateModel
+        from grapechallenge.domain.user.repo_user import UserModel
+
+        return await cls.find_version(
+            session,
+            FruitModel,
+            UserModel.cell == cell,
+            joins=(
+                (FruitTemplateModel, FruitModel.template_id == FruitTemplateModel.id),
+                (UserModel, FruitModel.user_id == UserModel.id),
+            )
+        )
@@ -1,16 +1,23 @@
-from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import Column, String, DateTime, ForeignKey, and_, func
+from datetime import datetime, timedelta
+from typing import Optional, List, Tuple
+from sqlalchemy import Column, String, DateTime, ForeignKey, and_, cast, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from uuid import uuid4
 
+from grapechallenge.config import get_settings
 from grapechallenge.database.database import Base
-from grapechallenge.domain.common.repo import Repo, kst
+from grapechallenge.domain.common.repo import Repo, kst, local_date
 from grapechallenge.domain.mission import Mission
 
 
+# since 보다 앞부터 다시 보낸다. (클라이언트는 id 로 합친다.)
+# *쓰기 트랜잭션은 시작 후 write_transaction_timeout 안에 commit 되거나 되돌려지므로 (transactional_session)
+#  그보다 더 일찍 찍힌 시각이 뒤늦게 보이는 일은 없다. 여유분은 commit 자체와 서버 간 시계 차이.
+SINCE_MARGIN = timedelta(seconds=2)
+
+
 class MissionModel(Base):
     __tablename__ = "missions"
 
@@ -228,39 +235,13 @@ class RepoMission(Repo):
         user_id: str,
         template_id: str
     ) -> bool:
-        from datetime import datetime, timezone, timedelta
-        from sqlalchemy import Date, cast
-        from grapechallenge.config import get_app_env
-
-        app_env = get_app_env()
-
-        if app_env == "dev":
-            today = datetime.now(timezone.utc).date()
-            query = select(func.count(MissionModel.id)).where(
-                and_(
-                    MissionModel.user_id == user_id,
-                    MissionModel.template_id == template_id,
-                    cast(MissionModel.created_at, Date) == today
-                )
+        query = select(func.count(MissionModel.id)).where(
+            and_(
+                MissionModel.user_id == user_id,
+                MissionModel.template_id == template_id,
+                local_date(MissionModel.created_at) == get_settings().today()
             )
-        elif app_env == "prod":
-            kst = timezone(timedelta(hours=9))
-            today_kst = datetime.now(kst).date()
-            query = select(func.count(MissionModel.id)).where(
-                and_(
-                    MissionModel.user_id == user_id,
-                    MissionModel.template_id == template_id,
-                    cast(
-                        func.timezone(
-                            'Asia/Seoul',
-                            func.timezone('UTC', MissionModel.created_at)
-                        ),
-                        Date
-                    ) == today_kst
-                )
-            )
-        else:
-            return False
+        )
 
         result = await session.execute(query)
         count = result.scalar()
@@ -272,6 +253,51 @@ class RepoMission(Repo):
 
     # *joined query는 dict를 반환한다.
 
+    @classmethod
+    def _template_name_conditions(
+        cls,
+        name: str,
+        date: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> list:
+        # get_by_template_name 과 get_version_by_template_name 이 같은 조건을 쓴다.
+        from grapechallenge.domain.mission_template.repo_mission_template import MissionTemplateModel
+        settings = get_settings()
+        conditions = [MissionTemplateModel.name == name]
+
+        if date == "today":
+            conditions.append(local_date(MissionModel.created_at) == settings.today())
+        elif date == "report":
+            # Use custom date range if provided
+            if start_date and end_date:
+                start_day = datetime.strptime(start_date, "%Y-%m-%d").date()
+                end_day = datetime.strptime(end_date, "%Y-%m-%d").date() + timedelta(days=1)
+            else:
+                end_day = settings.today()
+                start_day = end_day - timedelta(days=1)
+
+            # start_day 22:00 ~ end_day 22:00 (기준 시간대 -> 저장된 UTC 시각)
+            start_22 = datetime.combine(start_day, datetime.min.time()).replace(hour=22) - settings.utc_offset
+            end_22 = datetime.combine(end_day, datetime.min.time()).replace(hour=22) - settings.utc_offset
+
+            conditions.append(
+                and_(
+                    cast(MissionModel.created_at, DateTime) >= start_22,
+                    cast(MissionModel.created_at, DateTime) < end_22
+                )
+            )
+
+        if since:
+            # 새로 쓰였거나 반응이 바뀐 (updated_at) 미션만
+            conditions.append(
+                func.coalesce(MissionModel.updated_at, MissionModel.created_at)
+                > since - timedelta(seconds=settings.write_transaction_timeout) - SINCE_MARGIN
+            )
+
+        return conditions
+
     @classmethod
     async def get_by_template_name(
         cls,
@@ -279,7 +305,8 @@ class RepoMission(Repo):
         name: str,
         date: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        since: Optional[datetime] = None
     ) -> Optional[List[dict]]:
         from grapechallenge.domain.mission_template.repo_mission_template import MissionTemplateModel
         from grapechallenge.domain.user.repo_user import UserModel
@@ -290,84 +317,10 @@ class RepoMission(Repo):
             name: str,
             date: Optional[str] = None,
             start_date: Optional[str] = None,
-            end_date: Optional[str] = None
+            end_date: Optional[str] = None,
+            since: Optional[datetime] = None
         ):
-            from datetime import datetime, timezone, timedelta
-            from sqlalchemy import Date, cast
-            from grapechallenge.config import get_app_env
-
-            conditions = [MissionTemplateModel.name == name]
-
-            if date == "today":
-                app_env = get_app_env()
-
-                if app_env == "dev":
-                    today = datetime.now(timezone.utc).date()
-                    conditions.append(
-                        cast(model_class.created_at, Date) == today
-                    )
-                else:
-                    kst = timezone(timedelta(hours=9))
-                    today_kst = datetime.now(kst).date()
-                    conditions.append(
-                        cast(
-                            func.timezone(
-                                'Asia/Seoul',
-                                func.timezone('UTC', model_class.created_at)
-                            ),
-                            Date
-                        ) == today_kst
-                    )
-            elif date == "report":
-                from sqlalchemy import DateTime as SQLDateTime
-                app_env = get_app_env()
-
-                # Use custom date range if provided
-                if start_date and end_date:
-                    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-                    # start_date 22:00 ~ end_date+1 22:00
-                    start_22 = datetime.combine(start_dt.date(), datetime.min.time()).replace(hour=22)
-                    end_22 = datetime.combine(end_dt.date(), datetime.min.time()).replace(hour=22) + timedelta(days=1)
-
-                    if app_env == "prod":
-                        # convert KST to UTC
-                        start_22 = start_22 - timedelta(hours=9)
-                        end_22 = end_22 - timedelta(hours=9)
-
-                    conditions.append(
-                        and_(
-                            cast(model_class.created_at, SQLDateTime) >= start_22,
-                            cast(model_class.created_at, SQLDateTime) < end_22
-                        )
-                    )
-                elif app_env == "dev":
-                    now_local = datetime.now(timezone.utc)
-                    today_22 = datetime.combine(now_local.date(), datetime.min.time()).replace(hour=22)
-                    yesterday_22 = today_22 - timedelta(days=1)
-                    conditions.append(
-                        and_(
-                            cast(model_class.created_at, SQLDateTime) >= yesterday_22,
-                            cast(model_class.created_at, SQLDateTime) < today_22
-                        )
-                    )
-                else:
-                    kst = timezone(timedelta(hours=9))
-                    now_kst = datetime.now(kst)
-                    today_22_kst = datetime.combine(now_kst.date(), datetime.min.time()).replace(hour=22)
-                    yesterday_22_kst = today_22_kst - timedelta(days=1)
-
-                    # convert to UTC
-                    yesterday_22_utc = (yesterday_22_kst - timedelta(hours=9))
-                    today_22_utc = (today_22_kst - timedelta(hours=9))
-
-                    conditions.append(
-                        and_(
-                            cast(model_class.created_at, SQLDateTime) >= yesterday_22_utc,
-                            cast(model_class.created_at, SQLDateTime) < today_22_utc
-                        )
-                    )
+            conditions = cls._template_name_conditions(name, date, start_date, end_date, since)
 
             query = select(
                 model_class,
@@ -387,7 +340,7 @@ class RepoMission(Repo):
             result = await session.execute(query)
             return result.all()
 
-        founds = await find_by_template_name(session, MissionModel, name, date, start_date, end_date)
+        founds = await find_by_template_name(session, MissionModel, name, date, start_date, end_date, since)
         if not founds:
             return None
 
@@ -414,4 +367,28 @@ class RepoMission(Repo):
                 "user_updated_at": found[2].updated_at,
             }
             for found in founds
-        ]
\ No newline at end of file
+        ]
+
+    # #
+    # version
+
+    @classmethod
+    async def get_version_by_template_name(
+        cls,
+        session: AsyncSession,
+        name: str,
+        date: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        from grapechallenge.domain.mission_template.repo_mission_template import MissionTemplateModel
+        from grapechallenge.domain.user.repo_user import UserModel
+
+        return await cls.find_version(
+            session,
+            MissionModel,
+            *cls._template_name_conditions(name, date, since=since),
+            joins=(
+                (MissionTemplateModel, MissionModel.template_id == MissionTemplateModel.id),
+                (UserModel, MissionModel.user_id == UserModel.id),
+            )
+        )
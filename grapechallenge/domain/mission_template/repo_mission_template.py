@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy import Column, String, DateTime, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
@@ -208,4 +208,14 @@ class RepoMissionTemplate(Repo):
                 updated_at=item.updated_at,
             )
             for item in founds
-        ]
\ No newline at end of file
+        ]
+
+    # #
+    # version
+
+    @classmethod
+    async def get_version(
+        cls,
+        session: AsyncSession
+    ) -> Tuple[int, Optional[datetime]]:
+        return await cls.find_version(session, MissionTemplateModel)
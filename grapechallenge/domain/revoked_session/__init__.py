@@ -0,0 +1,2 @@
+# repo
+from .repo_revoked_session import RepoRevokedSession, RevokedSessionModel
@@ -0,0 +1,66 @@
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, delete, exists, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.database.database import Base
+from grapechallenge.domain.common.error import NotEditedError, NotFoundError
+from grapechallenge.domain.common.repo import Repo
+
+
+class RevokedSessionModel(Base):
+    __tablename__ = "revoked_sessions"
+
+    sid = Column(String(64), primary_key=True)
+    user_id = Column(String(36), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+
+
+class RepoRevokedSession(Repo):
+    __table__: str = "revoked_sessions"
+    # *로그아웃한 세션. 토큰이 만료되는 시각(expires_at)까지만 남긴다.
+
+    # #
+    # command
+
+    @classmethod
+    async def revoke(
+        cls,
+        session: AsyncSession,
+        sid: str,
+        user_id: str,
+        expires_at: datetime
+    ) -> None:
+        table = RevokedSessionModel.__table__
+
+        try:
+            # 만료된 기록은 더 볼 일이 없으므로 함께 지운다.
+            await session.execute(delete(table).where(table.c.expires_at < datetime.now()))
+            await session.execute(
+                pg_insert(table).values(
+                    sid=sid,
+                    user_id=user_id,
+                    expires_at=expires_at,
+                    created_at=datetime.now(),
+                ).on_conflict_do_nothing(index_elements=[table.c.sid])
+            )
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+    # #
+    # query
+
+    @classmethod
+    async def is_revoked(
+        cls,
+        session: AsyncSession,
+        sid: str
+    ) -> bool:
+        try:
+            result = await session.execute(
+                select(exists().where(RevokedSessionModel.sid == sid))
+            )
+            return bool(result.scalar())
+        except Exception as e:
+            raise NotFoundError(target=f"{cls.__table__}(sid={sid})", exception=e)
@@ -1,21 +1,26 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import distinct, select, func
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import distinct, select, func, update, exists
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
 
 from grapechallenge.database.database import Base
+from grapechallenge.domain.common.error import NotEditedError
 from grapechallenge.domain.common.repo import Repo, kst
 from grapechallenge.domain.user import User
 
 
 class UserModel(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_cell_name", "cell", "name"),
+    )
 
     id = Column(String(36), primary_key=True)
     cell = Column(String(100), nullable=False)
     name = Column(String(100), nullable=False)
+    participated_at = Column(DateTime, default=None, nullable=True)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=None, nullable=True)
 
@@ -140,6 +145,54 @@ class RepoUser(Repo):
             updated_at=updated.updated_at,
         )
 
+    @classmethod
+    async def mark_participated(
+        cls,
+        session: AsyncSession,
+        id: str
+    ) -> bool:
+        # 처음 참여한 경우에만 True 를 반환한다.
+        query = update(UserModel).where(
+            UserModel.id == id,
+            UserModel.participated_at.is_(None)
+        ).values(
+            participated_at=datetime.now()
+        )
+
+        try:
+            result = await session.execute(query)
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+        return result.rowcount == 1
+
+    @classmethod
+    async def mark_all_participated(
+        cls,
+        session: AsyncSession
+    ) -> int:
+        from grapechallenge.domain.mission.repo_mission import MissionModel
+
+        first_mission_at = select(
+            func.min(MissionModel.created_at)
+        ).where(
+            MissionModel.user_id == UserModel.id
+        ).scalar_subquery()
+
+        query = update(UserModel).where(
+            UserModel.participated_at.is_(None),
+            exists().where(MissionModel.user_id == UserModel.id)
+        ).values(
+            participated_at=first_mission_at
+        )
+
+        try:
+            result = await session.execute(query)
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+        return result.rowcount
+
     # #
     # query
 
@@ -0,0 +1,8 @@
+# value object
+from .count import Count
+
+# entity
+from .user_stat import UserStat
+
+# repo
+from .repo_user_stat import RepoUserStat, UserStatModel
@@ -0,0 +1,396 @@
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict
+from sqlalchemy import (
+    Column, String, Integer, Date, DateTime, ForeignKey, Index,
+    case, delete, func, literal, select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+
+from grapechallenge.config import get_settings
+from grapechallenge.database.database import Base
+from grapechallenge.domain.common.error import NotEditedError
+from grapechallenge.domain.common.repo import Repo, kst, local_date
+from grapechallenge.domain.user_stat import UserStat
+
+
+class UserStatModel(Base):
+    __tablename__ = "user_stats"
+    __table_args__ = (
+        Index("ix_user_stats_mission_count", "mission_count", "user_id"),
+        Index("ix_user_stats_cell_mission_count", "cell", "mission_count", "user_id"),
+        Index("ix_user_stats_fruit_count", "fruit_count", "user_id"),
+        Index("ix_user_stats_cell_fruit_count", "cell", "fruit_count", "user_id"),
+        Index("ix_user_stats_current_streak", "current_streak", "user_id"),
+    )
+
+    id = Column(String(36), primary_key=True)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+    cell = Column(String(100), nullable=False)
+    mission_count = Column(Integer, default=0, nullable=False)
+    fruit_count = Column(Integer, default=0, nullable=False)
+    current_streak = Column(Integer, default=0, nullable=False)
+    last_mission_date = Column(Date, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(DateTime, default=None, nullable=True)
+
+
+class RepoUserStat(Repo):
+    __table__: str = "user_stats"
+
+    # 정렬 기준 -> 정렬 컬럼
+    ORDERS = {
+        "mission": UserStatModel.mission_count,
+        "fruit": UserStatModel.fruit_count,
+        "streak": UserStatModel.current_streak,
+    }
+
+    def __init__(
+        self,
+        id: str,
+        user_stat: UserStat,
+        created_at: datetime,
+        updated_at: Optional[datetime],
+    ):
+        self.id = id
+        self.user_stat = user_stat
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    # #
+    # helper
+
+    @classmethod
+    def _model(
+        cls,
+        *,
+        user_stat: UserStat,
+        id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> dict:
+        return {
+            "id": id or str(uuid4()),
+            **(user_stat.to_dict()),
+            "created_at": created_at or datetime.now(),
+            "updated_at": updated_at,
+        }
+
+    @classmethod
+    def _from_row(cls, row) -> "RepoUserStat":
+        return cls(
+            id=row["id"],
+            user_stat=UserStat.from_dict({
+                "user_id": row["user_id"],
+                "cell": row["cell"],
+                "mission_count": row["mission_count"],
+                "fruit_count": row["fruit_count"],
+                "current_streak": row["current_streak"],
+                "last_mission_date": row["last_mission_date"],
+            }),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "created_at": kst(self.created_at),
+            "updated_at": kst(self.updated_at),
+        }
+
+    # #
+    # command
+
+    # *증가 명령은 users 에서 cell 을 읽어 한 번의 upsert 로 처리한다.
+
+    @classmethod
+    async def increase_mission_count(
+        cls,
+        session: AsyncSession,
+        user_id: str
+    ) -> Optional["RepoUserStat"]:
+        from grapechallenge.domain.user.repo_user import UserModel
+
+        today = get_settings().today()
+        yesterday = today - timedelta(days=1)
+        now = datetime.now()
+        table = UserStatModel.__table__
+
+        query = pg_insert(table).from_select(
+            [
+                "id", "user_id", "cell",
+                "mission_count", "fruit_count", "current_streak",
+                "last_mission_date", "created_at",
+            ],
+            select(
+                literal(str(uuid4())), UserModel.id, UserModel.cell,
+                literal(1), literal(0), literal(1),
+                literal(today), literal(now),
+            ).where(
+                UserModel.id == user_id
+            )
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                "mission_count": table.c.mission_count + 1,
+                "current_streak": case(
+                    (table.c.last_mission_date == today, table.c.current_streak),
+                    (table.c.last_mission_date == yesterday, table.c.current_streak + 1),
+                    else_=1
+                ),
+                "last_mission_date": today,
+                "updated_at": now,
+            }
+        ).returning(*table.c)
+
+        try:
+            result = await session.execute(query)
+            row = result.mappings().first()
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+        if not row:
+            return None
+
+        return cls._from_row(row)
+
+    @classmethod
+    async def increase_fruit_count(
+        cls,
+        session: AsyncSession,
+        user_id: str
+    ) -> Optional["RepoUserStat"]:
+        from grapechallenge.domain.user.repo_user import UserModel
+
+        now = datetime.now()
+        table = UserStatModel.__table__
+
+        query = pg_insert(table).from_select(
+            [
+                "id", "user_id", "cell",
+                "mission_count", "fruit_count", "current_streak",
+                "created_at",
+            ],
+            select(
+                literal(str(uuid4())), UserModel.id, UserModel.cell,
+                literal(0), literal(1), literal(0),
+                literal(now),
+            ).where(
+                UserModel.id == user_id
+            )
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                "fruit_count": table.c.fruit_count + 1,
+                "updated_at": now,
+            }
+        ).returning(*table.c)
+
+        try:
+            result = await session.execute(query)
+            row = result.mappings().first()
+        except Exception as e:
+            raise NotEditedError(target=cls.__table__, exception=e)
+
+        if not row:
+            return None
+
+        return cls._from_row(row)
+
+    @classmethod
+    async def rebuild_all(
+        cls,
+        session: AsyncSession
+    ) -> int:
+        from grapechallenge.domain.user.repo_user import UserModel
+        from grapechallenge.domain.fruit.repo_fruit import FruitModel
+        from grapechallenge.domain.mission.repo_mission import MissionModel
+
+        async def find_mission_counts(session: AsyncSession) -> Dict[str, int]:
+            query = select(
+                MissionModel.user_id,
+                func.count(MissionModel.id)
+            ).group_by(
+                MissionModel.user_id
+            )
+            result = await session.execute(query)
+            return {user_id: count for user_id, count in result.all()}
+
+        async def find_fruit_counts(session: AsyncSession) -> Dict[str, int]:
+            query = select(
+                FruitModel.user_id,
+                func.count(FruitModel.id)
+            ).where(
+                FruitModel.status == "COMPLETED"
+            ).group_by(
+                FruitModel.user_id
+            )
+            result = await session.execute(query)
+            return {user_id: count for user_id, count in result.all()}
+
+        async def find_mission_days(session: AsyncSession) -> Dict[str, List[date]]:
+            day = local_date(MissionModel.created_at)
+            query = select(
+                MissionModel.user_id,
+                day
+            ).distinct().order_by(
+                MissionModel.user_id,
+                day
+            )
+            result = await session.execute(query)
+
+            days: Dict[str, List[date]] = {}
+            for user_id, mission_day in result.all():
+                days.setdefault(user_id, []).append(mission_day)
+            return days
+
+        async def find_cells(session: AsyncSession) -> Dict[str, str]:
+            result = await session.execute(select(UserModel.id, UserModel.cell))
+            return {user_id: cell for user_id, cell in result.all()}
+
+        def last_streak(days: List[date]) -> int:
+            streak = 1
+            for prev, curr in zip(reversed(days[:-1]), reversed(days)):
+                if (curr - prev).days != 1:
+                    break
+                streak += 1
+            return streak
+
+        mission_counts = await find_mission_counts(session)
+        fruit_counts = await find_fruit_counts(session)
+        mission_days = await find_mission_days(session)
+        cells = await find_cells(session)
+
+        data_list = []
+        for user_id in (set(mission_counts) | set(fruit_counts)) & set(cells):
+            days = mission_days.get(user_id, [])
+            data_list.append(cls._model(
+                user_stat=UserStat.from_dict({
+                    "user_id": user_id,
+                    "cell": cells[user_id],
+                    "mission_count": mission_counts.get(user_id, 0),
+                    "fruit_count": fruit_counts.get(user_id, 0),
+                    "current_streak": last_streak(days) if days else 0,
+                    "last_mission_date": days[-1] if days else None,
+                })
+            ))
+
+        await session.execute(delete(UserStatModel))
+        if data_list:
+            await cls.insert_many(
+                session=session,
+                model_class=UserStatModel,
+                data_list=data_list
+            )
+
+        return len(data_list)
+
+    # #
+    # query
+
+    @classmethod
+    async def get_by_user_id(
+        cls,
+        session: AsyncSession,
+        user_id: str
+    ) -> Optional["RepoUserStat"]:
+
+        founds = await cls.find_filtered_by_fields(
+            session=session,
+            model_class=UserStatModel,
+            user_id=user_id
+        )
+
+        if not founds:
+            return None
+
+        found = founds[0]
+
+        return cls(
+            id=found.id,
+            user_stat=UserStat.from_dict({
+                "user_id": found.user_id,
+                "cell": found.cell,
+                "mission_count": found.mission_count,
+                "fruit_count": found.fruit_count,
+                "current_streak": found.current_streak,
+                "last_mission_date": found.last_mission_date,
+            }),
+            created_at=found.created_at,
+            updated_at=found.updated_at,
+        )
+
+    # #
+    # joined
+
+    # *joined query는 dict를 반환한다.
+
+    @classmethod
+    async def get_leaderboard(
+        cls,
+        session: AsyncSession,
+        order: str = "mission",
+        cell: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Optional[List[dict]]:
+        from grapechallenge.domain.user.repo_user import UserModel
+
+        today = get_settings().today()
+        order_column = cls.ORDERS[order]
+
+        async def find_leaderboard(
+            session: AsyncSession,
+            model_class
+        ):
+            query = select(
+                model_class,
+                UserModel.name
+            ).join(
+                UserModel,
+                model_class.user_id == UserModel.id
+            )
+
+            if cell:
+                query = query.where(model_class.cell == cell)
+
+            # 어제 이후로 기록이 없는 연속 기록은 순위에서 제외한다.
+            if order == "streak":
+                query = query.where(model_class.last_mission_date >= today - timedelta(days=1))
+
+            # *(count, user_id) 인덱스를 거꾸로 읽을 수 있도록 두 열 모두 내림차순으로 정렬한다.
+            query = query.order_by(
+                order_column.desc(),
+                model_class.user_id.desc()
+            ).limit(limit).offset(offset)
+
+            result = await session.execute(query)
+            return result.all()
+
+        founds = await find_leaderboard(session, UserStatModel)
+
+        if not founds:
+            return None
+
+        return [
+            {
+                "rank": offset + index + 1,
+                "user_id": found[0].user_id,
+                "user_cell": found[0].cell,
+                "user_name": found[1],
+                "mission_count": found[0].mission_count,
+                "fruit_count": found[0].fruit_count,
+                "current_streak": UserStat.from_dict({
+                    "user_id": found[0].user_id,
+                    "cell": found[0].cell,
+                    "current_streak": found[0].current_streak,
+                    "last_mission_date": found[0].last_mission_date,
+                }).streak_on(today),
+                "last_mission_date": found[0].last_mission_date,
+            }
+            for index, found in enumerate(founds)
+        ]
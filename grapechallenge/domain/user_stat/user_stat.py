@@ -0,0 +1,83 @@
+from datetime import date
+from typing import Optional
+from dataclasses import dataclass
+from pydantic import ValidationError
+
+from grapechallenge.domain.common.error import InvalidTypeError
+from grapechallenge.domain.user_stat.count import Count
+
+
+@dataclass(frozen=True)
+class UserStat:
+    user_id: str
+    cell: str
+    mission_count: Count
+    fruit_count: Count
+    current_streak: Count
+    last_mission_date: Optional[date]
+
+    # #
+    # factory
+
+    @classmethod
+    def new(
+        cls,
+        *,
+        user_id: str,
+        cell: str,
+        mission_count: Count,
+        fruit_count: Count,
+        current_streak: Count,
+        last_mission_date: Optional[date],
+    ) -> "UserStat":
+        try:
+            return cls(
+                user_id=user_id,
+                cell=cell,
+                mission_count=mission_count,
+                fruit_count=fruit_count,
+                current_streak=current_streak,
+                last_mission_date=last_mission_date,
+            )
+        except ValidationError as e:
+            raise InvalidTypeError.from_pydantic(e)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UserStat":
+        return cls.new(
+            user_id=data.get("user_id", None),          #type: ignore
+            cell=data.get("cell", None),                #type: ignore
+            mission_count=Count.from_int(
+                data.get("mission_count", 0)
+            ),
+            fruit_count=Count.from_int(
+                data.get("fruit_count", 0)
+            ),
+            current_streak=Count.from_int(
+                data.get("current_streak", 0)
+            ),
+            last_mission_date=data.get("last_mission_date", None),
+        )
+
+    # #
+    # query
+
+    def to_dict(self) -> dict:
+        return {
+            "user_id": self.user_id,
+            "cell": self.cell,
+            "mission_count": self.mission_count.to_int(),
+            "fruit_count": self.fruit_count.to_int(),
+            "current_streak": self.current_streak.to_int(),
+            "last_mission_date": self.last_mission_date,
+        }
+
+    def streak_on(self, today: date) -> int:
+        # 어제 이후로 미션이 없으면 연속 기록은 끊긴 것으로 본다.
+        if self.last_mission_date is None:
+            return 0
+
+        if (today - self.last_mission_date).days > 1:
+            return 0
+
+        return self.current_streak.to_int()
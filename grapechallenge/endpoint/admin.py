@@ -0,0 +1,19 @@
+from fastapi import Request, Depends
+from fastapi.responses import Response
+
+from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
+from grapechallenge.usecase import (
+    # query
+    GetAdminDashboardInput, get_admin_dashboard as get_admin_dashboard_usecase,
+)
+
+
+# #
+# Query
+
+async def get_admin_dashboard(request: Request, input: GetAdminDashboardInput = Depends()) -> Response:
+    async with transactional_session_helper() as session:
+        res = await get_admin_dashboard_usecase(session=session, request=request, input=input)
+
+    return usecase_response(res)
@@ -1,7 +1,8 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
 from grapechallenge.usecase import (
     # command
     CreateBibleVerseInput, create_bible_verse,
@@ -14,25 +15,25 @@ from grapechallenge.usecase import (
 # #
 # Command
 
-async def post_bible_verse(request: Request, input: CreateBibleVerseInput) -> JSONResponse:
+async def post_bible_verse(request: Request, input: CreateBibleVerseInput) -> Response:
     async with transactional_session_helper() as session:
         res = await create_bible_verse(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_bible_verses(request: Request, input: CreateBibleVersesInput) -> JSONResponse:
+async def post_bible_verses(request: Request, input: CreateBibleVersesInput) -> Response:
     async with transactional_session_helper() as session:
         res = await create_bible_verses(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
 # #
 # Query
 
-async def get_today_verse(request: Request, input: GetTodayBibleVerseInput = Depends()) -> JSONResponse:
+async def get_today_verse(request: Request, input: GetTodayBibleVerseInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_today_bible_verse(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
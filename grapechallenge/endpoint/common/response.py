@@ -0,0 +1,26 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+from grapechallenge.usecase.common.models import UsecaseOutput
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse serialized with orjson.
+
+    datetime values are written natively (isoformat, with the offset when the
+    value is timezone-aware), so usecases can hand over datetimes instead of
+    formatting every timestamp into a string themselves.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def usecase_response(res: UsecaseOutput) -> Response:
+    # 304 는 본문이 없어야 한다.
+    if res.code == 304:
+        return Response(status_code=304, headers=res.headers)
+
+    return ORJSONResponse(content=res.content, status_code=res.code, headers=res.headers)
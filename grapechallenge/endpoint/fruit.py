@@ -1,7 +1,8 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
 from grapechallenge.usecase import (
     # command
     CreateFruitInput, create_fruit,
@@ -19,60 +20,68 @@ from grapechallenge.usecase import (
 # #
 # Command
 
-async def post_fruit(request: Request, input: CreateFruitInput) -> JSONResponse:
+async def post_fruit(request: Request, input: CreateFruitInput) -> Response:
     async with transactional_session_helper() as session:
         res = await create_fruit(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_harvest_fruit(request: Request, input: HarvestFruitInput) -> JSONResponse:
+async def post_harvest_fruit(request: Request, input: HarvestFruitInput) -> Response:
     async with transactional_session_helper() as session:
         res = await harvest_fruit(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
 # #
 # Query
 
-async def get_my_fruits(request: Request, input: GetMyFruitsInput = Depends()) -> JSONResponse:
+async def get_my_fruits(request: Request, input: GetMyFruitsInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_my_fruits_usecase(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def get_my_in_progress_fruit(request: Request, input: GetMyInProgressFruitInput = Depends()) -> JSONResponse:
+async def get_my_in_progress_fruit(request: Request, input: GetMyInProgressFruitInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_my_in_progress_fruit_usecase(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def count_my_completed_fruits(request: Request, input: CountMyCompletedFruitsInput = Depends()) -> JSONResponse:
+async def count_my_completed_fruits(request: Request, input: CountMyCompletedFruitsInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await count_my_completed_fruits_usecase(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def get_fruits_by_cell_with_template(request: Request, input: GetFruitsByCellWithTemplateInput) -> JSONResponse:
+async def get_fruits_by_cell(request: Request, input: GetFruitsByCellWithTemplateInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_fruits_by_cell_with_template_usecase(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def get_fruit_count(request: Request, input: GetCountAboutEveryFruitInput = Depends()) -> JSONResponse:
+async def get_fruits_by_cell_with_template(request: Request, input: GetFruitsByCellWithTemplateInput) -> Response:
+    # 이전 클라이언트용 (POST 는 브라우저가 재검증하지 않는다)
+    async with transactional_session_helper() as session:
+        res = await get_fruits_by_cell_with_template_usecase(session=session, request=request, input=input)
+
+    return usecase_response(res)
+
+
+async def get_fruit_count(request: Request, input: GetCountAboutEveryFruitInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_count_about_every_fruit(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def get_fruit_stats_by_template(request: Request, input: GetFruitStatsByTemplateInput = Depends()) -> JSONResponse:
+async def get_fruit_stats_by_template(request: Request, input: GetFruitStatsByTemplateInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_fruit_stats_by_template_usecase(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
\ No newline at end of file
+    return usecase_response(res)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
 from grapechallenge.usecase import (
     # query
     GetFruitTemplateByNameInput, get_fruit_template_by_name,
@@ -11,8 +12,8 @@ from grapechallenge.usecase import (
 # #
 # Query
 
-async def get_fruit_template(request: Request, input: GetFruitTemplateByNameInput = Depends()) -> JSONResponse:
+async def get_fruit_template(request: Request, input: GetFruitTemplateByNameInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_fruit_template_by_name(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
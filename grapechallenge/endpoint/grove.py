@@ -0,0 +1,18 @@
+from fastapi import Request, Depends
+from fastapi.responses import Response
+
+from grapechallenge.endpoint.common.response import usecase_response
+from grapechallenge.usecase import (
+    # query
+    GetGroveBootstrapInput, get_grove_bootstrap as get_grove_bootstrap_usecase,
+)
+
+
+# #
+# Query
+
+async def get_grove_bootstrap(request: Request, input: GetGroveBootstrapInput = Depends()) -> Response:
+    # 쿼리마다 세션을 따로 열어 동시에 실행한다. (usecase 참고)
+    res = await get_grove_bootstrap_usecase(request=request, input=input)
+
+    return usecase_response(res)
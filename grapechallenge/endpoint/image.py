@@ -0,0 +1,28 @@
+import asyncio
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+from grapechallenge.assets.image import derivative
+from grapechallenge.endpoint.common.response import ORJSONResponse
+
+
+# #
+# Query
+
+async def get_image(request: Request, name: str, w: Optional[int] = None) -> Response:
+    # 처음 요청된 크기/형식은 이미지를 만들어야 하므로 이벤트 루프 밖에서 처리한다.
+    found = await asyncio.to_thread(derivative, name, w, request.headers.get("accept", ""))
+    if found is None:
+        return ORJSONResponse(content={"error": "Image not found"}, status_code=404)
+
+    path, media_type = found
+    return FileResponse(
+        path,
+        media_type=media_type,
+        headers={
+            # URL 에 원본의 해시(v)가 들어가므로 오래 캐시해도 된다.
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Vary": "Accept",
+        },
+    )
@@ -0,0 +1,19 @@
+from fastapi import Request
+from fastapi.responses import Response
+
+from grapechallenge.config import get_settings
+from grapechallenge.database.instrument import route_query_stats
+from grapechallenge.endpoint.common.response import ORJSONResponse
+from grapechallenge.metrics import registry, CONTENT_TYPE
+
+
+# #
+# Query
+
+async def get_metrics(request: Request) -> Response:
+    return Response(content=registry.expose(), media_type=CONTENT_TYPE)
+
+
+async def get_query_metrics(request: Request) -> ORJSONResponse:
+    # SQL 본문(테이블, 컬럼, 조건)은 dev 에서만 보여준다.
+    return ORJSONResponse(content=route_query_stats.summary(statements=get_settings().is_dev), status_code=200)
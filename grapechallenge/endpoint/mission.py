@@ -1,7 +1,9 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response, StreamingResponse
 
 from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
+from grapechallenge.realtime import get_broker, event_stream, MEDIA_TYPE, HEADERS
 from grapechallenge.usecase import (
     # command
     CompleteMissionInput, complete_mission,
@@ -11,7 +13,8 @@ from grapechallenge.usecase import (
     # query
     GetMissionTemplatesInput, get_mission_templates,
     GetMissionsByNameInput, get_missions_by_name,
-    WriteDailyMissionReportInput, write_daily_mission_report,
+    SubscribeMissionEventsInput, subscribe_mission_events,
+    WriteDailyMissionReportInput, write_daily_mission_report, render_daily_mission_report,
     get_event_missions_in_progress,
 )
 
@@ -19,54 +22,75 @@ from grapechallenge.usecase import (
 # #
 # Command
 
-async def post_mission(request: Request, input: CompleteMissionInput) -> JSONResponse:
+async def post_mission(request: Request, input: CompleteMissionInput) -> Response:
     async with transactional_session_helper() as session:
         res = await complete_mission(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_test_mission(request: Request, input: CompleteTestMissionInput) -> JSONResponse:
+async def post_test_mission(request: Request, input: CompleteTestMissionInput) -> Response:
     async with transactional_session_helper() as session:
         res = await complete_test_mission(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_interaction(request: Request, input: InteractionMissionInput) -> JSONResponse:
+async def post_interaction(request: Request, input: InteractionMissionInput) -> Response:
     async with transactional_session_helper() as session:
         res = await interaction_mission(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_event_mission(request: Request, input: CompleteEventMissionInput) -> JSONResponse:
+async def post_event_mission(request: Request, input: CompleteEventMissionInput) -> Response:
     async with transactional_session_helper() as session:
         res = await complete_event_mission(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
 # #
 # Query
 
-async def get_missions(request: Request, input: GetMissionsByNameInput = Depends()) -> JSONResponse:
+async def get_missions(request: Request, input: GetMissionsByNameInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_missions_by_name(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def get_daily_mission_report(request: Request, input: WriteDailyMissionReportInput = Depends()) -> JSONResponse:
+async def get_mission_events(request: Request, input: SubscribeMissionEventsInput = Depends()) -> Response:
+    async with transactional_session_helper() as session:
+        res = await subscribe_mission_events(session=session, request=request, input=input)
+
+    if res.code != 200:
+        return usecase_response(res)
+
+    # 세션(커넥션)을 돌려준 뒤에 스트림을 연다.
+    return StreamingResponse(
+        event_stream(get_broker(), res.content["channel"]),
+        media_type=MEDIA_TYPE,
+        headers=HEADERS,
+    )
+
+
+async def get_daily_mission_report(request: Request, input: WriteDailyMissionReportInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await write_daily_mission_report(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    if res.code != 200:
+        return usecase_response(res)
+
+    # 세션(커넥션)을 돌려준 뒤에 이미지를 그린다.
+    res = await render_daily_mission_report(founds=res.content["missions"], input=input)
+
+    return usecase_response(res)
 
 
-async def get_event_missions(request: Request) -> JSONResponse:
+async def get_event_missions(request: Request) -> Response:
     async with transactional_session_helper() as session:
         res = await get_event_missions_in_progress(session=session, request=request)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
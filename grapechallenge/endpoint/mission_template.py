@@ -1,7 +1,8 @@
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
 from grapechallenge.usecase import (
     # command
     UpdateMissionTemplateInput, update_mission_template,
@@ -13,18 +14,18 @@ from grapechallenge.usecase import (
 # #
 # Command
 
-async def patch_mission_template(request: Request, input: UpdateMissionTemplateInput) -> JSONResponse:
+async def patch_mission_template(request: Request, input: UpdateMissionTemplateInput) -> Response:
     async with transactional_session_helper() as session:
         res = await update_mission_template(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
 # #
 # Query
 
-async def get_every_mission_template(request: Request, input: GetMissionTemplatesInput = Depends()) -> JSONResponse:
+async def get_every_mission_template(request: Request, input: GetMissionTemplatesInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_mission_templates(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
@@ -0,0 +1,19 @@
+from fastapi import Request, Depends
+from fastapi.responses import Response
+
+from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import usecase_response
+from grapechallenge.usecase import (
+    # query
+    GetLeaderboardInput, get_leaderboard as get_leaderboard_usecase,
+)
+
+
+# #
+# Query
+
+async def get_leaderboard(request: Request, input: GetLeaderboardInput = Depends()) -> Response:
+    async with transactional_session_helper() as session:
+        res = await get_leaderboard_usecase(session=session, request=request, input=input)
+
+    return usecase_response(res)
@@ -1,14 +1,13 @@
 from functools import wraps
-from urllib.parse import unquote
 from fastapi import Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pathlib import Path
-from grapechallenge.config import get_app_env
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from grapechallenge.assets.page import ShellCache, create_environment, compile_templates
+from grapechallenge.config import get_settings
+from grapechallenge.usecase.common.auth import current_user
 
-# Setup Jinja2 templates
-BASE_PATH = Path(__file__).resolve().parent.parent
-templates = Jinja2Templates(directory=str(BASE_PATH / "template"))
+# Setup Jinja2 templates (bytecode is cached on disk, rendered pages in memory)
+templates = create_environment()
+shells = ShellCache(templates)
 
 
 # #
@@ -28,8 +27,7 @@ def require_auth(redirect_if_fail: str = "/login"):
             if request is None:
                 raise ValueError("Request object not found in function arguments")
 
-            user_id = request.cookies.get("user_id")
-            if not user_id:
+            if get_current_user(request) is None:
                 return RedirectResponse(url=redirect_if_fail, status_code=303)
 
             return await func(*args, **kwargs)
@@ -38,96 +36,69 @@ def require_auth(redirect_if_fail: str = "/login"):
     return decorator
 
 def get_current_user(request: Request) -> dict | None:
-    user_id = request.cookies.get("user_id")
-    user_cell = request.cookies.get("user_cell")
-    user_name = request.cookies.get("user_name")
+    return current_user(request)
 
-    if user_id:
-        return {
-            "user_id": user_id,
-            "user_cell": (
-                unquote(user_cell) if user_cell else ""
-            ),
-            "user_name": (
-                unquote(user_name) if user_name else ""
-            )
-        }
 
-    return None
+# #
+# Shell helpers
+
+def warm_templates() -> int:
+    # 서버 시작 시 모든 페이지를 미리 컴파일한다.
+    return compile_templates(templates)
+
+
+def render_shell(request: Request, name: str, **context: str) -> Response:
+    """Serve a cached page shell; user data is filled in client-side (cookies/API)."""
+    shell = shells.get(name, **context)
+    headers = {
+        "ETag": shell.etag,
+        # 로그인 여부에 따라 redirect 되므로 공유 캐시에 두지 않고 매번 검증한다.
+        "Cache-Control": "private, no-cache",
+        "Vary": "Cookie",
+    }
+
+    if shell.etag in [tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return HTMLResponse(content=shell.body, headers=headers)
 
 
 # #
 # Template endpoints
 
-async def login_page(request: Request) -> HTMLResponse:
-    return templates.TemplateResponse("login.html", {
-        "request": request
-    })
+async def login_page(request: Request) -> Response:
+    return render_shell(request, "login.html")
 
 
-async def christmas_login_page(request: Request) -> HTMLResponse:
-    return templates.TemplateResponse("login_christmas.html", {
-        "request": request
-    })
+async def christmas_login_page(request: Request) -> Response:
+    return render_shell(request, "login_christmas.html")
 
 @require_auth(redirect_if_fail="/christmas/login")
-async def christmas_home_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    app_env = get_app_env()
-    return templates.TemplateResponse("home_christmas.html", {
-        "request": request,
-        "user": user,
-        "app_env": app_env
-    })
+async def christmas_home_page(request: Request) -> Response:
+    return render_shell(request, "home_christmas.html", app_env=get_settings().app_env)
 
 @require_auth(redirect_if_fail="/christmas/login")
-async def christmas_diary_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    return templates.TemplateResponse("diary_christmas.html", {
-        "request": request,
-        "user": user
-    })
+async def christmas_diary_page(request: Request) -> Response:
+    return render_shell(request, "diary_christmas.html")
 
 @require_auth()
-async def home_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    app_env = get_app_env()
-    return templates.TemplateResponse("home.html", {
-        "request": request,
-        "user": user,
-        "app_env": app_env
-    })
+async def home_page(request: Request) -> Response:
+    return render_shell(request, "home.html", app_env=get_settings().app_env)
 
 @require_auth()
-async def grove_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    return templates.TemplateResponse("grove.html", {
-        "request": request,
-        "user": user
-    })
+async def grove_page(request: Request) -> Response:
+    return render_shell(request, "grove.html")
 
 @require_auth()
-async def diary_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    return templates.TemplateResponse("diary.html", {
-        "request": request,
-        "user": user
-    })
+async def diary_page(request: Request) -> Response:
+    return render_shell(request, "diary.html")
 
 
 @require_auth()
-async def report_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    return templates.TemplateResponse("report.html", {
-        "request": request,
-        "user": user
-    })
+async def report_page(request: Request) -> Response:
+    return render_shell(request, "report.html")
 
 # admin
 @require_auth()
-async def admin_page(request: Request) -> HTMLResponse:
-    user = get_current_user(request)
-    return templates.TemplateResponse("admin.html", {
-        "request": request,
-        "user": user
-    })
\ No newline at end of file
+async def admin_page(request: Request) -> Response:
+    return render_shell(request, "admin.html")
\ No newline at end of file
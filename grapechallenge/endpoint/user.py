@@ -1,8 +1,10 @@
 from urllib.parse import quote
 from fastapi import Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
+from grapechallenge.auth import SESSION_COOKIE, create_session, destroy_session
 from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.endpoint.common.response import ORJSONResponse, usecase_response
 from grapechallenge.usecase import (
     # command
     CreateUserInput, create_user,
@@ -18,42 +20,49 @@ from grapechallenge.usecase import (
 # #
 # Command
 
-async def post_user(request: Request, input: CreateUserInput) -> JSONResponse:
+async def post_user(request: Request, input: CreateUserInput) -> Response:
     async with transactional_session_helper() as session:
         res = await create_user(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_users(request: Request, input: CreateUsersInput) -> JSONResponse:
+async def post_users(request: Request, input: CreateUsersInput) -> Response:
     async with transactional_session_helper() as session:
         res = await create_users(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def post_login(request: Request, input: LoginUserInput) -> JSONResponse:
+async def post_login(request: Request, input: LoginUserInput) -> ORJSONResponse:
     async with transactional_session_helper() as session:
         res = await login_user(session=session, request=request, input=input)
 
-    response = JSONResponse(content=res.content, status_code=res.code)
+    response = ORJSONResponse(content=res.content, status_code=res.code)
 
-    # 로그인 성공 시 쿠키 설정
+    # 로그인 성공 시 세션 생성 및 쿠키 설정
     if res.code == 200 and res.content.get("user_id"):
-        response.set_cookie(key="user_id", value=str(res.content["user_id"]), httponly=True, path="/", max_age=30*24*60*60)
+        token = create_session({
+            "user_id": str(res.content["user_id"]),
+            "user_cell": res.content["user_cell"],
+            "user_name": res.content["user_name"],
+        })
+        response.set_cookie(key=SESSION_COOKIE, value=token, httponly=True, samesite="lax", path="/", max_age=30*24*60*60)
         response.set_cookie(key="user_cell", value=quote(input.cell), httponly=False, path="/", max_age=30*24*60*60)
         response.set_cookie(key="user_name", value=quote(input.name), httponly=False, path="/", max_age=30*24*60*60)
 
     return response
 
 
-async def post_logout(request: Request, input: LogoutUserInput) -> JSONResponse:
+async def post_logout(request: Request, input: LogoutUserInput) -> ORJSONResponse:
     async with transactional_session_helper() as session:
         res = await logout_user(session=session, request=request, input=input)
 
-    response = JSONResponse(content=res.content, status_code=res.code)
+    response = ORJSONResponse(content=res.content, status_code=res.code)
 
-    # 쿠키 삭제 (max_age=0으로 설정하여 즉시 만료)
+    # 세션 및 쿠키 삭제 (max_age=0으로 설정하여 즉시 만료)
+    destroy_session(request.cookies.get(SESSION_COOKIE))
+    response.delete_cookie(key=SESSION_COOKIE, path="/")
     response.delete_cookie(key="user_id", path="/")
     response.delete_cookie(key="user_cell", path="/")
     response.delete_cookie(key="user_name", path="/")
@@ -64,15 +73,15 @@ async def post_logout(request: Request, input: LogoutUserInput) -> JSONResponse:
 # #
 # Query
 
-async def get_cells(request: Request, input: GetEveryCellInput = Depends()) -> JSONResponse:
+async def get_cells(request: Request, input: GetEveryCellInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_every_cell(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
+    return usecase_response(res)
 
 
-async def get_user_count(request: Request, input: GetCountAboutEveryUserInput = Depends()) -> JSONResponse:
+async def get_user_count(request: Request, input: GetCountAboutEveryUserInput = Depends()) -> Response:
     async with transactional_session_helper() as session:
         res = await get_count_about_every_user(session=session, request=request, input=input)
 
-    return JSONResponse(content=res.content, status_code=res.code)
\ No newline at end of file
+    return usecase_response(res)
\ No newline at end of file
@@ -0,0 +1,10 @@
+# registry
+from .registry import Counter, Gauge, Histogram, Registry, registry, CONTENT_TYPE
+
+# metric
+from .app import (
+    http_requests_total,
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    db_pool_connections,
+)
@@ -0,0 +1,54 @@
+from grapechallenge.metrics.registry import Counter, Gauge, Histogram, registry
+
+
+# #
+# http
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total",
+    "HTTP requests by route and status code.",
+    ("method", "route", "status"),
+))
+
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route"),
+))
+
+http_requests_in_progress = registry.register(Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ("method",),
+))
+
+
+# #
+# database
+
+db_pool_connections = registry.register(Gauge(
+    "db_pool_connections",
+    "Database connection pool state, summed over process-wide engines.",
+    ("state",),
+))
+
+
+@registry.collector
+def collect_db_pool():
+    from grapechallenge.database.database import DatabaseClient
+
+    states = {"size": 0, "checked_in": 0, "checked_out": 0, "overflow": 0}
+
+    for client in DatabaseClient.shared_clients():
+        pool = client.engine.sync_engine.pool
+        # NullPool 등 크기가 없는 풀은 건너뛴다.
+        if not hasattr(pool, "checkedout"):
+            continue
+
+        states["size"] += pool.size()  # type: ignore
+        states["checked_in"] += pool.checkedin()  # type: ignore
+        states["checked_out"] += pool.checkedout()  # type: ignore
+        states["overflow"] += max(pool.overflow(), 0)  # type: ignore
+
+    for state, value in states.items():
+        db_pool_connections.set(value, state=state)
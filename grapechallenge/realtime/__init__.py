@@ -0,0 +1,5 @@
+# broker
+from .broker import Broker, LocalBroker, PostgresBroker, Subscription, get_broker, set_broker, mission_channel
+
+# stream
+from .stream import event_stream, format_event, MEDIA_TYPE, HEADERS
@@ -0,0 +1,212 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.config import get_realtime_broker, get_settings
+
+
+# Postgres NOTIFY 채널 (모든 이벤트가 이 채널 하나로 오간다.)
+NOTIFY_CHANNEL = "grape_events"
+
+# NOTIFY payload 는 8000 bytes 를 넘을 수 없다.
+NOTIFY_LIMIT = 7900
+
+# 구독자 하나가 쌓아 둘 수 있는 이벤트 수
+QUEUE_SIZE = 100
+
+
+def mission_channel(template_id: str) -> str:
+    return f"mission_template:{template_id}"
+
+
+###################################
+## Subscription
+###################################
+
+class Subscription:
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.overflowed = False
+
+    def deliver(self, message: dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 따라오지 못한 구독자는 목록을 새로 받도록 한다. (stream 참고)
+            self.overflowed = True
+
+    async def next(self, timeout: float) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+###################################
+## Broker
+###################################
+
+class Broker(ABC):
+    """Fans committed events out to the SSE subscribers of this process."""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(channel)
+        self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.channel)
+        if subscriptions is None:
+            return
+
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.channel]
+
+    def dispatch(self, message: dict) -> None:
+        for subscription in list(self._subscriptions.get(message["channel"], ())):
+            subscription.deliver(message)
+
+    def count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    @abstractmethod
+    async def publish(self, session: AsyncSession, channel: str, event: str, data: dict) -> None:
+        """Send `event` to `channel` once the session's transaction commits."""
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class LocalBroker(Broker):
+    """Single-process broker: events are dispatched in the session's after_commit hook."""
+
+    PENDING = "pending_events"
+
+    async def publish(self, session: AsyncSession, channel: str, event: str, data: dict) -> None:
+        if self.PENDING not in session.info:
+            session.info[self.PENDING] = []
+            sync_session = session.sync_session
+            event_listen(sync_session, "after_commit", self._flush)
+            event_listen(sync_session, "after_rollback", self._discard)
+
+        session.info[self.PENDING].append({"channel": channel, "event": event, "data": data})
+
+    def _flush(self, session) -> None:
+        for message in session.info.pop(self.PENDING, []):
+            self.dispatch(message)
+
+    def _discard(self, session) -> None:
+        session.info.pop(self.PENDING, None)
+
+
+def event_listen(target, identifier: str, fn) -> None:
+    if not event.contains(target, identifier, fn):
+        event.listen(target, identifier, fn)
+
+
+class PostgresBroker(Broker):
+    """Multi-worker broker over LISTEN/NOTIFY.
+
+    pg_notify runs inside the writer's transaction, so Postgres delivers it
+    only on commit, to every worker (this one included) listening on
+    NOTIFY_CHANNEL.
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self._dsn = dsn
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, session: AsyncSession, channel: str, event: str, data: dict) -> None:
+        payload = json.dumps({"channel": channel, "event": event, "data": data}, ensure_ascii=False)
+
+        if len(payload.encode("utf-8")) > NOTIFY_LIMIT:
+            # 너무 크면 id 만 보내고 클라이언트가 목록을 다시 받게 한다.
+            payload = json.dumps({"channel": channel, "event": "reset", "data": {"id": data.get("id")}})
+
+        await session.execute(select(func.pg_notify(NOTIFY_CHANNEL, payload)))
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        self.dispatch(json.loads(payload))
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError):
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            try:
+                await connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                await closed.wait()
+            finally:
+                await connection.close()
+
+            # 끊긴 동안의 이벤트는 놓쳤으니 구독자가 목록을 새로 받게 한다.
+            for subscriptions in list(self._subscriptions.values()):
+                for subscription in list(subscriptions):
+                    subscription.deliver({"channel": subscription.channel, "event": "reset", "data": {}})
+
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def create_broker() -> Broker:
+    name = get_realtime_broker()
+
+    if name == "local":
+        return LocalBroker()
+    elif name == "postgres":
+        # asyncpg 는 SQLAlchemy 드라이버 접두사를 모른다.
+        dsn = get_settings().database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        return PostgresBroker(dsn)
+    else:
+        raise NotImplementedError(f"Unknown realtime broker: {name}")
+
+
+_broker: Optional[Broker] = None
+
+
+def get_broker() -> Broker:
+    global _broker
+    if _broker is None:
+        _broker = create_broker()
+
+    return _broker
+
+
+def set_broker(broker: Broker) -> None:
+    global _broker
+    _broker = broker
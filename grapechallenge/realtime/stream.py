@@ -0,0 +1,46 @@
+import json
+from typing import AsyncIterator
+
+from grapechallenge.realtime.broker import Broker
+
+
+MEDIA_TYPE = "text/event-stream"
+
+# 프록시가 유휴 연결을 끊지 않도록 보내는 주석 간격 (초)
+KEEPALIVE = 15.0
+
+# 연결이 끊기면 브라우저가 다시 연결하기까지 기다리는 시간 (ms)
+RETRY = 3000
+
+HEADERS = {
+    "Cache-Control": "no-cache",
+    # nginx 가 이벤트를 모아 보내지 않게 한다.
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_event(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+async def event_stream(broker: Broker, channel: str) -> AsyncIterator[bytes]:
+    """Server-sent events for one subscriber until the client disconnects."""
+    subscription = broker.subscribe(channel)
+
+    try:
+        yield f"retry: {RETRY}\n\n".encode("utf-8")
+
+        while True:
+            if subscription.overflowed:
+                # 놓친 이벤트가 있으니 목록을 새로 받게 하고 연결을 끝낸다.
+                yield format_event("reset", {})
+                return
+
+            message = await subscription.next(timeout=KEEPALIVE)
+            if message is None:
+                yield b": keepalive\n\n"
+                continue
+
+            yield format_event(message["event"], message["data"])
+    finally:
+        broker.unsubscribe(subscription)
@@ -3,6 +3,58 @@
  * 모든 과일 관련 API 호출을 중앙에서 관리
  */
 
+// 응답을 못 받았을 때 같은 Idempotency-Key 로 다시 보내는 횟수
+const COMMAND_RETRIES = 2;
+
+function createIdempotencyKey() {
+  if (window.crypto && typeof window.crypto.randomUUID === 'function') {
+    return window.crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+}
+
+function wait(ms) {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+/**
+ * 명령 요청 (미션 완료, 과일 생성/수확)
+ * 모든 시도에 같은 Idempotency-Key 를 붙여, 서버는 재시도를 다시 실행하지 않고 처음 응답을 돌려준다.
+ * @param {string} url - 요청 경로
+ * @param {Object} body - 요청 본문
+ * @returns {Promise<Response>} 응답
+ */
+async function postCommand(url, body) {
+  const headers = {
+    'Content-Type': 'application/json',
+    'Idempotency-Key': createIdempotencyKey()
+  };
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      const response = await fetch(url, {
+        method: 'POST',
+        headers,
+        body: JSON.stringify(body)
+      });
+
+      // 첫 요청이 아직 처리 중이면 잠시 뒤 같은 키로 결과를 받는다.
+      if (response.status === 409 && attempt < COMMAND_RETRIES) {
+        await wait(Number(response.headers.get('Retry-After') || 1) * 1000);
+        continue;
+      }
+
+      return response;
+    } catch (error) {
+      // 네트워크 오류 (요청이 서버에서 처리됐을 수도 있다)
+      if (attempt >= COMMAND_RETRIES) {
+        throw error;
+      }
+      await wait(500 * (attempt + 1));
+    }
+  }
+}
+
 export const FruitAPI = {
   /**
    * 현재 진행 중인 과일 조회
@@ -39,11 +91,7 @@ export const FruitAPI = {
   async createNewFruit(templateId = null) {
     try {
       const body = templateId ? { template_id: templateId } : {};
-      const response = await fetch('/fruit', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(body)
-      });
+      const response = await postCommand('/fruit', body);
 
       const data = await response.json();
       return (response.ok && data.id) ? data : null;
@@ -67,11 +115,7 @@ export const FruitAPI = {
         body.content = content;
       }
 
-      const response = await fetch('/mission/complete', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(body)
-      });
+      const response = await postCommand('/mission/complete', body);
 
       if (!response.ok) {
         const text = await response.text();
@@ -133,11 +177,7 @@ export const FruitAPI = {
    */
   async harvestFruit(fruitId) {
     try {
-      const response = await fetch('/fruit/harvest', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ fruit_id: fruitId })
-      });
+      const response = await postCommand('/fruit/harvest', { fruit_id: fruitId });
 
       const data = await response.json();
       return (response.ok && data.id) ? data : null;
@@ -206,11 +246,7 @@ export const FruitAPI = {
         body.content = content;
       }
 
-      const response = await fetch('/mission/event/complete', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(body)
-      });
+      const response = await postCommand('/mission/event/complete', body);
 
       if (!response.ok) {
         const data = await response.json();
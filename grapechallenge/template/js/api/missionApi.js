@@ -8,14 +8,18 @@ export const MissionAPI = {
    * 이름으로 미션 조회
    * @param {string} name - 미션 템플릿 이름
    * @param {string|null} date - 날짜 필터 ("today" 또는 null)
-   * @returns {Promise<Object>} 미션 목록과 개수
+   * @param {string|null} since - 이전 응답의 cursor (주면 그 뒤에 바뀐 미션만 받는다)
+   * @returns {Promise<Object>} 미션 목록과 개수, 다음 요청에 쓸 cursor
    */
-  async fetchMissionsByName(name, date = null) {
+  async fetchMissionsByName(name, date = null, since = null) {
     try {
       let url = `/mission?name=${encodeURIComponent(name)}`;
       if (date) {
         url += `&date=${encodeURIComponent(date)}`;
       }
+      if (since) {
+        url += `&since=${encodeURIComponent(since)}`;
+      }
 
       const response = await fetch(url);
       const data = await response.json();
@@ -24,7 +28,8 @@ export const MissionAPI = {
         return {
           missions: data.missions || [],
           count: data.count || 0,
-          user_id: data.user_id || ""
+          user_id: data.user_id || "",
+          cursor: data.cursor || null
         };
       }
 
@@ -74,5 +79,31 @@ export const MissionAPI = {
         message: '네트워크 오류가 발생했습니다'
       };
     }
+  },
+
+  /**
+   * 미션 템플릿의 새 미션과 interaction 변경을 구독 (Server-Sent Events)
+   * @param {string} name - 미션 템플릿 이름
+   * @param {Object<string, function(Object): void>} handlers - 이벤트 이름별 핸들러 (mission, interaction, reset)
+   * @returns {EventSource|null} 연결 (지원하지 않는 브라우저는 null)
+   */
+  subscribeMissionEvents(name, handlers) {
+    if (typeof EventSource === 'undefined') {
+      return null;
+    }
+
+    const source = new EventSource(`/mission/events?name=${encodeURIComponent(name)}`);
+
+    Object.entries(handlers).forEach(([event, handler]) => {
+      source.addEventListener(event, (e) => {
+        try {
+          handler(JSON.parse(e.data));
+        } catch (error) {
+          console.error('미션 이벤트 처리 오류:', error);
+        }
+      });
+    });
+
+    return source;
   }
 };
@@ -9,9 +9,13 @@ import { MissionAPI } from '../api/missionApi.js';
 // State Management
 // ========================
 
+const DIARY_TEMPLATE_NAME = '감사 일기 작성하기';
+
 const state = {
   diaries: [],
-  count: 0
+  count: 0,
+  cursor: null,
+  events: null
 };
 
 // ========================
@@ -49,6 +53,7 @@ export async function initDiaryPage() {
   await fetchDiaries();
   renderDiaries();
   initHelpIconDropdown();
+  subscribeDiaries();
 }
 
 // ========================
@@ -59,12 +64,34 @@ export async function initDiaryPage() {
  * Fetch diaries from API
  */
 async function fetchDiaries() {
-  const result = await MissionAPI.fetchMissionsByName('감사 일기 작성하기', 'today');
+  const result = await MissionAPI.fetchMissionsByName(DIARY_TEMPLATE_NAME, 'today');
   state.diaries = result.missions;
   state.count = result.count;
+  state.cursor = result.cursor;
   state.currentUserId = result.user_id;
 }
 
+/**
+ * Fetch only diaries written or reacted to since the last fetch, and merge them
+ */
+async function syncDiaries() {
+  if (!state.cursor) {
+    await fetchDiaries();
+    return;
+  }
+
+  const result = await MissionAPI.fetchMissionsByName(DIARY_TEMPLATE_NAME, 'today', state.cursor);
+  const changed = new Map(result.missions.map(diary => [diary.id, diary]));
+
+  // 바뀐 일기는 교체하고, 새 일기는 최신순 맨 앞에 둔다.
+  const kept = state.diaries.filter(diary => !changed.has(diary.id));
+  state.diaries = [...changed.values(), ...kept].sort(
+    (a, b) => (b.content_created_at || '').localeCompare(a.content_created_at || '')
+  );
+  state.count = state.diaries.length;
+  state.cursor = result.cursor || state.cursor;
+}
+
 // ========================
 // Rendering Functions
 // ========================
@@ -115,6 +142,7 @@ function renderDiaries() {
  */
 function createDiaryCard(diary, index) {
   const card = document.createElement('div');
+  card.dataset.missionId = diary.id;
   card.className = 'diary-card relative rounded-xl bg-white border border-gray-200 px-6 py-5 hover:shadow-md transition-shadow opacity-0';
 
   const interactions = diary.interaction || [];
@@ -325,8 +353,13 @@ async function handleInteractionClick(event) {
   const result = await MissionAPI.addInteraction(missionId, emoji);
 
   if (result.success) {
-    // Re-fetch and re-render diaries to show updated counts
-    await fetchDiaries();
+    // 실시간 연결이 있으면 interaction 이벤트로 카드만 갱신된다.
+    if (isSubscribed()) {
+      return;
+    }
+
+    // Fetch changed diaries and re-render to show updated counts
+    await syncDiaries();
     renderDiaries();
   } else {
     console.error('인터랙션 추가 실패:', result.message);
@@ -343,6 +376,88 @@ function updateStats() {
   }
 }
 
+// ========================
+// Realtime Updates
+// ========================
+
+/**
+ * Subscribe to new diaries and interaction changes (Server-Sent Events)
+ */
+function subscribeDiaries() {
+  state.events = MissionAPI.subscribeMissionEvents(DIARY_TEMPLATE_NAME, {
+    mission: handleMissionEvent,
+    interaction: handleInteractionEvent,
+    reset: handleResetEvent
+  });
+
+  // 처음 연결될 때와 (fetchDiaries 이후 연결 전까지) EventSource 가 스스로 다시 연결될 때마다
+  // 그 사이에 놓친 변경을 가져온다. (서버 재시작, 네트워크 끊김에는 reset 이 오지 않는다.)
+  if (state.events) {
+    state.events.addEventListener('open', handleResetEvent);
+  }
+}
+
+/**
+ * @returns {boolean} 실시간 연결이 열려 있는지
+ */
+function isSubscribed() {
+  return Boolean(state.events) && state.events.readyState === EventSource.OPEN;
+}
+
+/**
+ * Prepend a newly written diary
+ * @param {Object} diary - GET /mission 과 같은 모양의 일기
+ */
+function handleMissionEvent(diary) {
+  if (state.diaries.some(item => item.id === diary.id)) {
+    return;
+  }
+
+  state.diaries.unshift(diary);
+  state.count += 1;
+
+  // 첫 일기면 빈 화면을 걷어내야 하므로 전체를 그린다.
+  if (state.count === 1) {
+    renderDiaries();
+    return;
+  }
+
+  const card = createDiaryCard(diary, 0);
+  const firstCard = elements.diaryList.querySelector('.diary-card');
+  if (firstCard) {
+    elements.diaryList.insertBefore(card, firstCard);
+  } else {
+    elements.diaryList.appendChild(card);
+  }
+  updateStats();
+}
+
+/**
+ * Replace one diary card with its new interactions
+ * @param {{id: string, interaction: Array<{icon: string, user_id: string}>}} delta
+ */
+function handleInteractionEvent(delta) {
+  const diary = state.diaries.find(item => item.id === delta.id);
+  if (!diary) {
+    return;
+  }
+
+  diary.interaction = delta.interaction;
+
+  const card = elements.diaryList.querySelector(`.diary-card[data-mission-id="${delta.id}"]`);
+  if (card) {
+    card.replaceWith(createDiaryCard(diary, 0));
+  }
+}
+
+/**
+ * Missed events (reset from a slow connection, or a (re)opened stream): fetch what changed since the last fetch
+ */
+async function handleResetEvent() {
+  await syncDiaries();
+  renderDiaries();
+}
+
 // ========================
 // Help Icon Dropdown
 // ========================
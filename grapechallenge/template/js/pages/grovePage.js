@@ -116,11 +116,14 @@ function setupEventListeners() {
  */
 export async function initGrovePage() {
   cacheElements();
-  await Promise.all([
-    fetchCurrentFruit(),
-    fetchCompletedFruits(),
-    fetchAllCells()
-  ]);
+  const loaded = await fetchBootstrap();
+  if (!loaded) {
+    await Promise.all([
+      fetchCurrentFruit(),
+      fetchCompletedFruits(),
+      fetchAllCells()
+    ]);
+  }
   updateCurrentTree();
   renderCompletedFruits();
   updateStatistics();
@@ -131,6 +134,33 @@ export async function initGrovePage() {
 // API Functions
 // ========================
 
+/**
+ * Fetch everything the page needs on load in one request
+ * 열매의 템플릿 정보(이미지 경로)는 templates 에 한 번만 담겨 오므로 다시 합친다.
+ * @returns {Promise<boolean>} 성공 여부 (실패하면 개별 API 로 다시 불러온다)
+ */
+async function fetchBootstrap() {
+  try {
+    const response = await fetch('/grove/bootstrap');
+    const data = await response.json();
+
+    if (!response.ok || !data.templates) {
+      return false;
+    }
+
+    const withTemplate = fruit => ({ ...data.templates[fruit.template_id], ...fruit });
+
+    state.currentFruit = data.in_progress ? withTemplate(data.in_progress) : null;
+    state.completedFruits = data.fruits.map(withTemplate);
+    state.allCells = data.cells;
+    renderCellOptions();
+    return true;
+  } catch (error) {
+    console.error('Failed to fetch grove bootstrap:', error);
+    return false;
+  }
+}
+
 /**
  * Fetch current fruit
  */
@@ -157,11 +187,12 @@ async function fetchCurrentFruit() {
  */
 async function fetchCompletedFruits() {
   try {
-    const response = await fetch('/fruits/mine');
+    const params = new URLSearchParams({ status: FRUIT_STATUS.COMPLETED });
+    const response = await fetch(`/fruits/mine?${params}`);
     const data = await response.json();
 
     if (response.ok && data.fruits) {
-      state.completedFruits = data.fruits.filter(f => f.status === FRUIT_STATUS.COMPLETED);
+      state.completedFruits = data.fruits;
       return state.completedFruits;
     }
     state.completedFruits = [];
@@ -226,15 +257,13 @@ async function fetchCellFruits(cellName = null) {
       return [];
     }
 
-    const response = await fetch('/fruits/cell', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ cell: targetCell })
-    });
+    // GET 이라야 브라우저가 ETag 로 재검증한다 (바뀐 게 없으면 304)
+    const params = new URLSearchParams({ cell: targetCell, status: FRUIT_STATUS.COMPLETED });
+    const response = await fetch(`/fruits/cell?${params}`);
     const data = await response.json();
 
     if (response.ok && data.fruits) {
-      state.completedFruits = data.fruits.filter(f => f.status === FRUIT_STATUS.COMPLETED);
+      state.completedFruits = data.fruits;
       return state.completedFruits;
     }
     state.completedFruits = [];
@@ -13,12 +13,15 @@ from .create_fruit import CreateFruitInput, create_fruit
 from .create_user import CreateUserInput, create_user
 from .create_users import CreateUsersInput, create_users
 
+from .get_admin_dashboard import GetAdminDashboardInput, get_admin_dashboard
 from .get_count_about_every_fruit import GetCountAboutEveryFruitInput, get_count_about_every_fruit
 from .get_count_about_every_user import GetCountAboutEveryUserInput, get_count_about_every_user
 from .get_every_cell import GetEveryCellInput, get_every_cell
 from .get_fruit_stats_by_template import GetFruitStatsByTemplateInput, get_fruit_stats_by_template
 from .get_fruit_template_by_name import GetFruitTemplateByNameInput, get_fruit_template_by_name
 from .get_fruits_by_cell_with_template import GetFruitsByCellWithTemplateInput, get_fruits_by_cell_with_template
+from .get_grove_bootstrap import GetGroveBootstrapInput, get_grove_bootstrap
+from .get_leaderboard import GetLeaderboardInput, get_leaderboard
 from .get_mission_templates import GetMissionTemplatesInput, get_mission_templates
 from .get_missions_by_name import GetMissionsByNameInput, get_missions_by_name
 from .get_my_fruits import GetMyFruitsInput, get_my_fruits
@@ -30,9 +33,14 @@ from .harvest_fruit import HarvestFruitInput, harvest_fruit
 from .login_user import LoginUserInput, login_user
 from .logout_user import LogoutUserInput, logout_user
 
+from .rebuild_user_stats import RebuildUserStatsInput, rebuild_user_stats
+from .reconcile_user_count import ReconcileUserCountInput, reconcile_user_count
+
+from .subscribe_mission_events import SubscribeMissionEventsInput, subscribe_mission_events
+
 from .update_mission_template import UpdateMissionTemplateInput, update_mission_template
 
-from .write_daily_mission_report import WriteDailyMissionReportInput, write_daily_mission_report
+from .write_daily_mission_report import WriteDailyMissionReportInput, write_daily_mission_report, render_daily_mission_report
 
 from .get_event_missions_in_progress import get_event_missions_in_progress
 
@@ -0,0 +1,15 @@
+from typing import Optional
+from fastapi import Request
+
+
+def current_user(request: Request) -> Optional[dict]:
+    # AuthMiddleware 가 세션에서 찾은 사용자 (user_id, user_cell, user_name)
+    return getattr(request.state, "user", None)
+
+
+def current_user_id(request: Request) -> Optional[str]:
+    user = current_user(request)
+    if not user:
+        return None
+
+    return user.get("user_id", None)
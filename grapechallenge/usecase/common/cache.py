@@ -0,0 +1,88 @@
+import time
+from threading import Lock
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.config import get_dashboard_cache_ttl, get_cells_cache_ttl
+
+
+class TTLCache:
+    """Process-wide values that expire after `ttl` seconds.
+
+    `generation` changes on every invalidation; pass the value read before a
+    query to `set` so a result loaded before a write is not cached after it.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._items: dict = {}
+        self._lock = Lock()
+        self.generation = 0
+
+    def get(self, key: str = "") -> Optional[Any]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            return None
+
+        return value
+
+    def set(self, value: Any, key: str = "", generation: Optional[int] = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._items[key] = (time.monotonic() + self._ttl, value)
+
+    def invalidate(self, key: str = "") -> None:
+        with self._lock:
+            self._items.pop(key, None)
+            self.generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.generation += 1
+
+
+# #
+# invalidation
+
+PENDING = "pending_invalidations"
+LISTENING = "invalidation_listening"
+
+
+def _flush_invalidations(session):
+    for cache in session.info.pop(PENDING, set()):
+        cache.clear()
+
+
+def _discard_invalidations(session):
+    session.info.pop(PENDING, None)
+
+
+def invalidate_after_commit(session: AsyncSession, *caches: TTLCache) -> None:
+    """Clear the caches once this session's transaction commits.
+
+    Clearing before commit would let a concurrent read cache the old rows again;
+    on rollback nothing changed, so nothing is cleared.
+    """
+    if not session.info.get(LISTENING):
+        event.listen(session.sync_session, "after_commit", _flush_invalidations)
+        event.listen(session.sync_session, "after_rollback", _discard_invalidations)
+        session.info[LISTENING] = True
+
+    session.info.setdefault(PENDING, set()).update(caches)
+
+
+# #
+# caches
+
+# 관리자 대시보드 (사용자/열매 수, 템플릿별 통계, 미션 템플릿)
+dashboard_cache = TTLCache(ttl=get_dashboard_cache_ttl())
+
+# 셀 목록 (사용자가 추가될 때만 바뀐다.)
+cells_cache = TTLCache(ttl=get_cells_cache_ttl())
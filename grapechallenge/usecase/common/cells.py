@@ -0,0 +1,18 @@
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.domain.user import RepoUser
+from grapechallenge.usecase.common.cache import cells_cache
+
+
+async def every_cell(session: AsyncSession) -> List[str]:
+    """Distinct cells of every user, read from memory while cached."""
+    cached = cells_cache.get()
+    if cached is not None:
+        return cached
+
+    generation = cells_cache.generation
+    cells = await RepoUser.get_all_cells(session=session) or []
+    cells_cache.set(cells, generation=generation)
+
+    return cells
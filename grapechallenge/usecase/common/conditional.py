@@ -0,0 +1,35 @@
+import hashlib
+import json
+from typing import Dict, Optional
+from fastapi import Request
+
+from grapechallenge.usecase.common.models import UsecaseOutput
+
+
+def make_etag(*parts) -> str:
+    """Weak validator over cheap version data (row count, last change, user, filters).
+
+    Weak, because the compression middleware may re-encode the same JSON.
+    The version must cover every table the response reads from (Repo.find_version
+    takes the latest change over the joined tables too), or a 304 can hide an edit.
+    """
+    digest = hashlib.sha1(json.dumps(parts, default=str, sort_keys=True).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        # 사용자마다 다르므로 공유 캐시에 두지 않고, 쓸 때마다 검증한다.
+        "Cache-Control": "private, no-cache",
+        "Vary": "Cookie",
+    }
+
+
+def not_modified(request: Request, etag: str) -> Optional[UsecaseOutput]:
+    # If-None-Match 가 맞으면 본문 없이 304 (무거운 조회를 건너뛴다.)
+    tags = [tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")]
+    if etag.removeprefix("W/") not in tags and "*" not in tags:
+        return None
+
+    return UsecaseOutput(content=None, code=304, headers=cache_headers(etag))
@@ -0,0 +1,41 @@
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.domain.mission import RepoMission
+from grapechallenge.realtime import get_broker, mission_channel
+from grapechallenge.usecase.common.auth import current_user
+from grapechallenge.usecase.common.kst import kst
+
+
+# diary 페이지가 받는 이벤트 (GET /mission 의 항목과 같은 모양)
+
+async def publish_mission_created(session: AsyncSession, request: Request, created: RepoMission, name: str) -> None:
+    user = current_user(request) or {}
+
+    await get_broker().publish(
+        session,
+        mission_channel(created.mission.template_id),
+        "mission",
+        {
+            "id": created.id,
+            "name": name,
+            "content": created.mission.content.to_str() if created.mission.content else None,
+            "content_created_at": kst(created.created_at),
+            "user_id": created.mission.user_id,
+            "user_cell": user.get("user_cell", None),
+            "user_name": user.get("user_name", None),
+            "interaction": None,
+        }
+    )
+
+
+async def publish_mission_interaction(session: AsyncSession, updated: RepoMission) -> None:
+    await get_broker().publish(
+        session,
+        mission_channel(updated.mission.template_id),
+        "interaction",
+        {
+            "id": updated.id,
+            "interaction": updated.mission.interaction.to_list() if updated.mission.interaction else [],
+        }
+    )
@@ -0,0 +1,47 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from grapechallenge.domain.common.error import DomainError
+from grapechallenge.domain.fruit import RepoFruit, Status
+from grapechallenge.domain.fruit_template import Type
+from grapechallenge.usecase.common.models import UsecaseOutput
+
+
+MAX_LIMIT = 1000
+
+
+class FruitFilterInput(BaseModel):
+    status: Optional[str] = None
+    type: Optional[str] = None
+    order: str = "created"
+    desc: bool = False
+    limit: Optional[int] = None
+
+
+def invalid_fruit_filter(input: FruitFilterInput) -> Optional[UsecaseOutput]:
+    """400 output for an invalid filter, None when it can be passed to the repo."""
+    try:
+        if input.status is not None:
+            Status.from_str(input.status)
+        if input.type is not None:
+            Type.from_str(input.type)
+    except DomainError as e:
+        return UsecaseOutput(content={"message": str(e).strip()}, code=e.code)
+
+    if input.order not in RepoFruit.ORDERS:
+        return UsecaseOutput(
+            content={
+                "message": f"Invalid order. Allowed: {', '.join(RepoFruit.ORDERS)}"
+            },
+            code=400
+        )
+
+    if input.limit is not None and not (1 <= input.limit <= MAX_LIMIT):
+        return UsecaseOutput(
+            content={
+                "message": f"limit must be 1~{MAX_LIMIT}"
+            },
+            code=400
+        )
+
+    return None
@@ -1,17 +1,20 @@
-from datetime import datetime, timezone, timedelta
-from typing import Optional, Union
+from datetime import datetime
+from typing import Callable, Optional
+
+from grapechallenge.config import get_settings
 
 
 def kst(dt: Optional[datetime]) -> Optional[str]:
-    if not dt:
+    localized = get_settings().localize(dt)
+    if not localized:
         return None
 
-    from grapechallenge.config import get_app_env
-    app_env = get_app_env()
+    return localized.isoformat()
+
 
-    if app_env == "dev":
-        return dt.isoformat()
+def kst_converter() -> Callable[[Optional[datetime]], Optional[datetime]]:
+    """kst() for a whole list, without formatting each value.
 
-    if app_env == "prod":
-        kst_tz = timezone(timedelta(hours=9))
-        return dt.replace(tzinfo=timezone.utc).astimezone(kst_tz).isoformat()
\ No newline at end of file
+    Values stay datetimes; ORJSONResponse writes them as the same isoformat text.
+    """
+    return get_settings().localize
@@ -1,6 +1,8 @@
 from pydantic import BaseModel
-from typing import Any
+from typing import Any, Dict
 
 class UsecaseOutput(BaseModel):
     content: Any
-    code: int
\ No newline at end of file
+    code: int
+    # 응답에 붙일 헤더 (예: 조건부 GET 의 ETag)
+    headers: Dict[str, str] = {}
@@ -0,0 +1,47 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from grapechallenge.domain.user import RepoUser
+from grapechallenge.domain.counter import RepoCounter, Counter, Name, Value
+
+
+PARTICIPATED_USERS = Name.from_str("PARTICIPATED_USERS")
+
+
+async def seed_participated_users(session: AsyncSession) -> int:
+    """Backfill every user's participated flag and set the counter from missions."""
+    # 플래그를 먼저 채워야 이후의 첫 미션이 한 번 더 세지 않는다.
+    await RepoUser.mark_all_participated(session=session)
+    count = await RepoUser.count_all(session=session)
+
+    await RepoCounter.set_value(
+        session=session,
+        counter=Counter.new(
+            name=PARTICIPATED_USERS,
+            value=Value.from_int(count),
+        )
+    )
+
+    return count
+
+
+async def record_participation(session: AsyncSession, user_id: str):
+    """Count the user once, on their first mission."""
+    is_first_mission = await RepoUser.mark_participated(session=session, id=user_id)
+    if not is_first_mission:
+        return
+
+    # 카운터가 아직 없으면 (배포 직후) 1 이 아니라 기존 참여자 수로 시작한다.
+    found = await RepoCounter.get_by_name(session=session, name=PARTICIPATED_USERS)
+    if found is None:
+        await seed_participated_users(session)
+        return
+
+    await RepoCounter.increase(session=session, name=PARTICIPATED_USERS)
+
+
+async def participated_users(session: AsyncSession) -> int:
+    found = await RepoCounter.get_by_name(session=session, name=PARTICIPATED_USERS)
+    if found is None:
+        return await seed_participated_users(session)
+
+    return found.counter.value.to_int()
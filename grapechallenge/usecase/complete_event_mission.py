@@ -5,7 +5,12 @@ from fastapi import Request
 
 from grapechallenge.domain.mission import RepoMission, Mission, Content
 from grapechallenge.domain.mission_template import RepoMissionTemplate
+from grapechallenge.domain.user_stat import RepoUserStat
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.events import publish_mission_created
+from grapechallenge.usecase.common.participation import record_participation
+from grapechallenge.usecase.common.cache import dashboard_cache, invalidate_after_commit
 
 
 class CompleteEventMissionInput(BaseModel):
@@ -14,7 +19,7 @@ class CompleteEventMissionInput(BaseModel):
 
 
 async def complete_event_mission(session: AsyncSession, request: Request, input: CompleteEventMissionInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -65,6 +70,17 @@ async def complete_event_mission(session: AsyncSession, request: Request, input:
         )
     )
 
+    # diary 페이지에 새 미션을 알린다. (commit 후 전달)
+    await publish_mission_created(session, request, created, name=input.name)
+
+    # update stats
+    await RepoUserStat.increase_mission_count(session=session, user_id=user_id)
+
+    await record_participation(session, user_id)
+
+    # 관리자 대시보드 통계가 바뀌었다.
+    invalidate_after_commit(session, dashboard_cache)
+
     return UsecaseOutput(
         content={
             **created.summary(),
@@ -2,9 +2,11 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
-from grapechallenge.config import get_app_env
+from grapechallenge.config import get_settings
 from grapechallenge.domain.fruit import RepoFruit
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.cache import dashboard_cache, invalidate_after_commit
 
 
 class CompleteTestMissionInput(BaseModel):
@@ -12,14 +14,13 @@ class CompleteTestMissionInput(BaseModel):
 
 async def complete_test_mission(session: AsyncSession, request: Request, input: CompleteTestMissionInput) -> UsecaseOutput:
     # check env
-    app_env = get_app_env()
-    if app_env != "dev":
+    if not get_settings().is_dev:
         return UsecaseOutput(
             content={"message": "Test mission is only available in dev environment"},
             code=403
         )
 
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -51,6 +52,9 @@ async def complete_test_mission(session: AsyncSession, request: Request, input:
         id=found_fruit.id
     )
 
+    # 관리자 대시보드 통계가 바뀌었다.
+    invalidate_after_commit(session, dashboard_cache)
+
     return UsecaseOutput(
         content={
             "fruit_id": updated_fruit.id,
@@ -4,13 +4,14 @@ from fastapi import Request
 
 from grapechallenge.domain.fruit import RepoFruit
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
 
 
 class CountMyCompletedFruitsInput(BaseModel):
     pass
 
 async def count_my_completed_fruits(session: AsyncSession, request: Request, input: CountMyCompletedFruitsInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -7,13 +7,15 @@ from fastapi import Request
 from grapechallenge.domain.fruit import RepoFruit, Fruit, Status
 from grapechallenge.domain.fruit_template import RepoFruitTemplate
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.cache import dashboard_cache, invalidate_after_commit
 
 
 class CreateFruitInput(BaseModel):
     template_id: Optional[str] = None
 
 async def create_fruit(session: AsyncSession, request: Request, input: CreateFruitInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=404)
 
@@ -41,6 +43,9 @@ async def create_fruit(session: AsyncSession, request: Request, input: CreateFru
         )
     )
 
+    # 관리자 대시보드 통계가 바뀌었다.
+    invalidate_after_commit(session, dashboard_cache)
+
     return UsecaseOutput(
         content={
             **created.summary()
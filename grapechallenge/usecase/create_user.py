@@ -9,6 +9,7 @@ from grapechallenge.domain.user import (
     Name,
 )
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.cache import cells_cache, invalidate_after_commit
 
 
 class CreateUserInput(BaseModel):
@@ -26,6 +27,9 @@ async def create_user(session: AsyncSession, request: Request, input: CreateUser
         )
     )
 
+    # 새 셀이 생겼을 수 있다.
+    invalidate_after_commit(session, cells_cache)
+
     return UsecaseOutput(
         content={
             **created.summary()
@@ -10,6 +10,7 @@ from grapechallenge.domain.user import (
     Name,
 )
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.cache import cells_cache, invalidate_after_commit
 from grapechallenge.usecase.create_user import CreateUserInput
 
 
@@ -30,6 +31,9 @@ async def create_users(session: AsyncSession, request: Request, input: CreateUse
         ]
     )
 
+    # 새 셀이 생겼을 수 있다.
+    invalidate_after_commit(session, cells_cache)
+
     return UsecaseOutput(
         content={
             "users": [
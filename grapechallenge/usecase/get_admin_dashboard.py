@@ -0,0 +1,53 @@
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+
+from grapechallenge.domain.dashboard import RepoDashboard
+from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.cache import dashboard_cache
+from grapechallenge.usecase.common.kst import kst
+from grapechallenge.usecase.common.participation import seed_participated_users
+
+
+class GetAdminDashboardInput(BaseModel):
+    pass
+
+async def get_admin_dashboard(session: AsyncSession, request: Request, input: GetAdminDashboardInput) -> UsecaseOutput:
+    user_id = current_user_id(request)
+    if not user_id:
+        return UsecaseOutput(content={"message": "not authenticated"}, code=401)
+
+    # 관리자끼리 공유하는 캐시 (열매/미션 쓰기가 commit 되면 비워진다.)
+    cached = dashboard_cache.get()
+    if cached is not None:
+        return UsecaseOutput(content=cached, code=200)
+
+    # get every statistic in one statement
+    generation = dashboard_cache.generation
+    found = await RepoDashboard.get(session=session)
+
+    user_count = found["user_count"]
+    if user_count is None:
+        # 카운터가 아직 없으면 한 번 채운다.
+        user_count = await seed_participated_users(session)
+
+    content = {
+        "user_count": user_count,
+        "fruit_count": found["fruit_count"],
+        "stats": found["stats"],
+        "mission_templates": [
+            {
+                "id": mission_template["id"],
+                "name": mission_template["name"],
+                "content": mission_template["content"],
+                "type": mission_template["type"],
+                "created_at": kst(mission_template["created_at"]),
+                "updated_at": kst(mission_template["updated_at"]),
+            }
+            for mission_template in found["mission_templates"]
+        ],
+    }
+    dashboard_cache.set(content, generation=generation)
+
+    return UsecaseOutput(content=content, code=200)
@@ -4,13 +4,14 @@ from fastapi import Request
 
 from grapechallenge.domain.fruit import RepoFruit
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
 
 
 class GetCountAboutEveryFruitInput(BaseModel):
     pass
 
 async def get_count_about_every_fruit(session: AsyncSession, request: Request, input: GetCountAboutEveryFruitInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -2,20 +2,21 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
-from grapechallenge.domain.user import RepoUser
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.participation import participated_users
 
 
 class GetCountAboutEveryUserInput(BaseModel):
     pass
 
 async def get_count_about_every_user(session: AsyncSession, request: Request, input: GetCountAboutEveryUserInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
-    # get count
-    count = await RepoUser.count_all(session=session)
+    # get count (카운터가 없으면 한 번 채운다.)
+    count = await participated_users(session)
 
     return UsecaseOutput(
         content={
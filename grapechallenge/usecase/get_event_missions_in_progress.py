@@ -4,10 +4,11 @@ from fastapi import Request
 from grapechallenge.domain.mission_template import RepoMissionTemplate
 from grapechallenge.domain.mission import RepoMission
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
 
 
 async def get_event_missions_in_progress(session: AsyncSession, request: Request) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -2,20 +2,21 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
-from grapechallenge.domain.user import RepoUser
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.cells import every_cell
 
 
 class GetEveryCellInput(BaseModel):
     pass
 
 async def get_every_cell(session: AsyncSession, request: Request, input: GetEveryCellInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
-    # get all cells
-    cells = await RepoUser.get_all_cells(session=session)
+    # get all cells (cached until a user is created)
+    cells = await every_cell(session=session)
 
     if not cells:
         return UsecaseOutput(
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from grapechallenge.domain.fruit.repo_fruit import RepoFruit
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
 
 
 class GetFruitStatsByTemplateInput(BaseModel):
@@ -15,7 +16,7 @@ async def get_fruit_stats_by_template(
     request: Request,
     input: GetFruitStatsByTemplateInput
 ) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -1,21 +1,39 @@
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
 from grapechallenge.domain.fruit import RepoFruit
 from grapechallenge.usecase.common.models import UsecaseOutput
-from grapechallenge.usecase.common.kst import kst
+from grapechallenge.usecase.common.kst import kst_converter
+from grapechallenge.usecase.common.filter import FruitFilterInput, invalid_fruit_filter
+from grapechallenge.usecase.common.conditional import make_etag, cache_headers, not_modified
 
 
-class GetFruitsByCellWithTemplateInput(BaseModel):
+class GetFruitsByCellWithTemplateInput(FruitFilterInput):
     cell: str
 
 async def get_fruits_by_cell_with_template(session: AsyncSession, request: Request, input: GetFruitsByCellWithTemplateInput) -> UsecaseOutput:
-    
+
+    # validate input
+    invalid = invalid_fruit_filter(input)
+    if invalid:
+        return invalid
+
+    # 셀의 열매가 그대로면 join 조회 없이 304
+    version = await RepoFruit.get_version_by_cell(session=session, cell=input.cell)
+    etag = make_etag("fruits/cell", input.model_dump(), version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
     # get fruits by cell
     founds = await RepoFruit.get_by_cell_with_template(
         session=session,
-        cell=input.cell
+        cell=input.cell,
+        status=input.status,
+        type=input.type,
+        order=input.order,
+        descending=input.desc,
+        limit=input.limit
     )
 
     if not founds:
@@ -24,9 +42,12 @@ async def get_fruits_by_cell_with_template(session: AsyncSession, request: Reque
                 "fruits": [],
                 "count": 0
             },
-            code=200
+            code=200,
+            headers=cache_headers(etag)
         )
 
+    kst = kst_converter()
+
     return UsecaseOutput(
         content={
             "fruits": [
@@ -43,12 +64,13 @@ async def get_fruits_by_cell_with_template(session: AsyncSession, request: Reque
                     "fifth_status": found.get("fifth_status", None),
                     "sixth_status": found.get("sixth_status", None),
                     "seventh_status": found.get("seventh_status", None),
-                    "created_at": kst(found.get("created_at")), # type:ignore
-                    "updated_at": kst(found.get("updated_at")), # type:ignore
+                    "created_at": kst(found.get("created_at")),
+                    "updated_at": kst(found.get("updated_at")),
                 }
                 for found in founds
             ],
             "count": len(founds)
         },
-        code=200
+        code=200,
+        headers=cache_headers(etag)
     )
\ No newline at end of file
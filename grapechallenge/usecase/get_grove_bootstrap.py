@@ -0,0 +1,85 @@
+import asyncio
+from typing import Optional, List, Dict
+from pydantic import BaseModel
+from fastapi import Request
+
+from grapechallenge.database.database import transactional_session_helper
+from grapechallenge.domain.fruit import RepoFruit
+from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.kst import kst_converter
+from grapechallenge.usecase.common.cells import every_cell
+
+
+TEMPLATE_FIELDS = [
+    "name", "type",
+    "first_status", "second_status", "third_status", "fourth_status",
+    "fifth_status", "sixth_status", "seventh_status",
+]
+
+
+class GetGroveBootstrapInput(BaseModel):
+    # 주어지면 해당 셀의 완성된 열매도 함께 보낸다.
+    cell: Optional[str] = None
+
+
+def _compact(founds: Optional[List[dict]], templates: Dict[str, dict]) -> List[dict]:
+    # 열매마다 반복되는 템플릿 이미지 경로는 templates 에 한 번만 담는다.
+    kst = kst_converter()
+    compacted = []
+    for found in founds or []:
+        templates.setdefault(found["template_id"], {field: found.get(field, None) for field in TEMPLATE_FIELDS})
+
+        fruit = {
+            "fruit_id": found.get("fruit_id", None),
+            "template_id": found.get("template_id", None),
+            "status": found.get("status", None),
+            "created_at": kst(found.get("created_at")),
+            "updated_at": kst(found.get("updated_at")),
+        }
+        if "user_name" in found:
+            fruit["user_name"] = found["user_name"]
+
+        compacted.append(fruit)
+
+    return compacted
+
+
+async def get_grove_bootstrap(request: Request, input: GetGroveBootstrapInput) -> UsecaseOutput:
+    """Everything the grove page needs on load, in one response.
+
+    Each query gets its own session, so they run concurrently on separate
+    pooled connections instead of one after another.
+    """
+    user_id = current_user_id(request)
+    if not user_id:
+        return UsecaseOutput(content={"message": "not authenticated"}, code=401)
+
+    async def in_session(query, **kwargs):
+        async with transactional_session_helper() as session:
+            return await query(session=session, **kwargs)
+
+    queries = [
+        in_session(RepoFruit.get_my_in_progress, user_id=user_id),
+        in_session(RepoFruit.get_by_user_id_with_template, user_id=user_id, status="COMPLETED"),
+        in_session(every_cell),
+    ]
+    if input.cell:
+        queries.append(
+            in_session(RepoFruit.get_by_cell_with_template, cell=input.cell, status="COMPLETED")
+        )
+
+    in_progress, mine, cells, *cell_fruits = await asyncio.gather(*queries)
+
+    templates: Dict[str, dict] = {}
+    content = {
+        "in_progress": _compact([in_progress], templates)[0] if in_progress else None,
+        "fruits": _compact(mine, templates),
+        "cells": cells or [],
+    }
+    if input.cell:
+        content["cell"] = input.cell
+        content["cell_fruits"] = _compact(cell_fruits[0], templates)
+    content["templates"] = templates
+
+    return UsecaseOutput(content=content, code=200)
@@ -0,0 +1,77 @@
+from typing import Optional
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+
+from grapechallenge.domain.user_stat import RepoUserStat
+from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+
+
+class GetLeaderboardInput(BaseModel):
+    order: str = "mission"
+    cell: Optional[str] = None
+    limit: int = 20
+    offset: int = 0
+
+async def get_leaderboard(session: AsyncSession, request: Request, input: GetLeaderboardInput) -> UsecaseOutput:
+    user_id = current_user_id(request)
+    if not user_id:
+        return UsecaseOutput(content={"message": "not authenticated"}, code=401)
+
+    # validate input
+    if input.order not in RepoUserStat.ORDERS:
+        return UsecaseOutput(
+            content={
+                "message": f"Invalid order. Allowed: {', '.join(RepoUserStat.ORDERS)}"
+            },
+            code=400
+        )
+
+    if not (1 <= input.limit <= 100) or input.offset < 0:
+        return UsecaseOutput(
+            content={
+                "message": "limit must be 1~100 and offset must be 0 or more"
+            },
+            code=400
+        )
+
+    # get leaderboard page
+    founds = await RepoUserStat.get_leaderboard(
+        session=session,
+        order=input.order,
+        cell=input.cell,
+        limit=input.limit,
+        offset=input.offset
+    )
+
+    if not founds:
+        return UsecaseOutput(
+            content={
+                "leaderboard": [],
+                "count": 0
+            },
+            code=200
+        )
+
+    return UsecaseOutput(
+        content={
+            "leaderboard": [
+                {
+                    "rank": found.get("rank", None),
+                    "user_id": found.get("user_id", None),
+                    "user_cell": found.get("user_cell", None),
+                    "user_name": found.get("user_name", None),
+                    "mission_count": found.get("mission_count", 0),
+                    "fruit_count": found.get("fruit_count", 0),
+                    "current_streak": found.get("current_streak", 0),
+                    "last_mission_date": (
+                        found["last_mission_date"].isoformat() if found.get("last_mission_date") else None
+                    ),
+                }
+                for found in founds
+            ],
+            "count": len(founds)
+        },
+        code=200
+    )
@@ -4,17 +4,26 @@ from fastapi import Request
 
 from grapechallenge.domain.mission_template import RepoMissionTemplate
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
 from grapechallenge.usecase.common.kst import kst
+from grapechallenge.usecase.common.conditional import make_etag, cache_headers, not_modified
 
 
 class GetMissionTemplatesInput(BaseModel):
     pass
 
 async def get_mission_templates(session: AsyncSession, request: Request, input: GetMissionTemplatesInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
+    # 템플릿이 그대로면 304
+    version = await RepoMissionTemplate.get_version(session=session)
+    etag = make_etag("mission-templates", version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
     # get all mission templates
     founds = await RepoMissionTemplate.get_all(session=session)
 
@@ -24,7 +33,8 @@ async def get_mission_templates(session: AsyncSession, request: Request, input:
                 "mission_templates": [],
                 "count": 0
             },
-            code=200
+            code=200,
+            headers=cache_headers(etag)
         )
 
     return UsecaseOutput(
@@ -42,5 +52,6 @@ async def get_mission_templates(session: AsyncSession, request: Request, input:
             ],
             "count": len(founds)
         },
-        code=200
+        code=200,
+        headers=cache_headers(etag)
     )
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,33 +6,58 @@ from fastapi import Request
 
 from grapechallenge.domain.mission import RepoMission
 from grapechallenge.usecase.common.models import UsecaseOutput
-from grapechallenge.usecase.common.kst import kst
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.kst import kst_converter
+from grapechallenge.usecase.common.conditional import make_etag, cache_headers, not_modified
 
 
 class GetMissionsByNameInput(BaseModel):
     name: str
     date: Optional[str] = None
+    # 이전 응답의 cursor (주면 그 뒤에 쓰였거나 반응이 바뀐 미션만 보낸다.)
+    since: Optional[str] = None
+
+
+def _cursor(founds: list, since: Optional[datetime]) -> Optional[str]:
+    # 받은 미션 중 가장 늦게 바뀐 시각 (DB 시각 그대로, kst 변환 없이)
+    changed = [found.get("mission_updated_at") or found.get("mission_created_at") for found in founds]
+    latest = max([since, *changed], key=lambda value: value or datetime.min)
+
+    return latest.isoformat() if latest else None
+
 
 async def get_missions_by_name(session: AsyncSession, request: Request, input: GetMissionsByNameInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
+    # validate cursor
+    try:
+        since = datetime.fromisoformat(input.since) if input.since else None
+    except ValueError:
+        return UsecaseOutput(content={"message": "Invalid since cursor"}, code=400)
+
+    # 새 미션도 반응 변경도 없으면 join 조회 없이 304
+    version = await RepoMission.get_version_by_template_name(
+        session=session,
+        name=input.name,
+        date=input.date,
+        since=since
+    )
+    etag = make_etag("mission", user_id, input.model_dump(), version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
     # get missions
     founds = await RepoMission.get_by_template_name(
         session=session,
         name=input.name,
-        date=input.date
-    )
+        date=input.date,
+        since=since
+    ) or []
 
-    if not founds:
-        return UsecaseOutput(
-            content={
-                "missions": [],
-                "count": 0
-            },
-            code=200
-        )
+    kst = kst_converter()
 
     return UsecaseOutput(
         content={
@@ -40,7 +66,7 @@ async def get_missions_by_name(session: AsyncSession, request: Request, input: G
                     "id": found.get("mission_id", None),
                     "name": found.get("template_name", None),
                     "content": found.get("mission_content", None),
-                    "content_created_at": kst(found.get("mission_created_at")), # type:ignore
+                    "content_created_at": kst(found.get("mission_created_at")),
                     "user_id": found.get("user_id", None),
                     "user_cell": found.get("user_cell", None),
                     "user_name": found.get("user_name", None),
@@ -50,6 +76,8 @@ async def get_missions_by_name(session: AsyncSession, request: Request, input: G
             ],
             "count": len(founds),
             "user_id": user_id,
+            "cursor": _cursor(founds, since),
         },
-        code=200
-    )
\ No newline at end of file
+        code=200,
+        headers=cache_headers(etag)
+    )
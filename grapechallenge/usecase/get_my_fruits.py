@@ -1,24 +1,43 @@
-from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
 from grapechallenge.domain.fruit import RepoFruit
 from grapechallenge.usecase.common.models import UsecaseOutput
-from grapechallenge.usecase.common.kst import kst
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.kst import kst_converter
+from grapechallenge.usecase.common.filter import FruitFilterInput, invalid_fruit_filter
+from grapechallenge.usecase.common.conditional import make_etag, cache_headers, not_modified
 
 
-class GetMyFruitsInput(BaseModel):
+class GetMyFruitsInput(FruitFilterInput):
     pass
 
 async def get_my_fruits(session: AsyncSession, request: Request, input: GetMyFruitsInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
+    # validate input
+    invalid = invalid_fruit_filter(input)
+    if invalid:
+        return invalid
+
+    # 열매가 그대로면 join 조회 없이 304
+    version = await RepoFruit.get_version_by_user_id(session=session, user_id=user_id)
+    etag = make_etag("fruits/mine", user_id, input.model_dump(), version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
     # get fruits
     founds = await RepoFruit.get_by_user_id_with_template(
         session=session,
-        user_id=user_id
+        user_id=user_id,
+        status=input.status,
+        type=input.type,
+        order=input.order,
+        descending=input.desc,
+        limit=input.limit
     )
 
     if not founds:
@@ -27,9 +46,12 @@ async def get_my_fruits(session: AsyncSession, request: Request, input: GetMyFru
                 "fruits": [],
                 "count": 0
             },
-            code=200
+            code=200,
+            headers=cache_headers(etag)
         )
 
+    kst = kst_converter()
+
     return UsecaseOutput(
         content={
             "fruits": [
@@ -45,12 +67,13 @@ async def get_my_fruits(session: AsyncSession, request: Request, input: GetMyFru
                     "fifth_status": found.get("fifth_status", None),
                     "sixth_status": found.get("sixth_status", None),
                     "seventh_status": found.get("seventh_status", None),
-                    "created_at": kst(found.get("created_at")), # type:ignore
-                    "updated_at": kst(found.get("updated_at")), # type:ignore
+                    "created_at": kst(found.get("created_at")),
+                    "updated_at": kst(found.get("updated_at")),
                 }
                 for found in founds
             ],
             "count": len(founds)
         },
-        code=200
+        code=200,
+        headers=cache_headers(etag)
     )
\ No newline at end of file
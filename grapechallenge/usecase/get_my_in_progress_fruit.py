@@ -6,6 +6,7 @@ from grapechallenge.domain.fruit import RepoFruit
 from grapechallenge.domain.mission_template import RepoMissionTemplate
 from grapechallenge.domain.mission import RepoMission
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
 from grapechallenge.usecase.common.kst import kst
 
 
@@ -13,7 +14,7 @@ class GetMyInProgressFruitInput(BaseModel):
     pass
 
 async def get_my_in_progress_fruit(session: AsyncSession, request: Request, input: GetMyInProgressFruitInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -4,6 +4,7 @@ from fastapi import Request
 
 from grapechallenge.domain.bible import RepoBible
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.conditional import make_etag, cache_headers, not_modified
 
 
 class GetTodayBibleVerseInput(BaseModel):
@@ -22,13 +23,22 @@ async def get_today_bible_verse(session: AsyncSession, request: Request, input:
             code=404
         )
 
+    content = {
+        "id": found.id,
+        "date": found.bible.date.to_date().isoformat(),
+        "content": found.bible.content.to_str(),
+        "reference": found.bible.reference.to_str(),
+        **found.summary()
+    }
+
+    # 한 행 조회라 더 싼 버전 정보가 없다. 본문으로 검증값을 만들어 전송만 아낀다.
+    etag = make_etag("bible/today", content)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+
     return UsecaseOutput(
-        content={
-            "id": found.id,
-            "date": found.bible.date.to_date().isoformat(),
-            "content": found.bible.content.to_str(),
-            "reference": found.bible.reference.to_str(),
-            **found.summary()
-        },
-        code=200
+        content=content,
+        code=200,
+        headers=cache_headers(etag)
     )
@@ -3,14 +3,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
 from grapechallenge.domain.fruit import RepoFruit, Status
+from grapechallenge.domain.user_stat import RepoUserStat
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.cache import dashboard_cache, invalidate_after_commit
 
 
 class HarvestFruitInput(BaseModel):
     fruit_id: str
 
 async def harvest_fruit(session: AsyncSession, request: Request, input: HarvestFruitInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -54,6 +57,12 @@ async def harvest_fruit(session: AsyncSession, request: Request, input: HarvestF
         id=found_fruit.id
     )
 
+    # update stats
+    await RepoUserStat.increase_fruit_count(session=session, user_id=user_id)
+
+    # 관리자 대시보드 통계가 바뀌었다.
+    invalidate_after_commit(session, dashboard_cache)
+
     return UsecaseOutput(
         content={
             **updated_fruit.summary()
@@ -4,6 +4,8 @@ from fastapi import Request
 
 from grapechallenge.domain.mission import RepoMission, Interaction
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.events import publish_mission_interaction
 
 
 class InteractionMissionInput(BaseModel):
@@ -11,7 +13,7 @@ class InteractionMissionInput(BaseModel):
     emoji: str
 
 async def interaction_mission(session: AsyncSession, request: Request, input: InteractionMissionInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -48,6 +50,9 @@ async def interaction_mission(session: AsyncSession, request: Request, input: In
         id=found_mission.id
     )
 
+    # 같은 미션을 보고 있는 사용자에게 반응만 보낸다. (commit 후 전달)
+    await publish_mission_interaction(session, updated)
+
     return UsecaseOutput(
         content={
             **updated.summary(),
@@ -43,6 +43,7 @@ async def login_user(session: AsyncSession, request: Request, input: LoginUserIn
         content={
             "user_id": user.id,
             "user_cell": user.user.cell.to_str(),
+            "user_name": user.user.name.to_str(),
             "message": "로그인 성공"
         },
         code=200
@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
 
+from grapechallenge.auth import SESSION_COOKIE, unsign_session
+from grapechallenge.domain.revoked_session import RepoRevokedSession
 from grapechallenge.usecase.common.models import UsecaseOutput
 
 
@@ -9,9 +11,20 @@ class LogoutUserInput(BaseModel):
     pass
 
 async def logout_user(session: AsyncSession, request: Request, input: LogoutUserInput) -> UsecaseOutput:
+
+    # 세션을 폐기 목록에 남긴다. (다른 worker/재시작 후에도 같은 쿠키로 복구되지 않는다.)
+    unsigned = unsign_session(request.cookies.get(SESSION_COOKIE))
+    if unsigned is not None:
+        await RepoRevokedSession.revoke(
+            session=session,
+            sid=unsigned.sid,
+            user_id=unsigned.user_id,
+            expires_at=unsigned.expires_at
+        )
+
     return UsecaseOutput(
         content={
             "message": "로그아웃 성공"
         },
         code=200
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,43 @@
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+
+from grapechallenge.domain.user_stat import RepoUserStat
+from grapechallenge.usecase.common.models import UsecaseOutput
+
+
+class RebuildUserStatsInput(BaseModel):
+    pass
+
+async def rebuild_user_stats(session: AsyncSession, request: Request, input: RebuildUserStatsInput) -> UsecaseOutput:
+
+    # rebuild user_stats from missions and fruits
+    count = await RepoUserStat.rebuild_all(session=session)
+
+    return UsecaseOutput(
+        content={
+            "count": count
+        },
+        code=200
+    )
+
+
+# #
+# cli
+
+async def main():
+    from grapechallenge.database.database import transactional_session_helper
+    from unittest.mock import MagicMock
+
+    async with transactional_session_helper() as session:
+        result = await rebuild_user_stats(
+            session=session,
+            request=MagicMock(),
+            input=RebuildUserStatsInput()
+        )
+        print(result)
+
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+
+from grapechallenge.domain.user import RepoUser
+from grapechallenge.domain.counter import RepoCounter, Counter, Name, Value
+from grapechallenge.usecase.common.models import UsecaseOutput
+
+
+class ReconcileUserCountInput(BaseModel):
+    pass
+
+async def reconcile_user_count(session: AsyncSession, request: Request, input: ReconcileUserCountInput) -> UsecaseOutput:
+
+    # backfill participated flag
+    marked = await RepoUser.mark_all_participated(session=session)
+
+    # compare counter with missions
+    found = await RepoCounter.get_by_name(session=session, name=Name.from_str("PARTICIPATED_USERS"))
+    before = found.counter.value.to_int() if found else None
+
+    count = await RepoUser.count_all(session=session)
+    await RepoCounter.set_value(
+        session=session,
+        counter=Counter.new(
+            name=Name.from_str("PARTICIPATED_USERS"),
+            value=Value.from_int(count),
+        )
+    )
+
+    return UsecaseOutput(
+        content={
+            "marked": marked,
+            "before": before,
+            "count": count,
+        },
+        code=200
+    )
+
+
+# #
+# cli
+
+async def main():
+    from grapechallenge.database.database import transactional_session_helper
+    from unittest.mock import MagicMock
+
+    async with transactional_session_helper() as session:
+        result = await reconcile_user_count(
+            session=session,
+            request=MagicMock(),
+            input=ReconcileUserCountInput()
+        )
+        print(result)
+
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+
+from grapechallenge.domain.mission_template import RepoMissionTemplate
+from grapechallenge.realtime import mission_channel
+from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+
+
+class SubscribeMissionEventsInput(BaseModel):
+    name: str
+
+async def subscribe_mission_events(session: AsyncSession, request: Request, input: SubscribeMissionEventsInput) -> UsecaseOutput:
+    user_id = current_user_id(request)
+    if not user_id:
+        return UsecaseOutput(content={"message": "not authenticated"}, code=401)
+
+    # get template (이벤트는 템플릿 id 채널로 발행된다.)
+    found_template = await RepoMissionTemplate.get_by_name(session=session, name=input.name)
+    if not found_template:
+        return UsecaseOutput(
+            content={
+                "message": "No mission template found"
+            },
+            code=404
+        )
+
+    return UsecaseOutput(
+        content={
+            "channel": mission_channel(found_template.id)
+        },
+        code=200
+    )
@@ -11,6 +11,8 @@ from grapechallenge.domain.mission_template import (
     Type,
 )
 from grapechallenge.usecase.common.models import UsecaseOutput
+from grapechallenge.usecase.common.auth import current_user_id
+from grapechallenge.usecase.common.cache import dashboard_cache, invalidate_after_commit
 
 
 class UpdateMissionTemplateInput(BaseModel):
@@ -20,7 +22,7 @@ class UpdateMissionTemplateInput(BaseModel):
     type: Optional[str] = None
 
 async def update_mission_template(session: AsyncSession, request: Request, input: UpdateMissionTemplateInput) -> UsecaseOutput:
-    user_id = request.cookies.get("user_id", None)
+    user_id = current_user_id(request)
     if not user_id:
         return UsecaseOutput(content={"message": "not authenticated"}, code=401)
 
@@ -51,6 +53,9 @@ async def update_mission_template(session: AsyncSession, request: Request, input
         id=input.id
     )
 
+    # 관리자 대시보드 통계가 바뀌었다.
+    invalidate_after_commit(session, dashboard_cache)
+
     return UsecaseOutput(
         content={
             **updated.summary(),
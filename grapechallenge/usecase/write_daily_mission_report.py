@@ -1,4 +1,6 @@
-from typing import Optional
+import asyncio
+import base64
+from typing import List, Optional
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Request
@@ -20,6 +22,7 @@ async def write_daily_mission_report(
     request: Request,
     input: WriteDailyMissionReportInput
 ) -> UsecaseOutput:
+    """Read the missions of the report period (pages are drawn by render_daily_mission_report)."""
 
     # get missions
     founds = await RepoMission.get_by_template_name(
@@ -35,8 +38,24 @@ async def write_daily_mission_report(
             code=404
         )
 
-    # generate images
-    result = generate_report_images(founds, background_image=input.background_image, mission_name=input.mission_name)
+    return UsecaseOutput(
+        content={
+            "missions": founds
+        },
+        code=200
+    )
+
+
+async def render_daily_mission_report(founds: List[dict], input: WriteDailyMissionReportInput) -> UsecaseOutput:
+    """Draw the report pages; called after the session is closed."""
+
+    # generate images (이벤트 루프를 막지 않도록 스레드에서 그린다.)
+    result = await asyncio.to_thread(
+        generate_report_images,
+        founds,
+        background_image=input.background_image,
+        mission_name=input.mission_name
+    )
 
     if result.get("error"):
         return UsecaseOutput(
@@ -45,7 +64,6 @@ async def write_daily_mission_report(
         )
 
     # encode images
-    import base64
     image_bytes_list = result["image_bytes_list"]
     image_bytes_base64 = [base64.b64encode(img_bytes).decode('utf-8') for img_bytes in image_bytes_list]
 
@@ -74,34 +92,38 @@ async def main():
     parser.add_argument("--mission", required=True, help="Mission template name")
     args = parser.parse_args()
 
+    input = WriteDailyMissionReportInput(background_image=args.background, mission_name=args.mission)
+
     async with transactional_session_helper() as session:
         result = await write_daily_mission_report(
             session=session,
             request=MagicMock(),
-            input=WriteDailyMissionReportInput(background_image=args.background, mission_name=args.mission)
+            input=input
         )
 
-        if result.code != 200:
-            print(f"Error: {result.content.get('message')}")
-            return
+    if result.code == 200:
+        result = await render_daily_mission_report(founds=result.content["missions"], input=input)
+
+    if result.code != 200:
+        print(f"Error: {result.content.get('message')}")
+        return
 
-        image_bytes_list = result.content.get('image_bytes_list', [])
-        if not image_bytes_list:
-            print("No images generated")
-            return
+    image_bytes_list = result.content.get('image_bytes_list', [])
+    if not image_bytes_list:
+        print("No images generated")
+        return
 
-        output_prefix = args.output.removesuffix('.jpg').removesuffix('.jpeg')
-        page_count = len(image_bytes_list)
+    output_prefix = args.output.removesuffix('.jpg').removesuffix('.jpeg')
+    page_count = len(image_bytes_list)
 
-        for i, image_bytes in enumerate(image_bytes_list, 1):
-            output_path = f"{output_prefix}.jpg" if page_count == 1 else f"{output_prefix}_page{i}.jpg"
-            with open(output_path, 'wb') as f:
-                f.write(image_bytes)
-            print(f"Saved: {output_path}")
+    for i, image_bytes in enumerate(image_bytes_list, 1):
+        output_path = f"{output_prefix}.jpg" if page_count == 1 else f"{output_prefix}_page{i}.jpg"
+        with open(output_path, 'wb') as f:
+            f.write(image_bytes)
+        print(f"Saved: {output_path}")
 
-        print(f"Generated {page_count} page(s)")
+    print(f"Generated {page_count} page(s)")
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -1,6 +1,11 @@
+import hashlib
 import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import List, Tuple, Union
+from threading import Lock, local
+from typing import Dict, List, Optional, Tuple, Union
 from PIL import Image, ImageDraw, ImageFont
 from PIL.ImageFont import FreeTypeFont
 
@@ -29,13 +34,43 @@ CONFIG = {
 }
 
 
-def load_background_image(base_dir: str) -> Image.Image | None:
-    """Load background image"""
-    image_path = os.path.join(base_dir, "template", "images", CONFIG["background"])
+# 보고서는 전역 CONFIG 를 바꿔 가며 그리므로 한 번에 하나씩 만든다. (요청마다 스레드에서 불린다)
+_report_lock = Lock()
+
+
+# (배경 이름, 텍스트 영역 끝 좌표) 별로 준비된 배경 (읽기 전용, 페이지는 copy() 로 만든다)
+_prepared_backgrounds: Dict[Tuple[str, int, int], Image.Image] = {}
+_prepared_backgrounds_lock = Lock()
+
+
+def load_prepared_background(base_dir: str, background: str, text_area: dict) -> Image.Image | None:
+    """Load a background once, expanded to cover the text area, and keep it for later reports"""
+    key = (background, text_area["x"] + text_area["width"], text_area["y"] + text_area["height"])
+
+    with _prepared_backgrounds_lock:
+        found = _prepared_backgrounds.get(key)
+    if found is not None:
+        return found
+
+    image_path = os.path.join(base_dir, "template", "images", background)
     if not os.path.exists(image_path):
         return None
+
     with Image.open(image_path) as img:
-        return img.copy()
+        image = img.convert("RGB")
+
+    required_width = max(image.width, key[1])
+    required_height = max(image.height, key[2])
+
+    if required_width > image.width or required_height > image.height:
+        expanded_image = Image.new('RGB', (required_width, required_height), color='white')
+        expanded_image.paste(image, (0, 0))
+        image = expanded_image
+
+    with _prepared_backgrounds_lock:
+        _prepared_backgrounds[key] = image
+
+    return image
 
 
 def load_font(base_dir: str, size: int) -> Union[FreeTypeFont, ImageFont.ImageFont]:
@@ -101,6 +136,71 @@ def wrap_text(text: str, font: Union[FreeTypeFont, ImageFont.ImageFont], max_wid
     return lines
 
 
+class LayoutCache:
+    """LRU cache of wrapped lines keyed by (content hash, font, size, max_width), bounded by memory"""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items: "OrderedDict[tuple, Tuple[List[str], int]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def key(text: str, font: Union[FreeTypeFont, ImageFont.ImageFont], max_width: int) -> tuple:
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return (digest, getattr(font, "path", type(font).__name__), getattr(font, "size", None), max_width)
+
+    def get(self, key: tuple) -> Optional[List[str]]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            self._items.move_to_end(key)
+            return item[0]
+
+    def set(self, key: tuple, lines: List[str]) -> None:
+        cost = sys.getsizeof(lines) + sum(sys.getsizeof(line) for line in lines)
+
+        with self._lock:
+            if key in self._items:
+                self.size -= self._items.pop(key)[1]
+
+            self._items[key] = (lines, cost)
+            self.size += cost
+
+            while self.size > self.max_bytes and self._items:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+layout_cache = LayoutCache()
+
+
+def wrap_text_cached(text: str, font: Union[FreeTypeFont, ImageFont.ImageFont], max_width: int) -> List[str]:
+    """wrap_text through the layout cache (same content re-rendered with the same font and width)"""
+    if not text:
+        return []
+
+    key = LayoutCache.key(text, font, max_width)
+    lines = layout_cache.get(key)
+
+    if lines is None:
+        lines = wrap_text(text, font, max_width)
+        layout_cache.set(key, lines)
+
+    # 호출자가 바꿔도 캐시가 오염되지 않도록 복사본을 준다.
+    return list(lines)
+
+
 def prepare_text_blocks(
     founds: List[dict],
     content_font: Union[FreeTypeFont, ImageFont.ImageFont],
@@ -125,10 +225,10 @@ def prepare_text_blocks(
 
         # Prepare author line with smaller font
         author_text = f"{user_name}의 {mission_name}:"
-        author_lines = wrap_text(author_text, author_font, max_width)
+        author_lines = wrap_text_cached(author_text, author_font, max_width)
 
         # Prepare content lines with regular font
-        content_lines = wrap_text(content, content_font, max_width)
+        content_lines = wrap_text_cached(content, content_font, max_width)
 
         # Skip if no lines generated
         if not author_lines and not content_lines:
@@ -155,33 +255,27 @@ def calculate_block_height(block: List[Tuple[str, str]]) -> int:
 
 def create_blank_page(original_image: Image.Image, width: int, height: int) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
     """Create a new blank page with background image"""
-    page_image = Image.new('RGB', (width, height), color='white')
-    page_image.paste(original_image, (0, 0))
+    # 준비된 배경이면 한 번의 복사로 페이지를 만든다. (흰색 채우기 + paste 를 건너뛴다)
+    # *copy() 도 페이지마다 전체 크기 버퍼를 새로 잡는다. JPEG 인코딩에는 전체 페이지가 필요하므로
+    #  이 버퍼는 줄일 수 없고, 동시에 살아 있는 페이지 수는 render_pages_to_bytes 가 워커 수로 묶는다.
+    if original_image.size == (width, height) and original_image.mode == 'RGB':
+        page_image = original_image.copy()
+    else:
+        page_image = Image.new('RGB', (width, height), color='white')
+        page_image.paste(original_image, (0, 0))
     return page_image, ImageDraw.Draw(page_image)
 
 
-def render_pages(
-    text_blocks: List[List[Tuple[str, str]]],
-    original_image: Image.Image,
-    canvas_size: Tuple[int, int],
-    content_font: Union[FreeTypeFont, ImageFont.ImageFont],
-    author_font: Union[FreeTypeFont, ImageFont.ImageFont],
-) -> List[Image.Image]:
-    """Render text blocks into multiple pages"""
+def paginate(text_blocks: List[List[Tuple[str, str]]]) -> List[List[List[Tuple[str, str]]]]:
+    """Decide which text blocks go on which page (a block never spans two pages)"""
     text_area = CONFIG["text_area"]
-    line_spacing = CONFIG["line_spacing"]
-    text_color = CONFIG["text_color"]
-
-    pages = []
-    width, height = canvas_size
-    text_x, text_y = text_area["x"], text_area["y"]
-    text_height = text_area["height"]
+    text_y, text_height = text_area["y"], text_area["height"]
 
-    # Return empty list if no text blocks
+    pages: List[List[List[Tuple[str, str]]]] = []
     if not text_blocks:
         return pages
 
-    current_page, current_draw = create_blank_page(original_image, width, height)
+    current_page: List[List[Tuple[str, str]]] = []
     y_offset = text_y
 
     for block in text_blocks:
@@ -190,41 +284,148 @@ def render_pages(
         # Check if block fits in current page
         if y_offset + block_height > text_y + text_height:
             pages.append(current_page)
-            current_page, current_draw = create_blank_page(original_image, width, height)
+            current_page = []
             y_offset = text_y
 
+        current_page.append(block)
+        y_offset += block_height
+
+    pages.append(current_page)
+
+    return pages
+
+
+# FreeType face 는 스레드 간에 공유하면 안 되므로 워커 스레드마다 폰트를 따로 연다.
+_thread_fonts = local()
+
+
+def _thread_font(font: Union[FreeTypeFont, ImageFont.ImageFont]) -> Union[FreeTypeFont, ImageFont.ImageFont]:
+    path = getattr(font, "path", None)
+    if not isinstance(font, FreeTypeFont) or not isinstance(path, str):
+        return font
+
+    fonts = getattr(_thread_fonts, "fonts", None)
+    if fonts is None:
+        fonts = _thread_fonts.fonts = {}
+
+    key = (path, font.size)
+    if key not in fonts:
+        fonts[key] = ImageFont.truetype(path, font.size)
+
+    return fonts[key]
+
+
+def draw_page(
+    blocks: List[List[Tuple[str, str]]],
+    original_image: Image.Image,
+    canvas_size: Tuple[int, int],
+    content_font: Union[FreeTypeFont, ImageFont.ImageFont],
+    author_font: Union[FreeTypeFont, ImageFont.ImageFont],
+    layout: dict,
+) -> Image.Image:
+    """Draw one paginated page"""
+    width, height = canvas_size
+    text_x, y_offset = layout["x"], layout["y"]
+    line_spacing = layout["line_spacing"]
+    text_color = layout["text_color"]
+
+    content_font = _thread_font(content_font)
+    author_font = _thread_font(author_font)
+
+    page, draw = create_blank_page(original_image, width, height)
+
+    for block in blocks:
         for line_text, font_type in block:
             font = author_font if font_type == 'author' else content_font
             # Ensure line_text is not empty to avoid rendering issues
             if line_text:
-                current_draw.text((text_x, y_offset), line_text, fill=text_color, font=font)
+                draw.text((text_x, y_offset), line_text, fill=text_color, font=font)
             y_offset += line_spacing
 
         # Add extra spacing between different user entries
         y_offset += line_spacing
 
-    # Only add the last page if it has content
-    if current_page and pages or text_blocks:
-        pages.append(current_page)
+    return page
 
-    return pages
+
+def encode_page(page: Image.Image) -> bytes:
+    """Convert a PIL Image page to JPEG bytes"""
+    output_buffer = BytesIO()
+    page.save(output_buffer, format="JPEG", quality=95)
+    return output_buffer.getvalue()
+
+
+# 페이지 그리기/인코딩용 워커
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="report-render"
+            )
+        return _executor
+
+
+def _layout() -> dict:
+    # 워커가 전역 CONFIG 를 읽지 않도록 그릴 때 필요한 값만 복사해 둔다.
+    return {
+        "x": CONFIG["text_area"]["x"],
+        "y": CONFIG["text_area"]["y"],
+        "line_spacing": CONFIG["line_spacing"],
+        "text_color": CONFIG["text_color"],
+    }
+
+
+def render_pages(
+    text_blocks: List[List[Tuple[str, str]]],
+    original_image: Image.Image,
+    canvas_size: Tuple[int, int],
+    content_font: Union[FreeTypeFont, ImageFont.ImageFont],
+    author_font: Union[FreeTypeFont, ImageFont.ImageFont],
+) -> List[Image.Image]:
+    """Render text blocks into multiple pages (paginated once, pages drawn in parallel)"""
+    layout = _layout()
+
+    return list(_get_executor().map(
+        lambda blocks: draw_page(blocks, original_image, canvas_size, content_font, author_font, layout),
+        paginate(text_blocks)
+    ))
 
 
 def convert_pages_to_bytes(pages: List[Image.Image]) -> List[bytes]:
-    """Convert PIL Image pages to JPEG bytes"""
-    image_bytes_list = []
+    """Convert PIL Image pages to JPEG bytes (encoded in parallel)"""
+    return list(_get_executor().map(encode_page, pages))
+
 
-    for page in pages:
-        output_buffer = BytesIO()
-        page.save(output_buffer, format="JPEG", quality=95)
-        output_buffer.seek(0)
-        image_bytes_list.append(output_buffer.read())
+def render_pages_to_bytes(
+    text_blocks: List[List[Tuple[str, str]]],
+    original_image: Image.Image,
+    canvas_size: Tuple[int, int],
+    content_font: Union[FreeTypeFont, ImageFont.ImageFont],
+    author_font: Union[FreeTypeFont, ImageFont.ImageFont],
+) -> List[bytes]:
+    """Draw and encode each page in one task, so only the pages in flight are held in memory"""
+    layout = _layout()
 
-    return image_bytes_list
+    return list(_get_executor().map(
+        lambda blocks: encode_page(draw_page(blocks, original_image, canvas_size, content_font, author_font, layout)),
+        paginate(text_blocks)
+    ))
 
 
 def generate_report_images(founds: List[dict], background_image: str = "background1.jpg", mission_name: str = "감사일기") -> dict:
     """Generate report images from mission data"""
+    with _report_lock:
+        return _generate_report_images(founds, background_image=background_image, mission_name=mission_name)
+
+
+def _generate_report_images(founds: List[dict], background_image: str, mission_name: str) -> dict:
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
     # Update CONFIG with custom background image and its text area
@@ -234,20 +435,14 @@ def generate_report_images(founds: List[dict], background_image: str = "backgrou
         BACKGROUND_CONFIGS["background1.jpg"]
     )
 
-    original_image = load_background_image(base_dir)
+    # Background already expanded to the canvas size
+    text_area = CONFIG["text_area"]
+    original_image = load_prepared_background(base_dir, background_image, text_area)
 
     if original_image is None:
         return {"error": "Background image not found", "code": 404}
 
-    # Calculate canvas size
-    text_area = CONFIG["text_area"]
-    required_width = max(original_image.width, text_area["x"] + text_area["width"])
-    required_height = max(original_image.height, text_area["y"] + text_area["height"])
-
-    if required_width > original_image.width or required_height > original_image.height:
-        expanded_image = Image.new('RGB', (required_width, required_height), color='white')
-        expanded_image.paste(original_image, (0, 0))
-        original_image = expanded_image
+    required_width, required_height = original_image.size
 
     # Load fonts and prepare content
     content_font = load_font(base_dir, CONFIG["font_size"])
@@ -264,7 +459,7 @@ def generate_report_images(founds: List[dict], background_image: str = "backgrou
     if not text_blocks:
         return {"error": "No valid mission content to display", "code": 404}
 
-    pages = render_pages(
+    image_bytes_list = render_pages_to_bytes(
         text_blocks=text_blocks,
         original_image=original_image,
         canvas_size=(required_width, required_height),
@@ -272,12 +467,10 @@ def generate_report_images(founds: List[dict], background_image: str = "backgrou
         author_font=author_font,
     )
 
-    if not pages:
+    if not image_bytes_list:
         return {"error": "Failed to generate report pages", "code": 500}
 
-    image_bytes_list = convert_pages_to_bytes(pages)
-
     return {
         "image_bytes_list": image_bytes_list,
-        "page_count": len(pages)
+        "page_count": len(image_bytes_list)
     }
@@ -0,0 +1,12 @@
+export PYTHONPATH=.
+
+# data (scale 3 = 3000 users)
+python3 bench/generate.py --scale 3 --db
+
+# load (server must be running: APP_ENV=dev python3 grapechallenge/bin/server.py)
+python3 bench/load.py --scale 3 --save-baseline bench/baseline.json
+python3 bench/load.py --scale 3 --baseline bench/baseline.json
+
+# report rendering pipeline
+python3 bench/bench_report.py --save-baseline bench/report_baseline.json
+python3 bench/bench_report.py --baseline bench/report_baseline.json
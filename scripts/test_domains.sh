@@ -7,4 +7,11 @@ python3 test/domain/test_repo_fruit.py
 python3 test/domain/test_repo_mission_template.py
 python3 test/domain/test_repo_mission.py
 
-python3 test/domain/test_repo_user.py
\ No newline at end of file
+python3 test/domain/test_repo_user.py
+python3 test/domain/test_repo_user_stat.py
+
+python3 test/domain/test_repo_counter.py
+
+python3 test/domain/test_repo_dashboard.py
+
+python3 test/domain/test_repo_revoked_session.py
@@ -17,7 +17,9 @@ async def cleanup_database():
         from grapechallenge.domain.user.repo_user import UserModel
         from grapechallenge.domain.fruit.repo_fruit import FruitModel
         from grapechallenge.domain.mission.repo_mission import MissionModel
+        from grapechallenge.domain.counter.repo_counter import CounterModel
 
+        await session.execute(CounterModel.__table__.delete())
         await session.execute(MissionModel.__table__.delete())
         await session.execute(FruitModel.__table__.delete())
         await session.execute(UserModel.__table__.delete())
@@ -63,6 +65,25 @@ async def get_mission_templates():
         return templates
 
 
+async def create_existing_participant(template_id: str):
+    """A user whose mission predates the participation counter (participated_at is NULL)"""
+    async with transactional_session_helper() as session:
+        from grapechallenge.domain.user import RepoUser, User, Cell, Name
+        from grapechallenge.domain.mission import RepoMission, Mission
+
+        repo_user = await RepoUser.create(session=session, user=User.new(
+            cell=Cell.from_str("요셉"),
+            name=Name.from_str("기존참여자")
+        ))
+        await RepoMission.create(session=session, mission=Mission.new(
+            user_id=repo_user.id,
+            template_id=template_id,
+            fruit_id=None,
+            content=None,
+            interaction=None
+        ))
+
+
 async def setup_test_data():
     """Create test templates for fruits and missions"""
     async with transactional_session_helper() as session:
@@ -191,6 +212,10 @@ async def test_api():
         print(f"✓ API Response: {response.status_code}")
         print(f"✓ In progress fruit: {progress_data}\n")
 
+        # 카운터가 생기기 전부터 미션을 한 사용자
+        mission_templates = await get_mission_templates()
+        await create_existing_participant(mission_templates[0].id)
+
         # TEST 6: Complete Mission
         print("[TEST 6: POST /mission/complete - Complete Mission]")
 
@@ -218,6 +243,13 @@ async def test_api():
         assert repo_fruit.fruit.status.to_str() == "SECOND_STATUS"
         print(f"✓ DB Verification: Fruit status changed to {repo_fruit.fruit.status.to_str()}\n")
 
+        # TEST 6-1: Count before any count read
+        print("[TEST 6-1: GET /users/count - Counter seeded by the first mission]")
+        response = client.get("/users/count")
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+        print(f"✓ Participated users: {response.json()['count']} (existing participant + new user)\n")
+
         # TEST 7: Complete Multiple Missions to reach SEVENTH_STATUS and then COMPLETED
         print("[TEST 7: Complete Multiple Missions to reach COMPLETED (7 total missions)]")
         for i in range(2, 9):  # SECOND_STATUS to COMPLETED (7 more missions)
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import subprocess
+
+os.environ["APP_ENV"] = "dev"
+
+from grapechallenge.database.database import DatabaseClient, transactional_session_helper
+from grapechallenge.database.instrument import query_stats
+from grapechallenge.database.unit_of_work import UnitOfWork
+from grapechallenge.config import get_database_config
+from grapechallenge.domain.common.error import NotEditedError, NotInsertedError
+from grapechallenge.domain.user import Cell, Name, User, RepoUser
+from grapechallenge.domain.user.repo_user import UserModel
+
+
+# Operations
+async def create_user(cell: str, name: str) -> dict:
+    async with transactional_session_helper() as session, query_stats() as stats:
+        uow = UnitOfWork.of(session)
+        repo_user = await RepoUser.create(
+            session=session,
+            user=User.new(cell=Cell.from_str(cell), name=Name.from_str(name))
+        )
+        # insert 는 바로 flush 된다.
+        return {"id": repo_user.id, "statements": stats.count, "flushes": uow.flushes}
+
+
+async def create_user_with_id(user_id: str):
+    async with transactional_session_helper() as session:
+        await RepoUser.insert(
+            session=session,
+            model_class=UserModel,
+            data=RepoUser._model(user=User.new(cell=Cell.from_str("다윗"), name=Name.from_str("홍길동")), id=user_id)
+        )
+
+
+async def load_and_update_user(user_id: str, name: str) -> dict:
+    async with transactional_session_helper() as session, query_stats() as stats:
+        uow = UnitOfWork.of(session)
+        found = await RepoUser.get_by_id(session=session, id=user_id)
+        loaded = stats.count
+
+        # 이미 읽어 온 aggregate 는 다시 SELECT 하지 않는다.
+        await RepoUser.update(
+            session=session,
+            user=found.user.update_name(Name.from_str(name)),
+            id=found.id
+        )
+        return {"loaded": loaded, "statements": stats.count, "flushes": uow.flushes}
+
+
+async def get_user(user_id: str):
+    async with transactional_session_helper() as session:
+        return await RepoUser.get_by_id(session=session, id=user_id)
+
+
+# Cleanup
+async def cleanup_database():
+    async with transactional_session_helper() as session:
+        await session.execute(UserModel.__table__.delete())
+
+
+# Test runner
+async def test_unit_of_work():
+    db_config = get_database_config()
+    print(f"Database: {db_config.database_url()}")
+    print("=" * 60)
+
+    async with DatabaseClient(db_config.database_url()):
+        print("✓ Database connected\n")
+
+        # INSERT
+        print("[INSERT]")
+        created = await create_user("다윗", "홍길동")
+        assert created["statements"] == 1 and created["flushes"] == 1
+        assert await get_user(created["id"]) is not None
+        print(f"✓ Inserted on flush: {created}\n")
+
+        # DUPLICATED INSERT
+        print("[DUPLICATED INSERT]")
+        try:
+            await create_user_with_id(created["id"])
+            assert False, "duplicated id was inserted"
+        except NotInsertedError:
+            pass
+        print("✓ Constraint error surfaced as NotInsertedError\n")
+
+        # IDENTITY MAP
+        print("[IDENTITY MAP]")
+        updated = await load_and_update_user(created["id"], "김철수")
+        assert updated["statements"] == updated["loaded"]
+        assert updated["flushes"] == 0
+        repo_user = await get_user(created["id"])
+        assert repo_user.user.name.to_str() == "김철수"
+        print(f"✓ Updated without re-select: {updated}\n")
+
+        # DEFERRED EDIT ERROR
+        print("[DEFERRED EDIT ERROR]")
+        try:
+            # users.name 은 VARCHAR(100) 이므로 commit 의 flush 에서 실패한다.
+            await load_and_update_user(created["id"], "가" * 101)
+            assert False, "too long name was updated"
+        except NotEditedError:
+            pass
+        repo_user = await get_user(created["id"])
+        assert repo_user.user.name.to_str() == "김철수"
+        print("✓ Commit-time error surfaced as NotEditedError and rolled back\n")
+
+        # CLEANUP
+        print("[CLEANUP]")
+        await cleanup_database()
+        print("✓ Database cleaned up\n")
+
+    print("=" * 60)
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    subprocess.run(["./scripts/setup_dev_db.sh"])
+    asyncio.run(test_unit_of_work())
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import subprocess
+
+os.environ["APP_ENV"] = "dev"
+
+from grapechallenge.database.database import DatabaseClient, transactional_session_helper
+from grapechallenge.config import get_database_config
+from grapechallenge.domain.counter import Name, Value, Counter, RepoCounter
+
+
+# Operations
+async def increase_counter(name: str, by: int = 1):
+    async with transactional_session_helper() as session:
+        return await RepoCounter.increase(session=session, name=Name.from_str(name), by=by)
+
+
+async def set_counter(name: str, value: int):
+    async with transactional_session_helper() as session:
+        counter = Counter.new(
+            name=Name.from_str(name),
+            value=Value.from_int(value)
+        )
+        return await RepoCounter.set_value(session=session, counter=counter)
+
+
+async def get_counter(name: str):
+    async with transactional_session_helper() as session:
+        return await RepoCounter.get_by_name(session=session, name=Name.from_str(name))
+
+
+async def increase_counter_with_rollback(name: str):
+    """Test function that increases a counter then raises an exception to trigger rollback"""
+    async with transactional_session_helper() as session:
+        await RepoCounter.increase(session=session, name=Name.from_str(name))
+        # Raise exception to trigger rollback
+        raise ValueError("Intentional error to test rollback")
+
+
+# Cleanup
+async def cleanup_database():
+    async with transactional_session_helper() as session:
+        from grapechallenge.domain.counter.repo_counter import CounterModel
+        await session.execute(CounterModel.__table__.delete())
+
+
+# Test runner
+async def test_crud():
+    db_config = get_database_config()
+    print(f"Database: {db_config.database_url()}")
+    print("=" * 60)
+
+    async with DatabaseClient(db_config.database_url()):
+        print("✓ Database connected\n")
+        await cleanup_database()
+
+        # INCREASE
+        print("[INCREASE]")
+        await increase_counter("PARTICIPATED_USERS")
+        repo_counter = await increase_counter("PARTICIPATED_USERS", by=2)
+        assert repo_counter.counter.value.to_int() == 3
+        print(f"✓ Increased: name={repo_counter.counter.name.to_str()}, value={repo_counter.counter.value.to_int()}\n")
+
+        # SET
+        print("[SET]")
+        repo_counter = await set_counter("PARTICIPATED_USERS", 10)
+        assert repo_counter.counter.value.to_int() == 10
+        print(f"✓ Set: value={repo_counter.counter.value.to_int()}\n")
+
+        # READ
+        print("[READ]")
+        repo_counter = await get_counter("PARTICIPATED_USERS")
+        print(f"✓ Found: name={repo_counter.counter.name.to_str()}, value={repo_counter.counter.value.to_int()}\n")
+
+        # TRANSACTION ROLLBACK
+        print("[TRANSACTION ROLLBACK]")
+        try:
+            await increase_counter_with_rollback("PARTICIPATED_USERS")
+            print("✗ Rollback failed: exception not raised")
+        except ValueError as e:
+            repo_counter = await get_counter("PARTICIPATED_USERS")
+            assert repo_counter.counter.value.to_int() == 10
+            print(f"✓ Exception caught: {e}")
+            print(f"✓ Rollback confirmed: value={repo_counter.counter.value.to_int()}\n")
+
+        # CLEANUP
+        print("[CLEANUP]")
+        await cleanup_database()
+        print("✓ Database cleaned up\n")
+
+    print("=" * 60)
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    subprocess.run(["./scripts/setup_dev_db.sh"])
+    asyncio.run(test_crud())
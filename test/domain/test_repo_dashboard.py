@@ -0,0 +1,148 @@
+import asyncio
+import os
+import subprocess
+
+os.environ["APP_ENV"] = "dev"
+
+from grapechallenge.database.database import DatabaseClient, transactional_session_helper
+from grapechallenge.config import get_database_config
+from grapechallenge.domain.dashboard import RepoDashboard
+from grapechallenge.domain.counter import Name as CounterName, Value, Counter, RepoCounter
+from grapechallenge.domain.fruit import Status, Fruit, RepoFruit
+from grapechallenge.domain.user import Cell, Name, User, RepoUser
+from grapechallenge.domain.mission_template import (
+    Name as MissionTemplateName,
+    Content,
+    Type as MissionTemplateType,
+    MissionTemplate,
+    RepoMissionTemplate,
+)
+from grapechallenge.domain.fruit_template import (
+    Name as TemplateName,
+    Type,
+    FirstStatus,
+    SecondStatus,
+    ThirdStatus,
+    FourthStatus,
+    FifthStatus,
+    SixthStatus,
+    SeventhStatus,
+    FruitTemplate,
+    RepoFruitTemplate,
+)
+
+
+# Setup test data
+async def create_test_data() -> None:
+    async with transactional_session_helper() as session:
+        repo_user = await RepoUser.create(
+            session=session,
+            user=User.new(cell=Cell.from_str("다윗"), name=Name.from_str("홍길동"))
+        )
+        repo_templates = [
+            await RepoFruitTemplate.create(
+                session=session,
+                fruit_template=FruitTemplate.new(
+                    name=TemplateName.from_str(name),
+                    type=Type.from_str("NORMAL"),
+                    first_status=FirstStatus.from_str("/images/grape_1.png"),
+                    second_status=SecondStatus.from_str("/images/grape_2.png"),
+                    third_status=ThirdStatus.from_str("/images/grape_3.png"),
+                    fourth_status=FourthStatus.from_str("/images/grape_4.png"),
+                    fifth_status=FifthStatus.from_str("/images/grape_5.png"),
+                    sixth_status=SixthStatus.from_str("/images/grape_6.png"),
+                    seventh_status=SeventhStatus.from_str("/images/grape_7.png"),
+                )
+            )
+            for name in ["포도", "사과"]
+        ]
+        for status in ["FIRST_STATUS", "COMPLETED", "COMPLETED"]:
+            await RepoFruit.create(
+                session=session,
+                fruit=Fruit.new(
+                    user_id=repo_user.id,
+                    template_id=repo_templates[0].id,
+                    status=Status.from_str(status)
+                )
+            )
+        await RepoMissionTemplate.create(
+            session=session,
+            mission_template=MissionTemplate.new(
+                name=MissionTemplateName.from_str("기도"),
+                content=Content.from_str("오늘의 기도"),
+                type=MissionTemplateType.from_str("NORMAL"),
+            )
+        )
+        await RepoCounter.set_value(
+            session=session,
+            counter=Counter.new(name=CounterName.from_str("PARTICIPATED_USERS"), value=Value.from_int(1))
+        )
+
+
+async def get_dashboard():
+    async with transactional_session_helper() as session:
+        return await RepoDashboard.get(session=session)
+
+
+# Cleanup
+async def cleanup_database():
+    async with transactional_session_helper() as session:
+        from grapechallenge.domain.counter.repo_counter import CounterModel
+        from grapechallenge.domain.fruit.repo_fruit import FruitModel
+        from grapechallenge.domain.user.repo_user import UserModel
+        from grapechallenge.domain.fruit_template.repo_fruit_template import FruitTemplateModel
+        from grapechallenge.domain.mission_template.repo_mission_template import MissionTemplateModel
+
+        await session.execute(FruitModel.__table__.delete())
+        await session.execute(UserModel.__table__.delete())
+        await session.execute(FruitTemplateModel.__table__.delete())
+        await session.execute(MissionTemplateModel.__table__.delete())
+        await session.execute(CounterModel.__table__.delete())
+
+
+# Test runner
+async def test_crud():
+    db_config = get_database_config()
+    print(f"Database: {db_config.database_url()}")
+    print("=" * 60)
+
+    async with DatabaseClient(db_config.database_url()):
+        print("✓ Database connected\n")
+        await cleanup_database()
+
+        # EMPTY
+        print("[EMPTY]")
+        found = await get_dashboard()
+        assert found["user_count"] is None
+        assert found["fruit_count"] == {"total": 0, "in_progress": 0, "completed": 0}
+        assert found["stats"] == [] and found["mission_templates"] == []
+        print(f"✓ Empty: {found}\n")
+
+        # SETUP
+        print("[SETUP]")
+        await create_test_data()
+        print("✓ Test data created\n")
+
+        # READ
+        print("[READ]")
+        found = await get_dashboard()
+        assert found["user_count"] == 1
+        assert found["fruit_count"] == {"total": 3, "in_progress": 1, "completed": 2}
+        assert [stat["name"] for stat in found["stats"]] == ["사과", "포도"]
+        assert found["stats"][1]["completed"] == 2 and found["stats"][0]["total"] == 0
+        assert found["mission_templates"][0]["name"] == "기도"
+        assert found["mission_templates"][0]["created_at"] is not None
+        print(f"✓ Found: user_count={found['user_count']}, fruit_count={found['fruit_count']}, stats={len(found['stats'])}, mission_templates={len(found['mission_templates'])}\n")
+
+        # CLEANUP
+        print("[CLEANUP]")
+        await cleanup_database()
+        print("✓ Database cleaned up\n")
+
+    print("=" * 60)
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    subprocess.run(["./scripts/setup_dev_db.sh"])
+    asyncio.run(test_crud())
@@ -73,6 +73,11 @@ async def get_fruit_by_user_id(user_id: str):
         return await RepoFruit.get_by_user_id(session=session, user_id=user_id)
 
 
+async def get_fruits_with_template(user_id: str, **filters):
+    async with transactional_session_helper() as session:
+        return await RepoFruit.get_by_user_id_with_template(session=session, user_id=user_id, **filters)
+
+
 async def update_fruit(fruit_id: str, user_id: str, template_id: str, status: str) -> None:
     async with transactional_session_helper() as session:
         fruit = Fruit.new(
@@ -146,6 +151,18 @@ async def test_crud():
         repo_fruit = await get_fruit(fruit_id)
         print(f"✓ Updated: id={repo_fruit.id}, status={repo_fruit.fruit.status.to_str()}\n")
 
+        # FILTER
+        print("[FILTER]")
+        await create_fruit(user_id, template_id, "COMPLETED")
+        await create_fruit(user_id, template_id, "COMPLETED")
+        founds = await get_fruits_with_template(user_id)
+        completed = await get_fruits_with_template(user_id, status="COMPLETED")
+        assert len(founds) == 3 and len(completed) == 2
+        assert all(found["status"] == "COMPLETED" for found in completed)
+        limited = await get_fruits_with_template(user_id, status="COMPLETED", descending=True, limit=1)
+        assert len(limited) == 1 and limited[0]["fruit_id"] == completed[-1]["fruit_id"]
+        print(f"✓ Filtered: all={len(founds)}, completed={len(completed)}, newest={limited[0]['fruit_id']}\n")
+
         # TRANSACTION ROLLBACK
         print("[TRANSACTION ROLLBACK]")
         try:
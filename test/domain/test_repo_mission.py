@@ -118,6 +118,16 @@ async def update_mission(mission_id: str, user_id: str, template_id: str, fruit_
         await RepoMission.update(session=session, mission=mission, id=mission_id)
 
 
+async def get_missions_by_template_name(name: str, **filters):
+    async with transactional_session_helper() as session:
+        return await RepoMission.get_by_template_name(session=session, name=name, **filters) or []
+
+
+async def get_version_by_template_name(name: str, **filters):
+    async with transactional_session_helper() as session:
+        return await RepoMission.get_version_by_template_name(session=session, name=name, **filters)
+
+
 async def create_mission_with_rollback(user_id: str, template_id: str, fruit_id: str):
     """Test function that creates a mission then raises an exception to trigger rollback"""
     async with transactional_session_helper() as session:
@@ -194,6 +204,22 @@ async def test_crud():
         repo_mission = await get_mission(mission_id)
         print(f"Updated: id={repo_mission.id}, user_id={repo_mission.mission.user_id}\n")
 
+        # SINCE
+        print("[SINCE]")
+        from datetime import datetime, timedelta
+        changed = await get_missions_by_template_name("daily prayer", since=datetime.now() - timedelta(minutes=1))
+        unchanged = await get_missions_by_template_name("daily prayer", since=datetime.now() + timedelta(minutes=1))
+        assert [found["mission_id"] for found in changed] == [mission_id]
+        assert unchanged == []
+        print(f"Since: changed={len(changed)}, unchanged={len(unchanged)}\n")
+
+        # VERSION
+        print("[VERSION]")
+        count, latest = await get_version_by_template_name("daily prayer")
+        assert count == 1 and latest is not None
+        assert await get_version_by_template_name("daily prayer") == (count, latest)
+        print(f"Version: count={count}, latest={latest}\n")
+
         # TRANSACTION ROLLBACK
         print("[TRANSACTION ROLLBACK]")
         try:
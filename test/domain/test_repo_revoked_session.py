@@ -0,0 +1,67 @@
+import asyncio
+import os
+import subprocess
+from datetime import datetime, timedelta
+
+os.environ["APP_ENV"] = "dev"
+
+from grapechallenge.database.database import DatabaseClient, transactional_session_helper
+from grapechallenge.config import get_database_config
+from grapechallenge.domain.revoked_session import RepoRevokedSession, RevokedSessionModel
+
+
+# Operations
+async def revoke(sid: str, expires_at: datetime):
+    async with transactional_session_helper() as session:
+        await RepoRevokedSession.revoke(session=session, sid=sid, user_id="user", expires_at=expires_at)
+
+
+async def is_revoked(sid: str) -> bool:
+    async with transactional_session_helper() as session:
+        return await RepoRevokedSession.is_revoked(session=session, sid=sid)
+
+
+# Cleanup
+async def cleanup_database():
+    async with transactional_session_helper() as session:
+        await session.execute(RevokedSessionModel.__table__.delete())
+
+
+# Test runner
+async def test_crud():
+    db_config = get_database_config()
+    print(f"Database: {db_config.database_url()}")
+    print("=" * 60)
+
+    async with DatabaseClient(db_config.database_url()):
+        print("✓ Database connected\n")
+        await cleanup_database()
+
+        # REVOKE
+        print("[REVOKE]")
+        await revoke("sid-1", datetime.now() + timedelta(days=1))
+        await revoke("sid-1", datetime.now() + timedelta(days=1))
+        assert await is_revoked("sid-1")
+        assert not await is_revoked("sid-2")
+        print("✓ Revoked: sid-1 (twice, no conflict)\n")
+
+        # PRUNE
+        print("[PRUNE]")
+        await revoke("sid-old", datetime.now() - timedelta(seconds=1))
+        await revoke("sid-2", datetime.now() + timedelta(days=1))
+        assert not await is_revoked("sid-old")
+        assert await is_revoked("sid-1") and await is_revoked("sid-2")
+        print("✓ Expired records are pruned on the next revoke\n")
+
+        # CLEANUP
+        print("[CLEANUP]")
+        await cleanup_database()
+        print("✓ Database cleaned up\n")
+
+    print("=" * 60)
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    subprocess.run(["./scripts/setup_dev_db.sh"])
+    asyncio.run(test_crud())
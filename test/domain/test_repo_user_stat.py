@@ -0,0 +1,120 @@
+import asyncio
+import os
+import subprocess
+
+os.environ["APP_ENV"] = "dev"
+
+from grapechallenge.database.database import DatabaseClient, transactional_session_helper
+from grapechallenge.config import get_database_config
+from grapechallenge.domain.user import Cell, Name, User, RepoUser
+from grapechallenge.domain.user_stat import RepoUserStat
+
+
+# Setup test data
+async def create_test_user(cell: str, name: str) -> str:
+    async with transactional_session_helper() as session:
+        user = User.new(
+            cell=Cell.from_str(cell),
+            name=Name.from_str(name)
+        )
+        repo_user = await RepoUser.create(session=session, user=user)
+        return repo_user.id
+
+
+# Operations
+async def increase_mission_count(user_id: str):
+    async with transactional_session_helper() as session:
+        return await RepoUserStat.increase_mission_count(session=session, user_id=user_id)
+
+
+async def increase_fruit_count(user_id: str):
+    async with transactional_session_helper() as session:
+        return await RepoUserStat.increase_fruit_count(session=session, user_id=user_id)
+
+
+async def get_user_stat(user_id: str):
+    async with transactional_session_helper() as session:
+        return await RepoUserStat.get_by_user_id(session=session, user_id=user_id)
+
+
+async def get_leaderboard(order: str, cell=None):
+    async with transactional_session_helper() as session:
+        return await RepoUserStat.get_leaderboard(session=session, order=order, cell=cell)
+
+
+async def rebuild_all() -> int:
+    async with transactional_session_helper() as session:
+        return await RepoUserStat.rebuild_all(session=session)
+
+
+# Cleanup
+async def cleanup_database():
+    async with transactional_session_helper() as session:
+        from grapechallenge.domain.user.repo_user import UserModel
+        from grapechallenge.domain.user_stat.repo_user_stat import UserStatModel
+
+        await session.execute(UserStatModel.__table__.delete())
+        await session.execute(UserModel.__table__.delete())
+
+
+# Test runner
+async def test_crud():
+    db_config = get_database_config()
+    print(f"Database: {db_config.database_url()}")
+    print("=" * 60)
+
+    async with DatabaseClient(db_config.database_url()):
+        print("✓ Database connected\n")
+
+        # SETUP
+        print("[SETUP]")
+        first_id = await create_test_user("다윗", "홍길동")
+        second_id = await create_test_user("요셉", "김철수")
+        print(f"✓ Test users created: {first_id}, {second_id}\n")
+
+        # INCREASE MISSION COUNT
+        print("[INCREASE MISSION COUNT]")
+        await increase_mission_count(first_id)
+        repo_user_stat = await increase_mission_count(first_id)
+        assert repo_user_stat.user_stat.mission_count.to_int() == 2
+        assert repo_user_stat.user_stat.current_streak.to_int() == 1
+        assert repo_user_stat.user_stat.cell == "다윗"
+        print(f"✓ Increased: mission_count={repo_user_stat.user_stat.mission_count.to_int()}, streak={repo_user_stat.user_stat.current_streak.to_int()}\n")
+
+        # INCREASE FRUIT COUNT
+        print("[INCREASE FRUIT COUNT]")
+        repo_user_stat = await increase_fruit_count(second_id)
+        assert repo_user_stat.user_stat.fruit_count.to_int() == 1
+        assert repo_user_stat.user_stat.mission_count.to_int() == 0
+        print(f"✓ Increased: fruit_count={repo_user_stat.user_stat.fruit_count.to_int()}\n")
+
+        # READ
+        print("[READ]")
+        repo_user_stat = await get_user_stat(first_id)
+        print(f"✓ Found: user_id={repo_user_stat.user_stat.user_id}, mission_count={repo_user_stat.user_stat.mission_count.to_int()}\n")
+
+        # LEADERBOARD
+        print("[LEADERBOARD]")
+        leaderboard = await get_leaderboard("mission")
+        assert leaderboard[0]["user_id"] == first_id
+        leaderboard = await get_leaderboard("fruit", cell="요셉")
+        assert len(leaderboard) == 1 and leaderboard[0]["user_id"] == second_id
+        print(f"✓ Leaderboard: {[(item['rank'], item['user_name']) for item in leaderboard]}\n")
+
+        # REBUILD
+        print("[REBUILD]")
+        count = await rebuild_all()
+        print(f"✓ Rebuilt: {count} row(s) from missions and fruits\n")
+
+        # CLEANUP
+        print("[CLEANUP]")
+        await cleanup_database()
+        print("✓ Database cleaned up\n")
+
+    print("=" * 60)
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    subprocess.run(["./scripts/setup_dev_db.sh"])
+    asyncio.run(test_crud())